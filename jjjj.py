@@ -1,50 +1,38 @@
+import argparse
+import os
+
 import pandas as pd
 import numpy as np
 import shap
 import matplotlib.pyplot as plt
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import OrdinalEncoder
-from sklearn.multioutput import MultiOutputClassifier
-from lightgbm import LGBMClassifier
 from sklearn.metrics import accuracy_score, classification_report
+from src.brfss.handoff import load_training
+from src.brfss.model import MODEL_PATH, save_model
+from src.brfss.recode import recode_record
+from src.brfss.store import BRFSS_STORE, store_profile
+from src.common.crossval import cross_validate
+from src.common.multitarget import MultiTargetLGBM, validation_rows
+from src.common.staged import best_tree_counts, staged_curve
+from src.common.sample import SAMPLE_PERCENTS
+from src.common.profile import numeric_ranges
 
-def main():
-    df = pd.read_csv('data/BRFSS_2015ver18.csv', low_memory=False)
-    target_cols = ['BPHIGH4', 'CVDCRHD4', 'CVDSTRK3', 'CHCKIDNY', 'DIABETE3']
-    df = df.dropna(subset=target_cols)
-    for col in target_cols:
-        df = df[df[col].isin([0, 1])]
-
-    # 말도 안되는 결과를 출력하는 6가지 컬럼 제외
-    feature_cols = [c for c in df.columns if c not in target_cols + ['BPMEDS', 'INSULIN', 'DOCTDIAB', 'CHKHEMO3', 'FEETCHK', 'DIABEYE']]
-    X = df[feature_cols].copy()
-    y = df[target_cols].astype(int)
-
-    obj_cols = X.select_dtypes(include=['object']).columns.tolist()
-    encoder = None
-    if obj_cols:
-        encoder = OrdinalEncoder(handle_unknown='use_encoded_value', unknown_value=-1)
-        X[obj_cols] = encoder.fit_transform(X[obj_cols].astype(str))
-
-    X_train, X_test, y_train, y_test = train_test_split(
-        X, y, test_size=0.4, random_state=42, stratify=y['BPHIGH4']
-    )
-
-    category_feature = ['GENHLTH', 'PERSDOC2', 'CHECKUP1', 'CHOLCHK', 'MARITAL', 'EDUCA',
-        'RENTHOM1', 'EMPLOY1', 'INCOME2', 'USENOW3', 'ARTHSOCL', 'WHRTST10',
-        'SXORIENT', '_ASTHMS1', '_MRACE1', '_RACE', '_INCOMG', 'ACTIN11_',
-        'ACTIN21_', '_PA300R2', '_PAREC1', '_BMI5CAT', '_PA150R2',
-        'SEX', 'SMOKDAY2', '_SMOKER3', '_PACAT1', '_AGEG5YR', 'LASTSMK2', 'MSCODE']
-    
-    # 말도 안되는 결과를 출력하는 6가지 컬럼 제외
-    category_feature = [c for c in category_feature if c not in ['BPMEDS', 'INSULIN', 'DOCTDIAB', 'CHKHEMO3', 'FEETCHK', 'DIABEYE']]
-
-    
-    X_train[category_feature] = X_train[category_feature].astype('category')
-    X_test[category_feature] = X_test[category_feature].astype('category')
+def main(sample=None, from_raw=None, no_cache=False, study=None, latency_budget=None, cv=None, curve=None,
+         years=None):
+    # 타깃 5개, 제외 컬럼, 범주형 컬럼, 분할 설정은 src/brfss/handoff.py (하이퍼파라미터 검색과 같이 씀)
+    # --sample 1 / 10: 타깃 5개로 층화한 1% / 10% 표본 저장소 (처음 한 번만 만들고 캐시)
+    # --years 2015 2016: 연도 파티션 저장소(preprocess/ingest_year.py)에서 그 해들만 한 해씩 읽어서 학습
+    # 피처를 float32 행렬 하나에 바로 채워서 LightGBM 에 넘긴다 (src/brfss/handoff.py)
+    # X_train / X_test 는 그 행렬의 앞/뒤 부분이라 복사가 없고, 범주형 컬럼은
+    # astype('category') 와 같은 코드로 들어간다
+    # 분할 위치는 데이터 지문 + 시드로, 행렬은 .npy 로 캐시해서 다시 실행하면 메모리 맵으로 바로 연다
+    # binning 한 Dataset 도 LightGBM 바이너리로 캐시 (data/.cache/lgbm)
+    X_train, X_test, y_train, y_test, encoder, dataset_key = load_training(sample, from_raw, no_cache, years)
+    target_cols = list(y_train.columns)
+    feature_cols = encoder.feature_names
+    obj_cols = list(encoder.ordinals)
 
     # 최적 파라미터 또는 실험용 하이퍼파라미터를 넣은 예
-    model = MultiOutputClassifier(LGBMClassifier(
+    params = dict(
     # 다중 이진 분류
     objective='binary',
     # 재현성
@@ -69,10 +57,53 @@ def main():
     reg_lambda=1.0,
     # 출력 제어용 / 선택적 요소
     verbose=-1
-    ), n_jobs=-1)
+    )
+    if study:
+        # --study: 하이퍼파라미터 검색(search_lgbm.py)에서 가장 좋았던 시행의 파라미터
+        from src.brfss.search import best_params
+        params = best_params(study, latency_budget=latency_budget)
+        print(f"스터디 '{study}' 파라미터: {params}")
+
+    if cv:
+        # --cv 5: 학습/평가 행 전부를 타깃 값 조합으로 층화한 k-fold 로 평가하고 끝낸다 (src/common/crossval.py)
+        # binning 은 한 번만 하고 폴드는 그 subset, 폴드는 스레드로 동시에 (트리 수는 n_estimators 그대로)
+        summary, _ = cross_validate(params, [X_train, X_test], pd.concat([y_train, y_test]), folds=cv,
+                                    categorical_feature=encoder.categorical_feature,
+                                    dataset_key=None if dataset_key is None else f"{dataset_key}-all")
+        print(f"=== {cv}-fold 교차 검증 (평균 / 표준편차) ===")
+        print(summary.round(4).to_string())
+        return
+
+    # 타깃 5개가 binning 한 Dataset 하나를 같이 쓴다 (src/common/multitarget.py)
+    model = MultiTargetLGBM(**params)
+
+    if curve:
+        # --curve 10: n_estimators 까지 한 번만 학습(조기 종료 없이)하고, 평가 행으로 10 트리마다
+        # 트리 수 - 지표 곡선을 만든 다음 끝낸다 (누적 raw 점수, src/common/staged.py)
+        model.fit(X_train, y_train, categorical_feature=encoder.categorical_feature, dataset_key=dataset_key)
+        staged = staged_curve(model, X_test, y_test, step=curve)
+        staged.to_csv("staged_curve.csv", index=False, encoding='utf-8-sig')
+        print("=== 트리 수별 테스트 AUC 가 가장 좋은 지점 ===")
+        print(best_tree_counts(staged).round(4).to_string())
+        print("곡선 저장 완료 → staged_curve.csv")
+        return
 
+    # 학습 행의 10% 를 타깃 5개 값 조합으로 층화해서 떼어 검증용으로 쓰고, 타깃마다 조기 종료 →
+    # n_estimators 는 상한이고 부스터는 가장 좋았던 반복 수까지 잘린다
     model.fit(X_train, y_train,
-                categorical_feature = category_feature)
+                categorical_feature = encoder.categorical_feature,
+                dataset_key = dataset_key,
+                validation = validation_rows(y_train, random_state=42))
+    for col, clf in zip(target_cols, model.estimators_):
+        print(f"[{col}] 트리 수: {clf.best_iteration_}")
+
+    # 새 데이터가 들어오면 update_lgbm.py 로 이 모델을 이어서 학습/리프 재조정 (인코더도 같이 저장)
+    # 표본으로 학습한 모델은 저장된 모델을 덮어쓰지 않음
+    if sample:
+        print("표본 학습이라 모델은 저장하지 않음")
+    else:
+        save_model(model, encoder)
+        print(f"모델 저장 완료 → {MODEL_PATH}")
 
 
     print("=== 최종 테스트 성능 ===")
@@ -91,6 +122,9 @@ def main():
     print("\n\n--- 사용자 입력 예측 ---")
     print(f"총 피처 수: {len(feature_cols)}")
     print("값 입력 없이 엔터를 누르게 되면 Null(빈칸)으로 처리가 됩니다.\n\n")
+    # y 를 고르면 설문 원본 코드(7/9=모름, 88=없음, 101~199=주당 등)를 받아서
+    # 학습 데이터와 같은 규칙(src/brfss/spec.py)으로 재코딩한다. WTKG3 등은 kg 같은 실제 단위로 입력
+    raw_codes = input("설문 원본 코드로 입력하시겠습니까? (y/N) → ").strip().lower() == 'y'
 
     feature_desc = {
         'GENHLTH':   "전반적인 건강 상태에 대한 자가 평가 (예: 1: 'Excellent', 2: 'VeryGood', 3: 'Good', 4: 'Fair', 5: 'Poor', -1='잘 모르겠음 / 응답거부')",
@@ -232,20 +266,11 @@ def main():
         '_AGEG5YR':  "나이 5세 단위 그룹 (예: 1=18–24, 2=25–29, 3=30–34, 4=35–39, 5=40–44, 6=45–49, 7=50–54, 8=55–59, 9=60–64, 10=65–69, 11=70–74, 12=75–79, 13=80+)"
     }
 
-    numeric_info = {}
-    for col in feature_cols:
-        if col not in obj_cols:
-            col_num = pd.to_numeric(df[col], errors='coerce').dropna()
-            if not col_num.empty:
-                numeric_info[col] = (
-                    int(col_num.min()),
-                    int(col_num.max()),
-                    int(col_num.mean())
-                )
+    # 컬럼별 (최솟값, 최댓값, 평균) 은 다시 훑지 않고 저장소 프로파일 사이드카에서 읽는다
+    numeric_info = numeric_ranges(store_profile(), [c for c in feature_cols if c not in obj_cols]) \
+        if os.path.exists(BRFSS_STORE) else {}
 
-    categorical_info = {
-        col: list(encoder.categories_[i]) for i, col in enumerate(obj_cols)
-    } if encoder else {}
+    categorical_info = {col: list(levels) for col, levels in encoder.ordinals.items()}
 
     new_data = {}
     for col in feature_cols:
@@ -269,14 +294,16 @@ def main():
             except:
                 new_data[col] = np.nan
 
+    if raw_codes:
+        new_data = recode_record(new_data, human_units=True)
+
     new_df = pd.DataFrame([new_data])
-    if encoder and obj_cols:
-        new_df[obj_cols] = encoder.transform(new_df[obj_cols].astype(str))
-        # 범주형 컬럼 지정 (학습 시 사용한 컬럼과 동일해야 함)
-    new_df[category_feature] = new_df[category_feature].astype('category')
+    # 학습 행렬과 같은 코드(문자열/범주형 컬럼 포함)의 float32 행렬로
+    new_X = encoder.transform(new_df.reindex(columns=feature_cols))
+    new_df = pd.DataFrame(new_X, columns=feature_cols)
 
 
-    probas_list = model.predict_proba(new_df)
+    probas_list = model.predict_proba(new_X)
     print("\n=== 예측 결과 ===")
     for idx, col in enumerate(target_cols):
         try:
@@ -311,4 +338,23 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sample", type=float, choices=SAMPLE_PERCENTS, default=None,
+                        help="개발용 층화 표본 비율 (%%)")
+    parser.add_argument("--from-raw", default=None,
+                        help="원본 CSV 에서 바로 전처리해서 학습 (예: data/BRFSS_2015.csv)")
+    parser.add_argument("--years", type=int, nargs='+', default=None,
+                        help="연도 파티션 저장소에서 이 연도들만 골라 학습 (예: 2015 2016)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="학습 행렬/Dataset 캐시(data/.cache/matrix, lgbm)를 쓰지 않고 새로 만들기")
+    parser.add_argument("--study", default=None,
+                        help="하이퍼파라미터 검색 스터디 이름 (가장 좋았던 파라미터로 학습, search_lgbm.py)")
+    parser.add_argument("--latency-budget", type=float, default=None,
+                        help="다목적 스터디에서 한 행 예측 시간 예산 (ms) 안의 가장 좋은 시행을 고름")
+    parser.add_argument("--cv", type=int, default=None,
+                        help="k-fold 교차 검증으로 타깃별 성능만 보고 끝내기 (예: 5)")
+    parser.add_argument("--curve", type=int, default=None,
+                        help="n_estimators 까지 한 번 학습하고 이 트리 수마다 테스트 지표 곡선만 보고 끝내기 (예: 10)")
+    args = parser.parse_args()
+    main(args.sample, args.from_raw, args.no_cache, args.study, args.latency_budget, args.cv, args.curve,
+         args.years)
\ No newline at end of file
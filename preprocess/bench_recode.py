@@ -0,0 +1,112 @@
+import argparse
+import importlib.util
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.brfss import recode
+from src.brfss.parallel import ParallelRecoder
+from src.common.config import BRFSS_COLUMNS
+
+#------------------------------------------------
+# preprocessVer3.01.py 의 apply 버전과 src/brfss/recode.py 벡터 버전 비교
+# 1) 규칙 함수별 결과가 dtype 까지 같은지 확인
+# 2) 규칙 함수별 / 전체 실행 시간 비교
+# 3) 컬럼 병렬(멀티프로세스) 버전 시간 비교
+# 4) 단건 커널(recode_record)이 배치 결과와 같은지, 한 건당 몇 µs 인지 확인
+#
+# 실행 (프로젝트 루트에서)
+#   python -m preprocess.bench_recode --rows 200000
+#   python -m preprocess.bench_recode --csv data/BRFSS_2015ver11.csv
+#------------------------------------------------
+
+LEGACY_PATH = os.path.join(os.path.dirname(__file__), "preprocessVer3.01.py")
+
+
+def load_legacy():
+    spec = importlib.util.spec_from_file_location("preprocess_ver3_01", LEGACY_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# 규칙에 걸리는 값(특수 코드, 구간 경계)과 빈칸을 섞은 임의 데이터
+def random_frame(columns, rows, seed=42):
+    rng = np.random.default_rng(seed)
+    pool = np.array([
+        np.nan, 0, 1, 2, 3, 4, 5, 7, 8, 9, 10, 30, 31, 76, 77, 88, 98, 99,
+        100, 101, 115, 199, 201, 230, 299, 300, 301, 330, 399, 401, 406, 418, 499,
+        555, 777, 888, 900, 999, 2300, 8590, 11985, 29500, 99000, 99900, 99999,
+        777777, 999999, 1.5, 250.25, -3,
+    ])
+    return pd.DataFrame({col: rng.choice(pool, size=rows) for col in columns})
+
+
+def same_frame(a, b):
+    return a.columns.equals(b.columns) and a.dtypes.equals(b.dtypes) and a.equals(b)
+
+
+def same_value(a, b):
+    return (pd.isna(a) and pd.isna(b)) or a == b
+
+
+def check_records(base, batch, n=2000):
+    # 단건 커널 결과를 배치 결과의 같은 행과 비교
+    records = base.head(n).to_dict("records")
+    expected = batch.head(n).to_dict("records")
+    start = time.perf_counter()
+    results = [recode.recode_record(record) for record in records]
+    per_record = (time.perf_counter() - start) / max(len(records), 1)
+    mismatch = sum(
+        not same_value(result[col], row[col])
+        for result, row in zip(results, expected) for col in row
+    )
+    return per_record, mismatch
+
+
+def timed(func, df):
+    start = time.perf_counter()
+    out = func(df)
+    return out, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--csv", default=None, help="임의 데이터 대신 사용할 ver11 CSV")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="병렬 버전 작업자 수")
+    args = parser.parse_args()
+
+    legacy = load_legacy()
+    if args.csv:
+        base = pd.read_csv(args.csv, low_memory=False)
+    else:
+        base = random_frame(BRFSS_COLUMNS, args.rows)
+    print(f"데이터: {base.shape[0]}행 x {base.shape[1]}열\n")
+
+    print(f"{'규칙':<22}{'apply(s)':>10}{'vector(s)':>11}{'배속':>9}  결과")
+    for rule in recode.RULES:
+        old, t_old = timed(getattr(legacy, rule.__name__), base.copy())
+        new, t_new = timed(rule, base.copy())
+        status = "같음" if same_frame(old, new) else "다름"
+        print(f"{rule.__name__:<22}{t_old:>10.3f}{t_new:>11.3f}{t_old / t_new:>8.1f}x  {status}")
+
+    old, t_old = timed(legacy.preprocess_data, base.copy())
+    new, t_new = timed(recode.preprocess_data, base.copy())
+    same_csv = old.to_csv(index=False) == new.to_csv(index=False)
+    print(f"\n{'preprocess_data':<22}{t_old:>10.3f}{t_new:>11.3f}{t_old / t_new:>8.1f}x  "
+          f"{'같음' if same_frame(old, new) else '다름'} (CSV 바이트 {'같음' if same_csv else '다름'})")
+
+    with ParallelRecoder(args.workers, min_rows=0) as recoder:
+        par, t_par = timed(recoder.preprocess_data, base.copy())
+    print(f"{'parallel(' + str(args.workers) + ')':<22}{t_old:>10.3f}{t_par:>11.3f}{t_old / t_par:>8.1f}x  "
+          f"{'같음' if same_frame(old, par) else '다름'}")
+
+    per_record, mismatch = check_records(base, new)
+    print(f"\n단건 커널 recode_record: 한 건당 {per_record * 1e6:.1f}µs, 배치와 다른 셀 {mismatch}개")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+import argparse
+import json
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from preprocess.bench_recode import load_legacy, same_frame, timed
+from src.brfss import recode
+from src.brfss.spec import FAMILIES
+from src.brfss.synthetic import iter_synthetic_brfss, synthetic_brfss
+from src.diabetes.preprocess import preprocess_diabetes_dataset
+from src.diabetes.synthetic import synthetic_diabetes
+
+#------------------------------------------------
+# 전처리 벤치마크 모음 (합성 데이터, src/brfss/synthetic.py / src/diabetes/synthetic.py)
+# 1) 같은 합성 데이터로 preprocessVer3.01.py(apply) 와 규칙 함수별 / 전체 결과가 같은지 확인
+# 2) 100k / 1M / 10M 행에서 규칙 묶음별, preprocess_data 전체, 당뇨병 전처리 처리량(행/초)
+# 큰 크기는 청크로 나눠 만들고 처리한다 (생성 시간은 빼고 잰다).
+# --out 으로 결과를 JSON 으로 남겨두면 --compare 로 이전 결과와 배속을 비교한다.
+#
+# 실행 (프로젝트 루트에서)
+#   python -m preprocess.bench_suite
+#   python -m preprocess.bench_suite --sizes 100000 1000000 --out bench_before.json
+#   python -m preprocess.bench_suite --sizes 100000 1000000 --compare bench_before.json
+#------------------------------------------------
+
+DEFAULT_SIZES = [100_000, 1_000_000, 10_000_000]
+
+
+def check_legacy(rows, seed):
+    # apply 버전은 느려서 작은 데이터로만 비교한다
+    legacy = load_legacy()
+    base = synthetic_brfss(rows, seed)
+    failed = []
+    for rule in recode.RULES:
+        if not same_frame(getattr(legacy, rule.__name__)(base.copy()), rule(base.copy())):
+            failed.append(rule.__name__)
+    old, t_old = timed(legacy.preprocess_data, base.copy())
+    new, t_new = timed(recode.preprocess_data, base.copy())
+    if not (same_frame(old, new) and old.to_csv(index=False) == new.to_csv(index=False)):
+        failed.append('preprocess_data')
+    return failed, rows / t_old, rows / t_new
+
+
+def bench_brfss(rows, chunksize, seed):
+    # {이름: 걸린 시간(s)}
+    seconds = {name: 0.0 for name in FAMILIES}
+    seconds['preprocess_data'] = 0.0
+    for chunk in iter_synthetic_brfss(rows, chunksize, seed):
+        for rule in recode.RULES:
+            part = chunk[list(FAMILIES[rule.__name__])].copy()
+            seconds[rule.__name__] += timed(rule, part)[1]
+        seconds['preprocess_data'] += timed(recode.preprocess_data, chunk)[1]
+        del chunk
+    return seconds
+
+
+def bench_diabetes(rows, seed):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "diabetes.csv")
+        synthetic_diabetes(rows, seed).to_csv(path, index=False)
+        start = time.perf_counter()
+        preprocess_diabetes_dataset(path)
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="행 수 목록")
+    parser.add_argument("--chunksize", type=int, default=500_000, help="합성 데이터 청크 크기 (메모리)")
+    parser.add_argument("--legacy-rows", type=int, default=20_000, help="apply 버전과 비교할 행 수")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--skip-diabetes", action="store_true")
+    parser.add_argument("--out", default=None, help="결과 JSON 저장 경로")
+    parser.add_argument("--compare", default=None, help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    failed, legacy_rps, vector_rps = check_legacy(args.legacy_rows, args.seed)
+    print(f"apply 버전과 비교 ({args.legacy_rows}행): "
+          f"{'모두 같음' if not failed else '다름 → ' + ', '.join(failed)}")
+    print(f"preprocess_data 처리량: apply {legacy_rps:,.0f}행/s / vector {vector_rps:,.0f}행/s"
+          f" ({vector_rps / legacy_rps:.1f}x)\n")
+
+    results = {}
+    for rows in args.sizes:
+        seconds = bench_brfss(rows, args.chunksize, args.seed)
+        if not args.skip_diabetes:
+            seconds['diabetes'] = bench_diabetes(rows, args.seed)
+        results[str(rows)] = {name: rows / t for name, t in seconds.items()}
+        print(f"{rows:,}행 완료 (preprocess_data {seconds['preprocess_data']:.2f}s)")
+
+    # 처리량 표 (백만 행/초)
+    table = pd.DataFrame(results) / 1e6
+    table.columns = [f"{int(rows):,}" for rows in table.columns]
+    print("\n처리량 (백만 행/초)")
+    print(table.round(2).to_string())
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            before = pd.DataFrame(json.load(f))
+        common = [rows for rows in results if rows in before.columns]
+        if common:
+            ratio = pd.DataFrame(results)[common] / before[common]
+            ratio.columns = [f"{int(rows):,}" for rows in common]
+            print(f"\n{args.compare} 대비 배속")
+            print(ratio.round(2).to_string())
+        else:
+            print(f"\n{args.compare} 에 같은 행 수 결과가 없습니다.")
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=1)
+
+
+if __name__ == "__main__":
+    main()
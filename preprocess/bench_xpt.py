@@ -0,0 +1,68 @@
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.brfss.recode import preprocess_data
+from src.brfss.synthetic import synthetic_brfss
+from src.brfss.xpt import read_xpt, write_xpt
+from src.common.config import BRFSS_COLUMNS
+
+#------------------------------------------------
+# 원본 읽기 비교: CSV (usecols) / pd.read_sas 후 컬럼 선택 / src/brfss/xpt.py 직접 읽기
+# 같은 데이터를 CSV 와 XPT 로 써두고 읽는 시간, 결과가 같은지,
+# preprocess_data 결과까지 같은지 확인한다.
+#
+# 실행 (프로젝트 루트에서)
+#   python -m preprocess.bench_xpt --rows 200000
+#   python -m preprocess.bench_xpt --xpt data/LLCP2015.XPT --csv data/BRFSS_2015.csv
+#------------------------------------------------
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    out = func(*args, **kwargs)
+    return out, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--xpt", default=None, help="실제 XPT 파일 (같은 해 --csv 와 비교)")
+    parser.add_argument("--csv", default=None, help="실제 XPT 를 변환한 CSV")
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp()
+    if args.xpt:
+        xpt_path, csv_path = args.xpt, args.csv
+    else:
+        # BRFSS_COLUMNS 147개 + 다른 변수 183개 = 원본과 같은 330개 컬럼
+        raw = synthetic_brfss(args.rows, extra=183)
+        xpt_path, csv_path = os.path.join(tmp, "raw.xpt"), os.path.join(tmp, "raw.csv")
+        write_xpt(raw, xpt_path, name="LLCP2015")
+        raw.to_csv(csv_path, index=False)
+        del raw
+    print(f"XPT {os.path.getsize(xpt_path) / 1e6:.1f}MB, CSV {os.path.getsize(csv_path) / 1e6:.1f}MB\n")
+
+    from_csv, t_csv = timed(pd.read_csv, csv_path, usecols=BRFSS_COLUMNS)
+    from_csv = from_csv[BRFSS_COLUMNS].astype(np.float64)
+    from_sas, t_sas = timed(lambda: pd.read_sas(xpt_path, format="xport")[BRFSS_COLUMNS])
+    from_xpt, t_xpt = timed(read_xpt, xpt_path, BRFSS_COLUMNS)
+
+    # pd.read_sas 는 IBM 0 을 5.4e-79 로 읽으므로 0 으로 맞춰서 비교
+    from_sas = from_sas.mask(from_sas.abs() < 1e-70, 0.0)
+    print(f"{'방법':<24}{'시간(s)':>10}  결과")
+    print(f"{'read_csv(usecols)':<24}{t_csv:>10.2f}  기준")
+    print(f"{'read_sas → 컬럼 선택':<24}{t_sas:>10.2f}  {'같음' if from_sas.equals(from_csv) else '다름'}")
+    print(f"{'read_xpt(columns)':<24}{t_xpt:>10.2f}  {'같음' if from_xpt.equals(from_csv) else '다름'}")
+
+    a = preprocess_data(from_csv).to_csv(index=False)
+    b = preprocess_data(from_xpt).to_csv(index=False)
+    print(f"\npreprocess_data 결과 CSV 바이트: {'같음' if a == b else '다름'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import argparse
+import time
+
+import pandas as pd
+
+from src.brfss.store import ROW_GROUP_SIZE, load_brfss, sample_store, store_profile, write_store
+from src.brfss.schema import BRFSS_SCHEMA
+from src.common.config import BRFSS_STORE
+from src.common.sample import SAMPLE_PERCENTS
+from src.common.schema import CompactMatrix, frame_nbytes
+
+#------------------------------------------------
+# 전처리 결과 CSV(ver18) → Parquet 저장소 변환
+# 학습 스크립트는 src.brfss.store.load_brfss 로 필요한 컬럼/행만 읽는다.
+#
+# 실행 (프로젝트 루트에서)
+#   python -m preprocess.build_store
+#   python -m preprocess.build_store --csv data/BRFSS_2015ver18.csv --out data/BRFSS_2015ver18.parquet
+#   python -m preprocess.build_store --sample 1 10      (개발용 층화 표본 저장소도 미리 만들기)
+#------------------------------------------------
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--csv", default="data/BRFSS_2015ver18.csv", help="전처리 결과 CSV")
+parser.add_argument("--out", default=BRFSS_STORE, help="저장소 경로")
+parser.add_argument("--row-group-size", type=int, default=ROW_GROUP_SIZE)
+parser.add_argument("--sample", type=float, nargs="*", choices=SAMPLE_PERCENTS, default=[],
+                    help="같이 만들 층화 표본 비율 (%%)")
+args = parser.parse_args()
+
+start = time.perf_counter()
+df = pd.read_csv(args.csv, low_memory=False)
+t_csv = time.perf_counter() - start
+
+write_store(df, args.out, row_group_size=args.row_group_size)
+print(f"저장 완료: {df.shape[0]}행 x {df.shape[1]}열 → {args.out}")
+
+start = time.perf_counter()
+load_brfss(path=args.out)
+t_store = time.perf_counter() - start
+print(f"전체 읽기 시간: CSV {t_csv:.2f}s / Parquet {t_store:.2f}s")
+
+# 메모리 크기 비교 (src/brfss/schema.py 의 컬럼별 dtype)
+numeric = df.select_dtypes(include='number')
+compact = load_brfss(columns=list(numeric.columns), path=args.out, compact=True)
+matrix = CompactMatrix.from_frame(numeric, BRFSS_SCHEMA)
+print(f"메모리: read_csv {frame_nbytes(numeric) / 1e6:.1f}MB"
+      f" / compact {frame_nbytes(compact) / 1e6:.1f}MB"
+      f" / CompactMatrix {matrix.nbytes / 1e6:.1f}MB")
+
+# 개발용 표본 (jjjj.py --sample 등이 읽는 캐시)
+for percent in args.sample:
+    path = sample_store(percent, args.out)
+    print(f"{percent:g}% 표본: {store_profile(path)['rows']}행 → {path}")
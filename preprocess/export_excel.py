@@ -0,0 +1,31 @@
+import argparse
+
+from src.common.excel import export_table, profile_rows, write_excel
+from src.common.profile import ensure_profile
+
+#------------------------------------------------
+# 사람이 볼 Excel 내보내기 (src/common/excel.py)
+# 중간 결과(Parquet)는 그대로 두고, 보고 싶은 것만 .xlsx 로 쓴다.
+#   --summary : 컬럼 요약표 (0526 컬럼 정리 시트처럼 컬럼마다 빈칸 수, 범위, 값별 빈도)
+#   --out     : 표 자체 (--columns 로 일부 컬럼만). 시트 한 장 최대 행 수를 넘으면 멈춘다
+# 둘 다 write-only 모드로 한 행씩 쓰므로 최대 메모리는 행 수와 상관없이 일정하다.
+#
+# 실행 (프로젝트 루트에서)
+#   python -m preprocess.export_excel BRFSS_2015ver8.parquet --summary "0527 컬럼 요약.xlsx"
+#   python -m preprocess.export_excel BRFSS_2015ver8.parquet --out ver8_일부.xlsx --columns SEX _AGEG5YR
+#------------------------------------------------
+
+parser = argparse.ArgumentParser()
+parser.add_argument("path", help="Parquet 파일")
+parser.add_argument("--summary", default=None, help="컬럼 요약표 저장 경로 (.xlsx)")
+parser.add_argument("--out", default=None, help="표 저장 경로 (.xlsx)")
+parser.add_argument("--columns", nargs="*", default=None, help="--out 으로 내보낼 컬럼")
+args = parser.parse_args()
+
+if args.summary:
+    header, rows = profile_rows(ensure_profile(args.path))
+    write_excel(rows, args.summary, header, sheet_name="컬럼 요약")
+    print(f"컬럼 요약 {len(rows)}행 → {args.summary}")
+if args.out:
+    count = export_table(args.path, args.out, args.columns)
+    print(f"{count}행 → {args.out}")
@@ -0,0 +1,28 @@
+import argparse
+import time
+
+from src.brfss.partitions import available_years, ingest_year
+from src.common.config import BRFSS_STORE_ROOT
+
+#------------------------------------------------
+# 원본 BRFSS CSV 한 해치를 연도 파티션 저장소에 추가 (src/brfss/partitions.py)
+# 다른 연도 파티션은 건드리지 않는다.
+#
+# 실행 (프로젝트 루트에서)
+#   python -m preprocess.ingest_year data/BRFSS_2015.csv 2015
+#   python -m preprocess.ingest_year data/BRFSS_2016.csv 2016
+#   python -m preprocess.ingest_year data/LLCP2017.XPT 2017      (CDC 원본 XPT 바로 읽기)
+#   python -m preprocess.ingest_year data/BRFSS_2016.csv 2016 --overwrite
+#------------------------------------------------
+
+parser = argparse.ArgumentParser()
+parser.add_argument("src", help="그 해 원본 CSV 또는 XPT 경로")
+parser.add_argument("year", type=int, help="조사 연도")
+parser.add_argument("--root", default=BRFSS_STORE_ROOT, help="저장소 폴더")
+parser.add_argument("--overwrite", action="store_true", help="이미 있는 연도면 교체")
+args = parser.parse_args()
+
+start = time.perf_counter()
+path = ingest_year(args.src, args.year, root=args.root, overwrite=args.overwrite)
+print(f"{args.year}년 추가 완료: {time.perf_counter() - start:.2f}s → {path}")
+print(f"저장소 연도: {available_years(args.root)}")
@@ -1,5 +1,13 @@
+import os
+import sys
+
+# ver6 파일이 있는 폴더에서 그대로 실행해도 src.common 을 import 할 수 있게
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 import pandas as pd
 
+from src.common.columnar import read_table, write_table
+
 #2를 0으로 바꾸는 함수(아니오:2 -> 아니오:0), (여자:2 -> 여자:0)
 def cols20(df):
     cols = ['BPHIGH4', 'CVDCRHD4', 'CVDSTRK3', 'CHCKIDNY', 'DIABETE3',
@@ -72,6 +80,8 @@ def preprocess_data(df):
     return df
 
 
-df = pd.read_excel("BRFSS_2015ver6.xlsx")
+#중간 결과는 Parquet로 주고받기 (ver6.parquet가 없으면 ver6.xlsx에서 한 번 만듦)
+#엑셀로 볼 때: python -m preprocess.export_excel BRFSS_2015ver7.parquet --summary 요약.xlsx
+df = read_table("BRFSS_2015ver6.xlsx")
 df = preprocess_data(df)
-df.to_excel("BRFSS_2015ver7.xlsx", index=False)
+write_table(df, "BRFSS_2015ver7.parquet")
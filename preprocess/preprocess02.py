@@ -1,6 +1,11 @@
-import pandas as pd
+import os
+import sys
+
+# ver7 파일이 있는 폴더에서 그대로 실행해도 src.common 을 import 할 수 있게
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.common.columnar import read_table, write_table
 #순서 정리
-df = pd.read_excel("BRFSS_2015ver7.xlsx")
 
 desired_columns = [
     'BPHIGH4', 'CVDCRHD4', 'CVDSTRK3', 'CHCKIDNY', 'DIABETE3', '_MICHD',
@@ -18,4 +23,6 @@ desired_columns = [
     'DRNKANY5', 'ALCDAY5', 'AVEDRNK2', 'MAXDRNKS', 'DROCDY3_'
 ]
 
-df[desired_columns].to_excel("BRFSS_2015ver8.xlsx", index=False, engine="openpyxl")
+#필요한 컬럼만 읽어서 Parquet로 저장 (엑셀은 preprocess/export_excel.py)
+df = read_table("BRFSS_2015ver7.parquet", columns=desired_columns)
+write_table(df, "BRFSS_2015ver8.parquet")
@@ -1,17 +1,24 @@
+import os
+import sys
+
+# ver15 CSV 옆에서 실행하던 대로 (저장소 루트를 sys.path 에 넣어 src 를 찾음)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 import pandas as pd
+
+from src.common.profile import ensure_profile
 #null이 많은 컬럼 데이터상에서 삭제
 df = pd.read_csv("BRFSS_2015ver15.csv")
-#null의 수
-#ASTHNOW:382047, INSULIN:412032, ARTHSOCL:305162,
-# JOINPAIN:307728, INSULIN:412032, BLDSUGAR:412035, DOCTDIAB:412,038
-#CHKHEMO3:412039, FEETCHK:412317, DIABEYE:412040, CIMEMLOS:324727
-#SXORIENT:274459, TRNSGNDR:274549 ,
 
 
 columns_to_drop = ['ASTHNOW', 'ARTHSOCL', 'JOINPAIN', 'INSULIN', 'BLDSUGAR',
                    'DOCTDIAB','CHKHEMO3', 'FEETCHK', 'DIABEYE','CIMEMLOS',
                    'SXORIENT', 'TRNSGNDR']
 
+#null의 수 (CSV 옆 프로파일 사이드카에서 읽음, src/common/profile.py)
+nulls = ensure_profile("BRFSS_2015ver15.csv")['columns']
+print({col: nulls[col]['nulls'] for col in columns_to_drop if col in nulls})
+
 df = df.drop(columns=columns_to_drop, errors='ignore')
 
 df = pd.read_csv("BRFSS_2015ver16.csv", low_memory=False)
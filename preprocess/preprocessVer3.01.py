@@ -818,12 +818,13 @@ def preprocess_data(df):
     return df
 
 
-df = pd.read_csv("BRFSS_2015ver11.csv")
-df = preprocess_data(df)
+if __name__ == "__main__":
+    df = pd.read_csv("BRFSS_2015ver11.csv")
+    df = preprocess_data(df)
 
 
-columns_to_drop = ['BLDSUGAR', 'FEETCHK2', 'FC60_', '_FRUITEX', '_VEGETEX']
-df.drop(columns=columns_to_drop, inplace=True)
+    columns_to_drop = ['BLDSUGAR', 'FEETCHK2', 'FC60_', '_FRUITEX', '_VEGETEX']
+    df.drop(columns=columns_to_drop, inplace=True)
 
-df.to_csv("BRFSS_2015ver18.csv", index=False)
+    df.to_csv("BRFSS_2015ver18.csv", index=False)
 
@@ -0,0 +1,26 @@
+import os
+import sys
+
+# ver11 CSV 가 있는 폴더에서 python <저장소>/preprocess/preprocessVer3.02.py 로 실행 (src 는 저장소 루트에서 찾음)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from src.brfss.recode import preprocess_data
+from src.brfss.store import write_store
+from src.common.config import BRFSS_DROP_COLUMNS
+#------------------------------------------------
+# preprocessVer3.01.py 와 같은 규칙, 같은 결과
+# 셀마다 apply 하던 것을 src/brfss/recode.py 의 컬럼 단위 연산으로 교체
+# 두 버전 비교: python -m preprocess.bench_recode
+#-----------------------------------------------
+
+df = pd.read_csv("BRFSS_2015ver11.csv")
+df = preprocess_data(df)
+
+
+df.drop(columns=BRFSS_DROP_COLUMNS, inplace=True)
+
+df.to_csv("BRFSS_2015ver18.csv", index=False)
+# 학습용 컬럼 저장소 (src.brfss.store.load_brfss 로 읽음)
+write_store(df, "BRFSS_2015ver18.parquet")
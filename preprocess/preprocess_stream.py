@@ -0,0 +1,28 @@
+import argparse
+
+from src.brfss.stream import DEFAULT_CHUNKSIZE, preprocess_csv_chunked
+from src.common.sample import SAMPLE_PERCENTS
+
+#------------------------------------------------
+# 원본 BRFSS_2015.csv → BRFSS_2015ver18.csv 를 청크 단위로 한 번에 처리
+# (preprocessVer2.00 → 2.01 → 3.01 과 같은 결과, 메모리는 chunksize 만큼만 사용)
+#
+# 실행 (프로젝트 루트에서)
+#   python -m preprocess.preprocess_stream data/BRFSS_2015.csv data/BRFSS_2015ver18.csv --chunksize 20000
+#   (코어가 많으면 --workers 16 처럼 컬럼 병렬 재코딩)
+#   python -m preprocess.preprocess_stream data/BRFSS_2015.csv data/BRFSS_2015ver18_1pct.csv --sample 1
+#------------------------------------------------
+
+parser = argparse.ArgumentParser()
+parser.add_argument("src", help="원본 CSV 경로")
+parser.add_argument("dst", help="결과 CSV 경로")
+parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE, help="한 번에 읽을 행 수")
+parser.add_argument("--tmp-dir", default=None, help="임시 청크 저장 폴더")
+parser.add_argument("--workers", type=int, default=1, help="재코딩 작업자 프로세스 수")
+parser.add_argument("--sample", type=float, choices=SAMPLE_PERCENTS, default=None,
+                    help="개발용 층화 표본 비율 (%%)")
+args = parser.parse_args()
+
+rows = preprocess_csv_chunked(args.src, args.dst, chunksize=args.chunksize,
+                              tmp_dir=args.tmp_dir, workers=args.workers, sample=args.sample)
+print(f"전처리 완료: {rows}행 → {args.dst}")
@@ -0,0 +1,33 @@
+import argparse
+import time
+
+from src.common.profile import PROFILE_CHUNKSIZE, profile_file, profile_path, write_profile
+
+#------------------------------------------------
+# 데이터 파일의 컬럼 프로파일 사이드카 만들기 / 보기
+# null 수, min/max/mean, 서로 다른 값 수, 많이 나온 코드, 히스토그램을
+# "<데이터 파일>.profile.json" 에 저장한다 (src/common/profile.py).
+# write_store / run_pipeline / preprocess_stream 결과는 사이드카가 같이 만들어지므로
+# 예전 파일(ver15, ver16 CSV 등)이나 diabetes CSV 에만 쓰면 된다.
+#
+# 실행 (프로젝트 루트에서)
+#   python -m preprocess.profile_data data/BRFSS_2015ver16.csv
+#   python -m preprocess.profile_data data/diabetes/diabetes_prediction_dataset.csv --show smoking_history
+#------------------------------------------------
+
+parser = argparse.ArgumentParser()
+parser.add_argument("paths", nargs="+", help="CSV / Parquet 파일")
+parser.add_argument("--chunksize", type=int, default=PROFILE_CHUNKSIZE)
+parser.add_argument("--show", nargs="*", default=[], help="통계를 출력할 컬럼")
+args = parser.parse_args()
+
+for path in args.paths:
+    start = time.perf_counter()
+    profile = write_profile(profile_file(path, args.chunksize), path)
+    print(f"{path}: {profile['rows']}행 x {len(profile['columns'])}열"
+          f" ({time.perf_counter() - start:.2f}s) → {profile_path(path)}")
+    for col in args.show:
+        stats = profile['columns'][col]
+        print(f"  [{col}] null {stats['nulls']}, 범위 {stats['min']}~{stats['max']},"
+              f" 평균 {stats['mean']}, 값 종류 {stats['cardinality']}")
+        print(f"    top: {stats['top']}")
@@ -0,0 +1,27 @@
+import argparse
+import time
+
+from src.brfss.pipeline import PIPELINE_CACHE, run_pipeline
+from src.common.sample import SAMPLE_PERCENTS
+
+#------------------------------------------------
+# 원본 BRFSS_2015.csv → ver18 을 단계 DAG 로 실행 (src/brfss/pipeline.py)
+# (단계, 컬럼) 결과를 캐시하므로 spec.py 규칙 하나를 고치면 그 규칙 컬럼만 다시 계산한다.
+#
+# 실행 (프로젝트 루트에서)
+#   python -m preprocess.run_pipeline data/BRFSS_2015.csv data/BRFSS_2015ver18.csv
+#   python -m preprocess.run_pipeline data/BRFSS_2015.csv data/BRFSS_2015ver18.parquet
+#   python -m preprocess.run_pipeline data/BRFSS_2015.csv data/BRFSS_2015ver18_10pct.parquet --sample 10
+#------------------------------------------------
+
+parser = argparse.ArgumentParser()
+parser.add_argument("src", help="원본 CSV 경로")
+parser.add_argument("dst", help="결과 경로 (.csv 또는 .parquet)")
+parser.add_argument("--cache-dir", default=PIPELINE_CACHE, help="컬럼 캐시 폴더")
+parser.add_argument("--sample", type=float, choices=SAMPLE_PERCENTS, default=None,
+                    help="개발용 층화 표본 비율 (%%)")
+args = parser.parse_args()
+
+start = time.perf_counter()
+run_pipeline(args.src, args.dst, cache_dir=args.cache_dir, sample=args.sample)
+print(f"완료: {time.perf_counter() - start:.2f}s → {args.dst}")
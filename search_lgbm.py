@@ -0,0 +1,60 @@
+import argparse
+
+from src.brfss.search import SEARCH_DB, pareto_front, pick_trial, run_search
+from src.common.sample import SAMPLE_PERCENTS
+
+#------------------------------------------------
+# BRFSS LightGBM 하이퍼파라미터 검색 (src/brfss/search.py)
+# jjjj.py 와 같은 학습 데이터로 타깃 5개의 파라미터를 같이 찾는다.
+#   - 작업자 프로세스 --workers 개가 동시에 시행을 돌린다
+#   - 학습 행 1/9 → 1/3 → 전부 단계로 학습하면서 검증 AUC 가 나쁜 시행은 일찍 멈춘다
+#   - 스터디는 data/.cache/search.db 에 저장된다. 같은 --study 로 다시 실행하면
+#     이어서 시행을 더 붙인다 (끊겼던 시행은 버리고 다시 돈다)
+#   - --multi-objective: AUC 와 같이 한 행/1,000행 예측 시간, 모델 크기도 재서
+#     파레토 프런트를 보여준다. --latency-budget 안에서 AUC 가 가장 높은 시행에 * 표시
+#     (예측 시간이 다른 학습과 섞이지 않게 시행은 하나씩 돈다 — --workers 는 무시)
+# 찾은 파라미터로 학습: python jjjj.py --study <이름> [--latency-budget <ms>]
+#
+# 실행 (프로젝트 루트에서)
+#   python search_lgbm.py --study brfss --trials 200 --workers 4
+#   python search_lgbm.py --study brfss-1pct --trials 30 --sample 1
+#   python search_lgbm.py --study brfss-serve --trials 100 --multi-objective --latency-budget 2
+#------------------------------------------------
+
+if __name__ == '__main__':
+    # 작업자 프로세스가 이 파일을 다시 읽을 수 있어서(spawn) 전부 main 가드 안에
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--study", default="brfss", help="스터디 이름")
+    parser.add_argument("--trials", type=int, default=100, help="이번에 더할 시행 수")
+    parser.add_argument("--workers", type=int, default=None, help="작업자 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--sample", type=float, choices=SAMPLE_PERCENTS, default=None,
+                        help="개발용 층화 표본 비율 (%%)")
+    parser.add_argument("--from-raw", default=None, help="원본 CSV 에서 바로 전처리해서 검색")
+    parser.add_argument("--storage", default=SEARCH_DB, help="스터디 SQLite 파일")
+    parser.add_argument("--multi-objective", action="store_true",
+                        help="AUC + 예측 시간 + 모델 크기 다목적 검색 (파레토 프런트, 작업자 1개)")
+    parser.add_argument("--latency-budget", type=float, default=None, help="한 행 예측 시간 예산 (ms)")
+    args = parser.parse_args()
+
+    study = run_search(args.study, args.trials, args.workers, args.sample, args.from_raw, args.storage,
+                       multi_objective=args.multi_objective)
+    states = [t.state.name for t in study.trials]
+    print(f"시행 {len(states)}개 (완료 {states.count('COMPLETE')}, 가지치기 {states.count('PRUNED')})")
+    if len(study.directions) > 1:
+        try:
+            picked = pick_trial(study, args.latency_budget).number
+        except ValueError as e:
+            print(e)
+            picked = None
+        print("\n=== 파레토 프런트 ===")
+        print(f"  {'시행':>4} {'AUC':>7} {'한 행 ms':>9} {'1000행 ms':>10} {'크기 KB':>9}  트리 수 / 타깃별 AUC")
+        for row in pareto_front(study):
+            mark = '*' if row['trial'] == picked else ' '
+            aucs = ' '.join(f"{auc:.4f}" for auc in (row['auc_by_target'] or {}).values())
+            print(f"{mark} {row['trial']:>4} {row['auc']:>7.4f} {row['latency_ms']:>9.3f} "
+                  f"{row['batch_latency_ms']:>10.2f} {row['size_kb']:>9.1f}  {row['trees']} / {aucs}")
+    else:
+        best = study.best_trial
+        print(f"최고 검증 AUC (타깃 5개 평균): {best.value:.4f}  트리 수: {best.user_attrs.get('trees')}")
+        for name, value in best.params.items():
+            print(f"  {name} = {value}")
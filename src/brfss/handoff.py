@@ -0,0 +1,466 @@
+# 전처리 결과 → LightGBM 학습 행렬 직접 넘기기
+# src/brfss/handoff.py
+#
+# 지금까지는 전처리 결과를 BRFSS_2015ver18.csv 로 쓰고, 학습 스크립트가 다시 읽어서
+# 피처 컬럼 .copy() → OrdinalEncoder → train_test_split (학습/평가 각각 복사) →
+# astype('category') 로 같은 데이터를 너댓 번 만들었다.
+# 여기서는 분할 순서(학습 행 → 평가 행)를 먼저 정한 다음, 컬럼 버퍼를 float32 행렬 하나에
+# 그 순서대로 바로 채운다. X_train / X_test 는 이 행렬의 앞/뒤 부분(뷰)이라 복사가 없고,
+# C 순서 float32 라서 LightGBM 도 복사 없이 그대로 받는다.
+#
+# 범주형 컬럼은 pandas category 와 같은 코드(학습 행의 값을 정렬한 순서, 없는 값은 NaN)로,
+# 문자열 컬럼은 OrdinalEncoder 와 같은 코드로 넣으므로 jjjj.py 의 pandas 경로와 같은 모델이 나온다.
+#
+# prepare_training_raw 는 원본 CSV 를 청크로 읽어 전처리하면서 행렬에 바로 채운다
+# (ver18 CSV 를 쓰지도 읽지도 않음). 최대 메모리 ≈ 피처 행렬 1개 + 청크 1개.
+#
+# cached_training 은 위 결과를 .npy 로 저장해두고 다음 실행부터 메모리 맵으로 연다
+# (분할 위치도 데이터 지문 + 시드로 따로 저장, src/common/cache.py).
+#
+# load_training 은 jjjj.py 와 하이퍼파라미터 검색(src/brfss/search.py)이 같이 쓰는
+# 학습 데이터(타깃 5개, 제외 컬럼, 범주형 컬럼, 분할 설정)를 한 곳에서 만든다.
+#
+# load_rows 는 새로 들어온 원본 CSV 를 저장해둔 모델의 인코더로 학습 행렬과 같은 코드로 바꾼다
+# (저장한 모델을 새 데이터로 고칠 때, update_lgbm.py).
+
+import os
+
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import train_test_split
+
+from src.brfss.partitions import available_years, iter_brfss, partition_path
+from src.brfss.recode import TARGET_COLS, recode_frame
+from src.brfss.spec import RECODE_SPEC
+from src.brfss.store import (BRFSS_STORE, TARGET_FILTER, load_brfss_matrix, sample_store, store_columns,
+                             target_mask)
+from src.brfss.stream import DEFAULT_CHUNKSIZE, preprocess_chunk
+from src.common.cache import MATRIX_CACHE, cache_key, cached_split, file_fingerprint, load_arrays, save_arrays
+from src.common.config import BRFSS_COLUMNS, BRFSS_DROP_COLUMNS, BRFSS_STORE_ROOT
+from src.common.sample import stratified_indices
+
+# 행렬을 만드는 방식이 바뀌면 올려서 예전 캐시를 안 쓰게 한다
+CACHE_VERSION = 1
+
+# 학습 타깃
+MODEL_TARGETS = ['BPHIGH4', 'CVDCRHD4', 'CVDSTRK3', 'CHCKIDNY', 'DIABETE3']
+
+# 말도 안되는 결과를 출력하는 6가지 컬럼 제외
+EXCLUDED_FEATURES = ['BPMEDS', 'INSULIN', 'DOCTDIAB', 'CHKHEMO3', 'FEETCHK', 'DIABEYE']
+
+CATEGORY_FEATURES = [c for c in [
+    'GENHLTH', 'PERSDOC2', 'CHECKUP1', 'CHOLCHK', 'MARITAL', 'EDUCA',
+    'RENTHOM1', 'EMPLOY1', 'INCOME2', 'USENOW3', 'ARTHSOCL', 'WHRTST10',
+    'SXORIENT', '_ASTHMS1', '_MRACE1', '_RACE', '_INCOMG', 'ACTIN11_',
+    'ACTIN21_', '_PA300R2', '_PAREC1', '_BMI5CAT', '_PA150R2',
+    'SEX', 'SMOKDAY2', '_SMOKER3', '_PACAT1', '_AGEG5YR', 'LASTSMK2', 'MSCODE',
+] if c not in EXCLUDED_FEATURES]
+
+MODEL_SPLIT = dict(test_size=0.4, random_state=42, stratify='BPHIGH4')
+
+
+class FrameEncoder:
+    """
+    학습 행렬과 같은 방식으로 새 입력(데이터프레임)을 float32 행렬로 바꾼다.
+
+    Attributes:
+        feature_names (list): 행렬 컬럼 순서
+        categories (dict): {범주형 컬럼: 정렬된 값 배열} (코드 = 배열 위치)
+        ordinals (dict): {문자열 컬럼: 정렬된 문자열 배열} (OrdinalEncoder 와 같음)
+        categorical_feature (list): LightGBM categorical_feature 에 넘길 컬럼 위치
+    """
+
+    def __init__(self, feature_names, categories, ordinals):
+        self.feature_names = list(feature_names)
+        self.categories = categories
+        self.ordinals = ordinals
+        self.categorical_feature = [i for i, col in enumerate(self.feature_names) if col in categories]
+
+    def transform(self, df):
+        """
+        데이터프레임을 학습 행렬과 같은 코드의 float32 행렬로 바꾼다.
+
+        Args:
+            df (pd.DataFrame): feature_names 컬럼이 있는 데이터프레임
+
+        Returns:
+            np.ndarray: (행 수, 피처 수) float32 행렬
+        """
+        out = np.empty((len(df), len(self.feature_names)), dtype=np.float32)
+        for i, col in enumerate(self.feature_names):
+            out[:, i] = self._encode(col, df[col])
+        return out
+
+    def _encode(self, col, series):
+        if col in self.ordinals:
+            return _codes(series.astype(str).to_numpy(), self.ordinals[col], unknown=-1)
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        if col in self.categories:
+            return _codes(values, self.categories[col], unknown=np.nan)
+        return values
+
+
+def _codes(values, levels, unknown):
+    # 정렬된 levels 안의 위치. levels 에 없는 값(NaN 포함)은 unknown
+    pos = np.searchsorted(levels, values).clip(0, max(len(levels) - 1, 0))
+    found = (levels[pos] == values) if len(levels) else np.zeros(len(values), dtype=bool)
+    return np.where(found, pos, unknown)
+
+
+def _levels(values):
+    # pandas category 의 categories 와 같음 (빈칸 제외, 정렬)
+    return np.unique(values[~pd.isna(values)])
+
+
+def split_order(y, test_size=0.4, random_state=42, stratify=None, fingerprint=None):
+    """
+    train_test_split 과 같은 학습/평가 행 위치.
+
+    Args:
+        y (pd.DataFrame): 타깃
+        test_size (float): 평가 비율
+        random_state (int): 시드
+        stratify (str): 층화할 타깃 컬럼 (None 이면 층화 없음)
+        fingerprint (str): 데이터 지문. 주면 분할 위치를 저장해두고 다시 쓴다 (cached_split)
+
+    Returns:
+        tuple: (학습 행 위치, 평가 행 위치)
+    """
+    def make():
+        strata = y[stratify] if stratify else None
+        return train_test_split(np.arange(len(y)), test_size=test_size,
+                                random_state=random_state, stratify=strata)
+
+    if fingerprint is None:
+        return make()
+    return cached_split(fingerprint, len(y), make, random_state, test_size, stratify)
+
+
+def prepare_training(df, feature_cols, target_cols=TARGET_COLS, category_cols=(),
+                     test_size=0.4, random_state=42, stratify=None, fingerprint=None):
+    """
+    메모리에 있는 데이터프레임(load_brfss 결과 등)에서 학습/평가 행렬을 만든다.
+    X[feature_cols].copy() + OrdinalEncoder + train_test_split + astype('category') 와 같은 결과.
+
+    Args:
+        df (pd.DataFrame | CompactMatrix): 피처와 타깃이 있는 데이터프레임 (또는 load_brfss_matrix 결과)
+        feature_cols (list): 피처 컬럼 (행렬 컬럼 순서)
+        target_cols (list): 타깃 컬럼
+        category_cols (list): 범주형으로 학습할 컬럼
+        test_size (float): 평가 비율
+        random_state (int): 시드
+        stratify (str): 층화할 타깃 컬럼
+        fingerprint (str): 데이터 지문 (주면 분할 위치 캐시 사용)
+
+    Returns:
+        tuple: (X_train, X_test, y_train, y_test, encoder)
+            - X_train, X_test (np.ndarray): 하나의 float32 행렬의 앞/뒤 뷰
+            - y_train, y_test (pd.DataFrame): int8 타깃
+            - encoder (FrameEncoder): 예측 입력 변환용
+    """
+    y = df[target_cols].astype(np.int8)
+    train_idx, test_idx = split_order(y, test_size, random_state, stratify, fingerprint)
+    order = np.concatenate([train_idx, test_idx])
+
+    X = np.empty((len(order), len(feature_cols)), dtype=np.float32)
+    categories, ordinals = {}, {}
+    for i, col in enumerate(feature_cols):
+        series = df[col]
+        if series.dtype == object:
+            # OrdinalEncoder(전체 행으로 fit) 와 같은 코드
+            values = series.astype(str).to_numpy()
+            ordinals[col] = np.unique(values)
+            X[:, i] = _codes(values[order], ordinals[col], unknown=-1)
+            continue
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        if col in category_cols:
+            categories[col] = _levels(values[train_idx])
+            X[:, i] = _codes(values[order], categories[col], unknown=np.nan)
+        else:
+            X[:, i] = values[order]
+
+    n_train = len(train_idx)
+    return (X[:n_train], X[n_train:], y.iloc[train_idx], y.iloc[test_idx],
+            FrameEncoder(feature_cols, categories, ordinals))
+
+
+def _raw_targets(src):
+    # 원본 타깃 5개만 읽어서 재코딩 (전처리 결과의 타깃과 같음)
+    return recode_frame(pd.read_csv(src, usecols=TARGET_COLS))[TARGET_COLS]
+
+
+def prepare_training_raw(src, feature_cols=None, target_cols=TARGET_COLS, category_cols=(),
+                         test_size=0.4, random_state=42, stratify=None, exclude=(),
+                         chunksize=DEFAULT_CHUNKSIZE, columns=BRFSS_COLUMNS, drop=BRFSS_DROP_COLUMNS,
+                         fingerprint=None, sample=None, seed=42):
+    """
+    원본 BRFSS CSV 에서 전처리 → 학습 행렬까지 한 번에 만든다 (ver18 CSV 없이).
+    타깃 5개가 모두 0/1 인 행만 쓰고(load_brfss(where=TARGET_FILTER) 와 같음),
+    결과는 전처리 결과 파일을 읽어 prepare_training 에 넘긴 것과 같다.
+
+    Args:
+        src (str): 원본 CSV 경로 (예: data/BRFSS_2015.csv)
+        feature_cols (list): 피처 컬럼 (None 이면 전처리 결과에서 타깃/exclude 를 뺀 전체)
+        target_cols (list): 타깃 컬럼
+        category_cols (list): 범주형으로 학습할 컬럼
+        test_size, random_state, stratify, fingerprint: prepare_training 과 같음
+        exclude (list): feature_cols 가 None 일 때 뺄 컬럼
+        chunksize (int): 한 번에 읽을 원본 행 수
+        columns (list): 원본에서 남길 컬럼
+        drop (list): 재코딩 후 삭제할 컬럼
+        sample (float): 개발용 표본 비율 (%). 쓸 행 중 타깃 조합으로 층화한 행만 쓴다 (sample_store 와 같은 방식)
+        seed (int): 표본 시드
+
+    Returns:
+        tuple: prepare_training 과 같음
+    """
+    if feature_cols is None:
+        skip = set(target_cols) | set(exclude) | set(drop)
+        feature_cols = [col for col in columns if col not in skip]
+
+    # 1) 타깃만 먼저 읽어서 쓸 행과 분할 순서를 정한다
+    targets = _raw_targets(src)
+    ok = target_mask(targets)
+    if sample:
+        rows = np.flatnonzero(ok)
+        ok = np.zeros_like(ok)
+        ok[rows[stratified_indices(targets.iloc[rows][TARGET_COLS], sample / 100, seed)]] = True
+    y = targets[ok][target_cols].astype(np.int8)
+    train_idx, test_idx = split_order(y, test_size, random_state, stratify, fingerprint)
+    # 쓸 행 k 번째 → 행렬의 몇 번째 행인지
+    dest = np.empty(len(y), dtype=np.int64)
+    dest[np.concatenate([train_idx, test_idx])] = np.arange(len(y))
+    del targets
+
+    # 2) 원본을 청크로 전처리하면서 행렬의 제자리에 채운다
+    X = np.empty((len(y), len(feature_cols)), dtype=np.float32)
+    start = used = 0
+    for chunk in pd.read_csv(src, usecols=columns, chunksize=chunksize):
+        chunk = preprocess_chunk(chunk, columns, drop)
+        keep = ok[start:start + len(chunk)]
+        rows = dest[used:used + int(keep.sum())]
+        for i, col in enumerate(feature_cols):
+            X[rows, i] = chunk[col].to_numpy(dtype=np.float32, na_value=np.nan)[keep]
+        start += len(chunk)
+        used += len(rows)
+        del chunk
+
+    # 3) 범주형 컬럼은 학습 행의 값으로 코드를 정해서 제자리에서 바꾼다
+    n_train = len(train_idx)
+    categories = {}
+    for i, col in enumerate(feature_cols):
+        if col in category_cols:
+            categories[col] = _levels(X[:n_train, i]).astype(np.float64)
+            X[:, i] = _codes(X[:, i].astype(np.float64), categories[col], unknown=np.nan)
+
+    return (X[:n_train], X[n_train:], y.iloc[train_idx], y.iloc[test_idx],
+            FrameEncoder(feature_cols, categories, {}))
+
+
+def _union(column_lists):
+    # 처음 나온 순서를 지킨 합집합
+    return list(dict.fromkeys(col for cols in column_lists for col in cols))
+
+
+def prepare_training_years(years, feature_cols, target_cols=TARGET_COLS, category_cols=(),
+                           test_size=0.4, random_state=42, stratify=None, root=BRFSS_STORE_ROOT,
+                           fingerprint=None, sample=None, seed=42):
+    """
+    연도 파티션 저장소(src/brfss/partitions.py)의 여러 해를 합치지 않고 학습/평가 행렬을 만든다.
+    prepare_training_raw 와 같은 두 단계: 타깃만 먼저 읽어 분할 순서를 정한 다음,
+    iter_brfss 로 한 해씩 읽어 행렬의 제자리에 채운다 (최대 메모리 ≈ 피처 행렬 1개 + 한 해).
+    결과는 선택한 해를 이어 붙인 데이터프레임을 prepare_training 에 넘긴 것과 같다.
+
+    Args:
+        years (list): 쓸 연도
+        feature_cols (list): 피처 컬럼 (그 해에 없는 컬럼은 빈칸)
+        target_cols, category_cols, test_size, random_state, stratify, fingerprint: prepare_training 과 같음
+        root (str): 연도 파티션 저장소 폴더
+        sample (float): 개발용 표본 비율 (%). 타깃 조합으로 층화한 행만 쓴다
+        seed (int): 표본 시드
+
+    Returns:
+        tuple: prepare_training 과 같음. y 인덱스는 선택한 해를 이어 붙인 순서의 행 위치
+    """
+    # 1) 타깃만 한 해씩 읽어서 쓸 행과 분할 순서를 정한다
+    y = pd.concat([df for _, df in iter_brfss(years, target_cols, TARGET_FILTER, root)], ignore_index=True)
+    keep = np.ones(len(y), dtype=bool)
+    if sample:
+        keep[:] = False
+        keep[stratified_indices(y, sample / 100, seed)] = True
+        y = y[keep].reset_index(drop=True)
+    y = y.astype(np.int8)
+    train_idx, test_idx = split_order(y, test_size, random_state, stratify, fingerprint)
+    dest = np.empty(len(y), dtype=np.int64)
+    dest[np.concatenate([train_idx, test_idx])] = np.arange(len(y))
+
+    # 2) 한 해씩 읽으면서 행렬의 제자리에 채운다
+    X = np.empty((len(y), len(feature_cols)), dtype=np.float32)
+    start = used = 0
+    for _, df in iter_brfss(years, feature_cols, TARGET_FILTER, root, compact=True):
+        rows_kept = keep[start:start + len(df)]
+        rows = dest[used:used + int(rows_kept.sum())]
+        for i, col in enumerate(feature_cols):
+            X[rows, i] = df[col].to_numpy(dtype=np.float32, na_value=np.nan)[rows_kept]
+        start += len(df)
+        used += len(rows)
+        del df
+
+    # 3) 범주형 컬럼은 학습 행의 값으로 코드를 정해서 제자리에서 바꾼다
+    n_train = len(train_idx)
+    categories = {}
+    for i, col in enumerate(feature_cols):
+        if col in category_cols:
+            categories[col] = _levels(X[:n_train, i]).astype(np.float64)
+            X[:, i] = _codes(X[:, i].astype(np.float64), categories[col], unknown=np.nan)
+
+    return (X[:n_train], X[n_train:], y.iloc[train_idx], y.iloc[test_idx],
+            FrameEncoder(feature_cols, categories, {}))
+
+
+def load_rows(src, encoder, target_cols=MODEL_TARGETS, chunksize=DEFAULT_CHUNKSIZE,
+              columns=BRFSS_COLUMNS, drop=BRFSS_DROP_COLUMNS):
+    """
+    원본 BRFSS CSV 를 전처리해서 이미 정해진 인코더의 코드로 바꾼다 (분할 없음).
+    타깃 5개가 모두 0/1 인 행만 쓴다 (학습 데이터와 같음).
+
+    Args:
+        src (str): 원본 CSV 경로
+        encoder (FrameEncoder): 학습 때 만든 입력 변환기 (범주형 코드는 학습 때 그대로)
+        target_cols (list): 타깃 컬럼
+        chunksize (int): 한 번에 읽을 원본 행 수
+        columns (list): 원본에서 남길 컬럼
+        drop (list): 재코딩 후 삭제할 컬럼
+
+    Returns:
+        tuple: (X, y)
+            - X (np.ndarray): (행 수, 피처 수) float32 행렬
+            - y (pd.DataFrame): int8 타깃
+    """
+    X_parts, y_parts = [], []
+    for chunk in pd.read_csv(src, usecols=columns, chunksize=chunksize):
+        chunk = preprocess_chunk(chunk, columns, drop)
+        chunk = chunk[target_mask(chunk)]
+        X_parts.append(encoder.transform(chunk))
+        y_parts.append(chunk[target_cols].astype(np.int8))
+        del chunk
+    y = pd.concat(y_parts, ignore_index=True)
+    return np.concatenate(X_parts), y
+
+
+def training_key(fingerprint, params):
+    """
+    학습 행렬 이름 (cached_training 의 캐시 폴더 이름).
+    MultiTargetLGBM.fit(dataset_key=...) 에 넘겨서 binning 한 Dataset 캐시 이름으로도 쓴다.
+    """
+    return cache_key(CACHE_VERSION, fingerprint, params)
+
+
+def cached_training(fingerprint, params, build, cache_dir=MATRIX_CACHE):
+    """
+    prepare_training / prepare_training_raw 결과를 캐시해두고 메모리 맵으로 돌려준다.
+    처음에는 build() 로 만들어 저장한 다음 저장한 파일을 연다 (만든 행렬은 바로 버림).
+
+    Args:
+        fingerprint (str): 데이터 지문 (src/common/cache.py 의 file_fingerprint)
+        params (dict): 결과를 바꾸는 설정 (피처/타깃/범주형 컬럼, 분할 설정 등). 캐시 이름에 들어간다
+        build (callable): 캐시가 없을 때 (X_train, X_test, y_train, y_test, encoder) 를 만드는 함수
+        cache_dir (str): 캐시 폴더
+
+    Returns:
+        tuple: prepare_training 과 같음. X_train / X_test 는 읽기 전용 np.memmap
+    """
+    path = os.path.join(cache_dir, "features", training_key(fingerprint, params))
+    if load_arrays(path) is None:
+        X_train, X_test, y_train, y_test, encoder = build()
+        save_arrays(path, {
+            'X_train': X_train, 'X_test': X_test,
+            'y_train': y_train.to_numpy(), 'y_test': y_test.to_numpy(),
+            'train_index': y_train.index.to_numpy(), 'test_index': y_test.index.to_numpy(),
+        }, {'encoder': encoder, 'target_cols': list(y_train.columns)})
+        del X_train, X_test
+
+    arrays, extra = load_arrays(path)
+    y_train = pd.DataFrame(np.array(arrays['y_train']), index=np.array(arrays['train_index']),
+                           columns=extra['target_cols'])
+    y_test = pd.DataFrame(np.array(arrays['y_test']), index=np.array(arrays['test_index']),
+                          columns=extra['target_cols'])
+    return arrays['X_train'], arrays['X_test'], y_train, y_test, extra['encoder']
+
+
+def load_training(sample=None, from_raw=None, no_cache=False, years=None, root=BRFSS_STORE_ROOT):
+    """
+    jjjj.py 학습 데이터 (타깃 MODEL_TARGETS, 분할 MODEL_SPLIT).
+
+    Args:
+        sample (float): 타깃 5개로 층화한 표본 비율 (%, 처음 한 번만 만들고 캐시).
+            from_raw 와 같이 주면 원본에서 표본 행만 전처리한다
+        from_raw (str): 원본 CSV 경로. 주면 저장소 대신 원본에서 바로 전처리
+        no_cache (bool): 학습 행렬 캐시를 쓰지 않고 새로 만들기
+        years (list): 연도 파티션 저장소(root)에서 쓸 연도. 주면 BRFSS_STORE 대신
+            그 해들을 한 해씩 읽어 학습 행렬을 만든다 (prepare_training_years)
+        root (str): 연도 파티션 저장소 폴더
+
+    Returns:
+        tuple: (X_train, X_test, y_train, y_test, encoder, dataset_key).
+            dataset_key 는 MultiTargetLGBM.fit(dataset_key=...) 에 넘길 이름 (no_cache 면 None)
+    """
+    if from_raw and years:
+        raise ValueError("from_raw 와 years 는 같이 쓸 수 없습니다 (원본 한 파일 또는 연도 파티션 중 하나).")
+    if years:
+        return _load_years(sorted(set(years)), sample, no_cache, root)
+    if from_raw:
+        # 저장소 컬럼과 같은 순서 (원본 컬럼 - 삭제 컬럼)
+        feature_cols = [c for c in BRFSS_COLUMNS
+                        if c not in MODEL_TARGETS + EXCLUDED_FEATURES + BRFSS_DROP_COLUMNS]
+    else:
+        store = sample_store(sample) if sample else BRFSS_STORE
+        feature_cols = [c for c in store_columns(store) if c not in MODEL_TARGETS + EXCLUDED_FEATURES]
+
+    source = from_raw or store
+    fingerprint = file_fingerprint(source)
+    if from_raw and sample:
+        # 원본 표본은 파일이 따로 없으므로 지문에 비율을 붙여서 전체 데이터의 분할/행렬 캐시와 나눈다
+        fingerprint = f"{fingerprint}-{sample:g}pct"
+
+    def build():
+        if from_raw:
+            # 원본 CSV → 전처리 → 학습 행렬 (ver18 CSV/저장소를 거치지 않음)
+            return prepare_training_raw(from_raw, feature_cols, MODEL_TARGETS, CATEGORY_FEATURES,
+                                        fingerprint=fingerprint, sample=sample, **MODEL_SPLIT)
+        # 필요한 컬럼만, 타깃 5개가 모두 0/1 인 행만 읽기 (preprocess/build_store.py 로 만든 저장소)
+        # 컬럼별 int8/int16/float32 + 결측 비트맵(CompactMatrix)으로 읽어서 그대로 학습 행렬로
+        # (데이터프레임을 거치지 않음, src/common/schema.py)
+        matrix = load_brfss_matrix(feature_cols + MODEL_TARGETS, where=TARGET_FILTER, path=store)
+        return prepare_training(matrix, feature_cols, MODEL_TARGETS, CATEGORY_FEATURES,
+                                fingerprint=fingerprint, **MODEL_SPLIT)
+
+    if no_cache:
+        return (*build(), None)
+    # 원본에서 만들 때는 재코딩 규칙도 결과를 바꾸므로 캐시 이름에 넣는다
+    params = dict(MODEL_SPLIT, features=feature_cols, targets=MODEL_TARGETS, categories=CATEGORY_FEATURES,
+                  spec=RECODE_SPEC if from_raw else None)
+    # binning 한 Dataset 도 같은 이름으로 LightGBM 바이너리 캐시 (data/.cache/lgbm)
+    return (*cached_training(fingerprint, params, build), training_key(fingerprint, params))
+
+
+def _load_years(years, sample, no_cache, root):
+    # load_training(years=...) : 연도 파티션을 한 해씩 읽어 학습 행렬로
+    missing = sorted(set(years) - set(available_years(root)))
+    if missing:
+        raise FileNotFoundError(f"저장소에 없는 연도: {missing} (있는 연도: {available_years(root)})")
+    paths = [partition_path(year, root) for year in years]
+    skip = set(MODEL_TARGETS + EXCLUDED_FEATURES)
+    feature_cols = [c for c in _union(store_columns(path) for path in paths) if c not in skip]
+    # 연도 파일 지문을 모두 합친 지문 (한 해라도 다시 넣으면 캐시가 바뀐다)
+    fingerprint = cache_key(years, [file_fingerprint(path) for path in paths], sample)
+
+    def build():
+        return prepare_training_years(years, feature_cols, MODEL_TARGETS, CATEGORY_FEATURES, root=root,
+                                      fingerprint=fingerprint, sample=sample, **MODEL_SPLIT)
+
+    if no_cache:
+        return (*build(), None)
+    params = dict(MODEL_SPLIT, features=feature_cols, targets=MODEL_TARGETS, categories=CATEGORY_FEATURES,
+                  years=years)
+    return (*cached_training(fingerprint, params, build), training_key(fingerprint, params))
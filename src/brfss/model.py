@@ -0,0 +1,44 @@
+# BRFSS 모델 저장, 로드 파일
+# src/brfss/model.py
+#
+# jjjj.py 로 학습한 MultiTargetLGBM 을 입력 변환기(FrameEncoder)와 같이 저장한다.
+# 새 데이터로 모델을 고칠 때(update_lgbm.py) 새 행을 학습 때와 같은 코드로 바꾸려면
+# 인코더가 같이 있어야 해서 한 파일에 둔다.
+
+import os
+
+import joblib
+
+from src.common.config import DATA_DIR
+
+MODEL_PATH = os.path.join(DATA_DIR, "models", "brfss_lgbm.pkl")
+
+
+def save_model(model, encoder, path=MODEL_PATH):
+    """
+    학습된 모델과 입력 변환기를 저장한다.
+
+    Args:
+        model (MultiTargetLGBM): 학습된 모델
+        encoder (FrameEncoder): 학습 행렬을 만든 입력 변환기
+        path (str): 저장 경로 (.pkl 파일)
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # 저장하다 끊겨도 예전 모델 파일이 깨지지 않게 임시 파일에 쓰고 바꾼다
+    tmp = f"{path}.{os.getpid()}.tmp"
+    joblib.dump({'model': model, 'encoder': encoder}, tmp)
+    os.replace(tmp, path)
+
+
+def load_model(path=MODEL_PATH):
+    """
+    저장된 모델과 입력 변환기를 로드한다.
+
+    Args:
+        path (str): 모델 파일 경로 (.pkl)
+
+    Returns:
+        tuple: (MultiTargetLGBM, FrameEncoder)
+    """
+    saved = joblib.load(path)
+    return saved['model'], saved['encoder']
@@ -0,0 +1,155 @@
+# BRFSS 재코딩 멀티프로세스 실행 파일
+# src/brfss/parallel.py
+#
+# 규칙은 컬럼끼리 서로 독립이라(한 컬럼은 한 규칙에만 속함) 컬럼을 나눠서
+# 여러 프로세스가 동시에 재코딩할 수 있다.
+# 데이터프레임을 pickle 로 넘기지 않고, 입력/출력 컬럼을 공유 메모리
+# (multiprocessing.shared_memory) 의 (컬럼 수 x 행 수) float64 배열에 두고
+# 작업자는 자기 컬럼 번호만 받아서 그 자리에 결과를 쓴다.
+# 부모 프로세스는 결과 배열과 작업자가 돌려준 dtype 종류로 최종 컬럼을 만든다.
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from src.brfss.recode import (_column_values, _finalize, _result_dtype,
+                              bound_variable, compile_batch, recode_frame)
+from src.brfss.spec import RECODE_SPEC
+
+# 이보다 행이 적으면 프로세스를 띄우는 비용이 더 커서 그냥 한 프로세스로 처리
+MIN_PARALLEL_ROWS = 50_000
+
+# 작업자 프로세스마다 한 번 컴파일한 커널
+_KERNELS = {}
+
+
+def _init_worker():
+    for col, rule in RECODE_SPEC.items():
+        if rule['type'] != 'raw':
+            _KERNELS[col] = compile_batch(rule)
+
+
+def _recode_task(in_name, out_name, shape, tasks):
+    """
+    작업자: 공유 메모리의 입력 컬럼을 재코딩해서 출력 배열의 같은 자리에 쓴다.
+
+    Args:
+        in_name, out_name (str): 입력/출력 공유 메모리 이름
+        shape (tuple): (컬럼 수, 행 수)
+        tasks (list): (배열 행 번호, 컬럼명, 정수형 여부) 목록
+
+    Returns:
+        list: (배열 행 번호, dtype 종류) 목록
+    """
+    # 풀 작업자는 부모와 같은 resource_tracker 를 쓰므로 붙기만 하고 unlink 는 부모가 한다
+    in_shm, out_shm = SharedMemory(name=in_name), SharedMemory(name=out_name)
+    try:
+        inp = np.ndarray(shape, dtype=np.float64, buffer=in_shm.buf)
+        out = np.ndarray(shape, dtype=np.float64, buffer=out_shm.buf)
+        result = []
+        for i, col, is_int in tasks:
+            with np.errstate(invalid='ignore'):
+                values, kind = _KERNELS[col](inp[i], is_int)
+            out[i] = values
+            result.append((i, _result_dtype(kind)))
+        del inp, out
+        return result
+    finally:
+        in_shm.close()
+        out_shm.close()
+
+
+class ParallelRecoder:
+    """
+    프로세스 풀을 한 번 띄워두고 여러 데이터프레임(예: 청크)에 재사용하는 재코딩기.
+
+    사용 예:
+        with ParallelRecoder(workers=16) as recoder:
+            df = recoder.preprocess_data(df)
+    """
+
+    def __init__(self, workers=None, min_rows=MIN_PARALLEL_ROWS):
+        self.workers = workers or os.cpu_count() or 1
+        self.min_rows = min_rows
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.pool.shutdown()
+
+    def recode_frame(self, df):
+        """
+        recode.recode_frame 과 같은 결과를 여러 프로세스로 만든다 (df 를 제자리에서 수정).
+
+        Args:
+            df (pd.DataFrame): 재코딩할 데이터프레임
+
+        Returns:
+            pd.DataFrame: 재코딩된 데이터프레임
+        """
+        cols = [c for c, rule in RECODE_SPEC.items() if rule['type'] != 'raw' and c in df.columns]
+        # 빈 데이터프레임은 공유 메모리(크기 0)를 만들 수 없으므로 min_rows=0 이어도 한 프로세스로
+        if len(df) == 0 or len(df) < self.min_rows or self.workers == 1 or not cols:
+            return recode_frame(df)
+
+        shape = (len(cols), len(df))
+        nbytes = shape[0] * shape[1] * 8
+        in_shm = SharedMemory(create=True, size=nbytes)
+        out_shm = None
+        try:
+            out_shm = SharedMemory(create=True, size=nbytes)
+            inp = np.ndarray(shape, dtype=np.float64, buffer=in_shm.buf)
+            out = np.ndarray(shape, dtype=np.float64, buffer=out_shm.buf)
+            tasks = []
+            for i, col in enumerate(cols):
+                inp[i], is_int = _column_values(df[col])
+                tasks.append((i, col, is_int))
+
+            # 컬럼을 작업자 수만큼 고르게 나눈다 (i, i+n, i+2n, ...)
+            n = min(self.workers, len(tasks))
+            futures = [
+                self.pool.submit(_recode_task, in_shm.name, out_shm.name, shape, tasks[k::n])
+                for k in range(n)
+            ]
+            dtypes = {}
+            for future in futures:
+                dtypes.update(future.result())
+
+            for i, col in enumerate(cols):
+                values = _finalize(out[i], None, dtypes[i])
+                # float 결과는 공유 메모리를 그대로 가리키므로 복사해서 넣는다
+                df[col] = values.copy() if dtypes[i] == 'f' else values
+            del inp, out
+        finally:
+            for shm in (in_shm, out_shm):
+                if shm is not None:
+                    shm.close()
+                    shm.unlink()
+        return df
+
+    def preprocess_data(self, df):
+        """recode.preprocess_data 의 멀티프로세스 버전."""
+        df = self.recode_frame(df)
+        return bound_variable(df)
+
+
+def preprocess_data_parallel(df, workers=None):
+    """
+    프로세스 풀을 만들어 preprocess_data 를 한 번 실행한다.
+
+    Args:
+        df (pd.DataFrame): BRFSS_2015ver11.csv 를 읽은 데이터프레임
+        workers (int): 작업자 프로세스 수 (기본: CPU 코어 수)
+
+    Returns:
+        pd.DataFrame: preprocess_data 와 같은 결과
+    """
+    with ParallelRecoder(workers) as recoder:
+        return recoder.preprocess_data(df)
@@ -0,0 +1,124 @@
+# 연도별 파티션 BRFSS 저장소 파일
+# src/brfss/partitions.py
+#
+# 여러 해(2011–2023) 데이터를 한 CSV 로 합치지 않고 조사 연도마다 따로 저장한다.
+#   data/brfss_store/year=2015/part.parquet
+#   data/brfss_store/year=2016/part.parquet
+# 각 파티션은 src/brfss/store.py 의 저장소 파일 하나라서 컬럼 선택/행 그룹 건너뛰기가
+# 그대로 되고, 연도 하나를 추가해도 다른 연도 파일은 건드리지 않는다.
+# 로더는 필요한 연도 파일만, 한 번에 한 연도씩 읽는다.
+
+import os
+import re
+import shutil
+import tempfile
+
+import pandas as pd
+
+from src.brfss.pipeline import PIPELINE_CACHE, run_pipeline
+from src.brfss.store import load_brfss, store_columns
+from src.common.config import BRFSS_STORE_ROOT
+
+PART_FILE = "part.parquet"
+_YEAR_DIR = re.compile(r"^year=(\d{4})$")
+
+
+def partition_path(year, root=BRFSS_STORE_ROOT):
+    """연도 파티션 파일 경로."""
+    return os.path.join(root, f"year={int(year)}", PART_FILE)
+
+
+def available_years(root=BRFSS_STORE_ROOT):
+    """저장소에 있는 연도 목록 (오름차순)."""
+    if not os.path.isdir(root):
+        return []
+    years = []
+    for name in os.listdir(root):
+        match = _YEAR_DIR.match(name)
+        if match and os.path.exists(os.path.join(root, name, PART_FILE)):
+            years.append(int(match.group(1)))
+    return sorted(years)
+
+
+def ingest_year(src, year, root=BRFSS_STORE_ROOT, cache_dir=PIPELINE_CACHE,
+                overwrite=False, verbose=True):
+    """
+    원본 CSV(또는 XPT) 한 해치를 전처리해서 그 연도 파티션으로 추가한다.
+    다른 연도 파티션은 읽지도 쓰지도 않으므로 걸리는 시간은 그 해 데이터 크기에만 비례한다.
+
+    Args:
+        src (str): 그 해 원본 CSV 또는 XPT 경로 (예: data/LLCP2016.XPT)
+        year (int): 조사 연도
+        root (str): 저장소 폴더
+        cache_dir (str): 단계 캐시 폴더 (pipeline.run_pipeline)
+        overwrite (bool): 이미 있는 연도면 교체할지 여부 (False 면 에러)
+        verbose (bool): 진행 상황 출력 여부
+
+    Returns:
+        str: 파티션 파일 경로
+    """
+    path = partition_path(year, root)
+    if os.path.exists(path) and not overwrite:
+        raise FileExistsError(f"{year}년 파티션이 이미 있습니다: {path} (교체하려면 overwrite=True)")
+
+    # 임시 폴더에 다 쓴 뒤 이름만 바꿔서, 중간에 실패해도 기존 파티션은 그대로 둔다
+    os.makedirs(root, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(dir=root, prefix=f".year={int(year)}.")
+    try:
+        run_pipeline(src, os.path.join(tmp_dir, PART_FILE), cache_dir=cache_dir, verbose=verbose)
+        final_dir = os.path.dirname(path)
+        if os.path.exists(final_dir):
+            shutil.rmtree(final_dir)
+        os.replace(tmp_dir, final_dir)
+    finally:
+        if os.path.exists(tmp_dir):
+            shutil.rmtree(tmp_dir)
+    return path
+
+
+def _select_years(years, root):
+    stored = available_years(root)
+    if years is None:
+        return stored
+    missing = sorted(set(years) - set(stored))
+    if missing:
+        raise FileNotFoundError(f"저장소에 없는 연도: {missing} (있는 연도: {stored})")
+    return sorted(years)
+
+
+def iter_brfss(years=None, columns=None, where=None, root=BRFSS_STORE_ROOT, compact=False):
+    """
+    연도 파티션을 한 해씩 읽어서 돌려준다 (전체를 메모리에 합치지 않음).
+
+    Args:
+        years (list): 읽을 연도 (None 이면 전체)
+        columns (list): 읽을 컬럼 (그 해에 없는 컬럼은 빈 컬럼)
+        where (list): pyarrow 필터 (예: store.TARGET_FILTER)
+        root (str): 저장소 폴더
+        compact (bool): 작은 dtype 으로 읽을지 여부 (load_brfss 참고)
+
+    Yields:
+        tuple: (연도, pd.DataFrame)
+    """
+    for year in _select_years(years, root):
+        path = partition_path(year, root)
+        if columns is None:
+            df = load_brfss(where=where, path=path, compact=compact)
+        else:
+            present = [col for col in columns if col in store_columns(path)]
+            df = load_brfss(present, where=where, path=path, compact=compact).reindex(columns=columns)
+        yield year, df
+
+
+def load_years(years=None, columns=None, where=None, root=BRFSS_STORE_ROOT, compact=False):
+    """
+    여러 연도를 하나의 데이터프레임으로 읽는다. 인덱스는 (연도, 그 해 행 번호).
+    메모리가 부족하면 iter_brfss 로 한 해씩 처리한다.
+
+    Returns:
+        pd.DataFrame: 선택한 연도를 합친 데이터프레임
+    """
+    parts = dict(iter_brfss(years, columns, where, root, compact))
+    if not parts:
+        return pd.DataFrame(columns=columns)
+    return pd.concat(parts, names=["YEAR", None])
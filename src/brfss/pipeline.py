@@ -0,0 +1,212 @@
+# BRFSS 전처리 단계 실행기 (컬럼 단위 캐시)
+# src/brfss/pipeline.py
+#
+# preprocessVer2.00 → 2.01 → 3.01 → 컬럼 삭제 로 이어지던 수동 스크립트 체인을
+# 단계(stage) DAG 로 정의하고, (단계, 컬럼) 마다 결과를 캐시한다.
+#   raw    : 원본 CSV/XPT 의 컬럼 (preprocessVer2.00)
+#   clean  : 빈칸 → NaN, 숫자형 변환 (preprocessVer2.01)
+#   recode : spec.py 규칙으로 재코딩 (preprocessVer3.01)
+# 마지막에 종속변수를 앞으로 옮기고 삭제 컬럼을 빼서 파일로 쓴다 (캐시하지 않음).
+#
+# 각 (단계, 컬럼) 결과의 지문(fingerprint) = 단계 코드 + 그 컬럼 규칙 + 입력 지문
+# (원본은 파일 경로/크기/수정 시각). 규칙 하나를 고치면 그 규칙 컬럼의 지문만 바뀌므로
+# 그 컬럼만 다시 계산하고 나머지는 캐시에서 읽는다.
+# 캐시 파일 이름에 지문이 들어가 있어서 예전 결과가 잘못 재사용되는 일은 없다.
+
+import hashlib
+import inspect
+import json
+import os
+from graphlib import TopologicalSorter
+
+import numpy as np
+import pandas as pd
+
+from src.brfss import recode
+from src.brfss.recode import TARGET_COLS, bound_variable, compile_spec
+from src.brfss.spec import RECODE_SPEC
+from src.brfss.store import write_store
+from src.brfss.xpt import read_xpt, xpt_columns
+from src.common.config import BRFSS_COLUMNS, BRFSS_DROP_COLUMNS, DATA_DIR
+from src.common.profile import profile_frame, write_profile
+from src.common.sample import stratified_indices
+
+PIPELINE_CACHE = os.path.join(DATA_DIR, ".cache", "pipeline")
+
+
+def clean_column(series):
+    """빈칸(공백 문자열)을 NaN 으로 바꾸고 숫자형으로 (preprocessVer2.01 + CSV 재로딩과 동일)."""
+    if series.dtype == object:
+        series = pd.to_numeric(series.replace(r'^\s*$', np.nan, regex=True))
+    return series
+
+
+def _hash(*parts):
+    return hashlib.sha1("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+def _rule_key(rule):
+    return json.dumps(rule, sort_keys=True, default=str)
+
+
+def build_stages(spec=RECODE_SPEC):
+    """
+    단계 DAG 를 만든다.
+
+    Args:
+        spec (dict): {컬럼명: 재코딩 규칙}
+
+    Returns:
+        dict: {단계 이름: {'deps': 선행 단계 목록, 'func': (컬럼명, 입력 Series...) -> Series,
+                           'key': 컬럼명 -> 지문에 넣을 문자열}}
+    """
+    recode_frame, _ = compile_spec(spec)
+    recode_code = _hash(inspect.getsource(recode))
+
+    def recode_column(col, series):
+        return recode_frame(pd.DataFrame({col: series}))[col]
+
+    return {
+        'raw': {'deps': [], 'func': None, 'key': lambda col: ''},
+        'clean': {
+            'deps': ['raw'],
+            'func': lambda col, series: clean_column(series),
+            'key': lambda col: inspect.getsource(clean_column),
+        },
+        'recode': {
+            'deps': ['clean'],
+            'func': recode_column,
+            'key': lambda col: recode_code + _rule_key(spec.get(col, {'type': 'none'})),
+        },
+    }
+
+
+def _source_key(path):
+    stat = os.stat(path)
+    return f"{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime_ns}"
+
+
+def _cache_path(cache_dir, stage, col, fp):
+    return os.path.join(cache_dir, stage, f"{col}.{fp[:16]}.npy")
+
+
+def _save(path, series):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp.npy"
+    np.save(tmp, series.to_numpy(), allow_pickle=series.dtype == object)
+    os.replace(tmp, path)
+
+
+def _load(path):
+    # 이 실행기가 직접 쓴 파일만 읽는다 (object 컬럼은 pickle)
+    return pd.Series(np.load(path, allow_pickle=True))
+
+
+def _read_raw(src, cols, rows=None):
+    if not cols:
+        return {}
+    # CDC 원본 XPT 는 CSV 로 바꾸지 않고 필요한 컬럼만 바로 읽는다
+    is_xpt = src.lower().endswith(".xpt")
+    header = xpt_columns(src) if is_xpt else pd.read_csv(src, nrows=0).columns
+    present = [col for col in cols if col in header]
+    if is_xpt:
+        df = read_xpt(src, present or [header[0]])
+    else:
+        df = pd.read_csv(src, usecols=present or [header[0]])
+    if rows is not None:
+        df = df.iloc[rows].reset_index(drop=True)
+    # 원본에 없는 컬럼은 빈 컬럼 (stream.preprocess_chunk 의 reindex 와 동일)
+    return {col: df[col] if col in present else pd.Series(np.full(len(df), np.nan)) for col in cols}
+
+
+def _sample_rows(src, sample, seed):
+    # 원본 타깃 코드 조합으로 층화한 표본 행 위치
+    # 빈칸(' ')은 NaN 으로 바꾼 숫자 코드로 층을 나눈다 (clean 단계와 같음)
+    targets = pd.DataFrame({col: clean_column(series) for col, series in _read_raw(src, TARGET_COLS).items()})
+    return stratified_indices(targets, sample / 100, seed)
+
+
+def run_pipeline(src, dst, cache_dir=PIPELINE_CACHE, spec=RECODE_SPEC,
+                 columns=BRFSS_COLUMNS, drop=BRFSS_DROP_COLUMNS, sample=None, seed=42, verbose=True):
+    """
+    원본 CSV(또는 XPT) 에서 ver18 결과 파일을 만든다. 캐시에 있는 (단계, 컬럼) 결과는 다시 계산하지 않는다.
+
+    Args:
+        src (str): 원본 CSV 또는 XPT 경로 (예: data/BRFSS_2015.csv, data/LLCP2015.XPT)
+        dst (str): 결과 경로. .parquet 이면 컬럼 저장소(store.write_store), 아니면 CSV
+        cache_dir (str): 컬럼 캐시 폴더
+        spec (dict): 재코딩 규칙
+        columns (list): 남길 원본 컬럼 (순서 포함)
+        drop (list): 재코딩 후 삭제할 컬럼
+        sample (float): 개발용 표본 비율 (%). 원본 타깃 코드로 층화한 행만 처리한다
+            (표본 결과는 지문이 달라서 전체 결과 캐시와 섞이지 않는다)
+        seed (int): 표본 시드
+        verbose (bool): 단계별 계산/재사용 수 출력 여부
+
+    Returns:
+        dict: {단계 이름: (다시 계산한 컬럼 수, 캐시에서 읽은 컬럼 수)}
+    """
+    stages = build_stages(spec)
+    order = list(TopologicalSorter({name: s['deps'] for name, s in stages.items()}).static_order())
+    final = order[-1]
+
+    # 1) 지문 계산 (데이터는 읽지 않음)
+    source = _source_key(src) + (f"|sample={sample}:{seed}" if sample else "")
+    fps = {}
+    for name in order:
+        stage = stages[name]
+        for col in columns:
+            inputs = [fps[dep, col] for dep in stage['deps']] or [source, col]
+            fps[name, col] = _hash(name, stage['key'](col), *inputs)
+
+    # 2) 최종 단계부터 거꾸로 따라가며 캐시에 없는 (단계, 컬럼) 을 찾는다
+    missing = set()
+
+    def plan(name, col):
+        if (name, col) in missing:
+            return
+        if name != 'raw' and os.path.exists(_cache_path(cache_dir, name, col, fps[name, col])):
+            return
+        missing.add((name, col))
+        for dep in stages[name]['deps']:
+            plan(dep, col)
+
+    for col in columns:
+        plan(final, col)
+
+    # 3) 필요한 원본 컬럼만 한 번에 읽고, 빠진 노드를 위상 순서대로 계산
+    raw_cols = [col for name, col in missing if name == 'raw']
+    rows = _sample_rows(src, sample, seed) if sample and raw_cols else None
+    values = _read_raw(src, raw_cols, rows)
+    values = {('raw', col): series for col, series in values.items()}
+    stats = {name: [0, 0] for name in order if name != 'raw'}
+
+    def get(name, col):
+        if (name, col) not in values:
+            path = _cache_path(cache_dir, name, col, fps[name, col])
+            if (name, col) in missing:
+                inputs = [get(dep, col) for dep in stages[name]['deps']]
+                series = stages[name]['func'](col, *inputs)
+                _save(path, series)
+                stats[name][0] += 1
+            else:
+                series = _load(path)
+                stats[name][1] += 1
+            values[name, col] = series
+        return values[name, col]
+
+    df = pd.DataFrame({col: get(final, col) for col in columns})
+    values.clear()
+
+    # 4) 종속변수를 앞으로, 삭제 컬럼 제외 후 저장
+    df = bound_variable(df).drop(columns=drop)
+    if dst.endswith(".parquet"):
+        write_store(df, dst)
+    else:
+        df.to_csv(dst, index=False)
+        write_profile(profile_frame(df), dst)
+
+    if verbose:
+        for name, (computed, reused) in stats.items():
+            print(f"[{name}] 계산 {computed}개 / 캐시 {reused}개")
+    return {name: tuple(counts) for name, counts in stats.items()}
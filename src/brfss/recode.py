@@ -0,0 +1,459 @@
+# BRFSS 재코딩 벡터 엔진 파일
+# src/brfss/recode.py
+#
+# preprocess/preprocessVer3.01.py 의 규칙 함수(target01 ~ categorical)를
+# 셀 단위 Series.apply 대신 컬럼 단위 NumPy 연산으로 다시 구현한 것.
+# 함수 이름과 시그니처(df -> df)는 그대로 두어서 바로 바꿔 끼울 수 있게 했다.
+#
+# 규칙 내용은 src/brfss/spec.py 에만 있고, 여기서는 규칙을 한 번 컴파일해서
+#   - compile_batch  : 컬럼 배열용 NumPy 커널
+#   - compile_scalar : 값 하나용 파이썬 함수
+# 를 만든다. 두 커널은 같은 규칙에서 나오므로 학습 데이터와 예측 입력의 재코딩이 어긋나지 않는다.
+#
+# apply 결과와 바이트 단위로 같아야 하므로, 각 셀이 apply 에서 어떤 파이썬 값으로
+# 나왔을지(int / float / None)를 kind 배열로 같이 들고 다닌다.
+#   - 전부 int    -> int64
+#   - 전부 None   -> object(None)
+#   - 그 외       -> float64 (None 은 NaN)
+# 빈 컬럼은 apply 와 마찬가지로 원래 dtype 을 유지한다.
+
+import math
+
+import numpy as np
+from pandas.api.types import is_float_dtype, is_integer_dtype
+
+from src.brfss.spec import FAMILIES, RECODE_SPEC
+
+# 셀 값 종류 (apply 가 돌려줬을 파이썬 타입)
+_INT, _FLOAT, _NONE = 0, 1, 2
+
+# 입력값을 그대로 돌려준다는 표시 (categorical, Integer_conversion05)
+_KEEP = object()
+
+TARGET_COLS = ['BPHIGH4', 'CVDCRHD4', 'CVDSTRK3', 'CHCKIDNY', 'DIABETE3']
+
+
+# ---------- 공통 도구 ----------
+
+def _column_values(series):
+    """
+    컬럼을 float64 배열로 꺼낸다.
+
+    Args:
+        series (pd.Series): int 또는 float 컬럼
+
+    Returns:
+        tuple: (values, is_int)
+            - values (np.ndarray): float64 값 배열 (빈칸 = NaN)
+            - is_int (bool): 원래 컬럼이 정수형이었는지 여부
+    """
+    if is_integer_dtype(series.dtype) and series.dtype != bool:
+        return series.to_numpy(dtype=np.float64), True
+    if is_float_dtype(series.dtype):
+        return series.to_numpy(dtype=np.float64, na_value=np.nan), False
+    raise TypeError(f"[{series.name}] 숫자형 컬럼만 처리할 수 있습니다 (dtype={series.dtype})")
+
+
+def _result_dtype(kind):
+    """kind 배열을 보고 apply 가 만들었을 dtype 종류('i' / 'O' / 'f')를 돌려준다."""
+    if (kind == _INT).all():
+        return 'i'
+    if (kind == _NONE).all():
+        return 'O'
+    return 'f'
+
+
+def _finalize(out, kind, dtype=None):
+    """kind 배열(또는 미리 구한 dtype 종류)을 보고 apply 와 같은 dtype 의 결과 배열을 만든다."""
+    dtype = dtype or _result_dtype(kind)
+    if dtype == 'i':
+        return out.astype(np.int64)
+    if dtype == 'O':
+        return np.full(out.shape, None, dtype=object)
+    return out
+
+
+def _put(out, kind, where, value, x, is_int):
+    """where 위치에 value 를 채운다. value 는 int / None / np.nan / _KEEP / (배열, kind)."""
+    if value is _KEEP:
+        out[where] = x[where]
+        kind[where] = _INT if is_int else _FLOAT
+    elif isinstance(value, tuple):
+        arr, k = value
+        out[where] = arr[where]
+        kind[where] = k
+    elif value is None:
+        out[where] = np.nan
+        kind[where] = _NONE
+    elif isinstance(value, float):
+        out[where] = value
+        kind[where] = _FLOAT
+    else:
+        out[where] = value
+        kind[where] = _INT
+
+
+def _select(x, is_int, clauses, default=None):
+    """
+    if/elif 체인을 마스크 연산으로 옮긴 것. 먼저 맞은 조건이 이긴다.
+
+    Args:
+        x (np.ndarray): float64 입력값
+        is_int (bool): 입력 컬럼이 정수형이었는지 여부
+        clauses (list): (조건 마스크, 결과값) 목록
+        default: 어느 조건에도 맞지 않을 때의 결과값 (기본 None)
+
+    Returns:
+        tuple: (out, kind)
+    """
+    out = np.empty_like(x)
+    kind = np.empty(x.shape, dtype=np.int8)
+    todo = np.ones(x.shape, dtype=bool)
+    for mask, value in clauses:
+        hit = mask & todo
+        _put(out, kind, hit, value, x, is_int)
+        todo &= ~hit
+    _put(out, kind, todo, default, x, is_int)
+    return out, kind
+
+
+def _between(x, lo, hi):
+    return (x >= lo) & (x <= hi)
+
+
+def _code_kernel(table, null=None, other=None):
+    """
+    작은 정수 설문 코드용 룩업 배열 커널을 만든다.
+
+    Args:
+        table (dict): {코드: 결과값}. 결과값은 int / None / np.nan
+        null: 빈칸(NaN)일 때의 결과값 (None 이면 other 와 같이 처리)
+        other: table 에 없는 값일 때의 결과값 (_KEEP 이면 원래 값 유지)
+
+    Returns:
+        function: (x, is_int) -> (out, kind)
+    """
+    size = max(table, default=-1) + 1
+    # 마지막 칸은 table 에 없는 값 자리
+    values = np.full(size + 1, np.nan)
+    kinds = np.full(size + 1, _NONE, dtype=np.int8)
+    known = np.zeros(size + 1, dtype=bool)
+    dummy = np.zeros(size + 1)
+    for code, value in table.items():
+        _put(values, kinds, np.array([code]), value, dummy, False)
+        known[code] = True
+    if other is not _KEEP:
+        _put(values, kinds, ~known, other, dummy, False)
+
+    def kernel(x, is_int):
+        valid = (x >= 0) & (x < size) & (np.floor(x) == x)
+        idx = np.where(valid, x, size).astype(np.intp)
+        out = values[idx]
+        kind = kinds[idx]
+        if other is _KEEP:
+            _put(out, kind, ~known[idx], _KEEP, x, is_int)
+        if null is not None:
+            _put(out, kind, np.isnan(x), null, x, is_int)
+        return out, kind
+
+    return kernel
+
+
+def _apply(df, col, kernel):
+    """df 에 col 이 있으면 kernel 을 돌려 결과를 덮어쓴다."""
+    if col in df.columns:
+        x, is_int = _column_values(df[col])
+        if len(x) == 0:
+            return df
+        with np.errstate(invalid='ignore'):
+            out, kind = kernel(x, is_int)
+        df[col] = _finalize(out, kind)
+    return df
+
+
+# ---------- 규칙 컴파일 ----------
+
+def _code_table(rule):
+    table = dict(rule['map'])
+    table.update({code: rule['unknown_value'] for code in rule['unknown']})
+    return table
+
+
+def compile_batch(rule):
+    """
+    규칙 하나를 컬럼 배열용 NumPy 커널로 만든다.
+
+    Args:
+        rule (dict): src/brfss/spec.py 의 규칙
+
+    Returns:
+        function: (x, is_int) -> (out, kind). 'raw' 규칙이면 None
+    """
+    kind = rule['type']
+    if kind == 'raw':
+        return None
+
+    if kind == 'code':
+        other = _KEEP if rule['other'] == 'keep' else rule['other']
+        return _code_kernel(_code_table(rule), null=rule['null'], other=other)
+
+    if kind == 'units':
+        def units_kernel(x, is_int):
+            # 원본은 int(value) 로 자른 뒤 비교한다
+            t = np.trunc(x)
+            r = np.mod(t, 100)
+            clauses = [
+                (np.isnan(x), np.nan),
+                (np.isin(t, rule['unknown']), -1),
+                (np.isin(t, rule['zero']), 0),
+            ]
+            for lo, hi, mul, div in rule['bands']:
+                # round() 와 np.rint 모두 .5 를 짝수 쪽으로 반올림한다
+                value = r * mul if div == 1 else np.rint(r * mul / div)
+                clauses.append((_between(t, lo, hi), (value, _INT)))
+            return _select(x, is_int, clauses, default=np.nan)
+        return units_kernel
+
+    if kind == 'hhmm':
+        def hhmm_kernel(x, is_int):
+            t = np.trunc(x)
+            minutes = np.floor_divide(t, 100) * 60 + np.mod(t, 100)
+            return _select(x, is_int, [
+                (np.isnan(x) | np.isinf(x), np.nan),
+                (np.isin(t, rule['unknown']), -1),
+                (np.isin(t, rule['zero']), 0),
+            ], default=(minutes, _INT))
+        return hhmm_kernel
+
+    if kind == 'int':
+        def int_kernel(x, is_int):
+            # 범위 비교는 원래 값으로 하고, 돌려줄 때만 int() 로 자른다
+            if rule['range'] is None:
+                in_range = ~np.isnan(x)
+            else:
+                in_range = _between(x, *rule['range'])
+            range_clause = (in_range, _KEEP if rule['keep'] else (np.trunc(x), _INT))
+            clauses = [
+                (np.isin(x, rule['zero']), 0),
+                (np.isin(x, rule['unknown']), -1),
+            ]
+            if rule['range_first']:
+                clauses.insert(0, range_clause)
+            else:
+                clauses.append(range_clause)
+            return _select(x, is_int, [(np.isnan(x), np.nan)] + clauses)
+        return int_kernel
+
+    raise ValueError(f"알 수 없는 규칙 종류입니다: {kind}")
+
+
+def _is_null(value):
+    return value is None or value != value
+
+
+def compile_scalar(rule):
+    """
+    규칙 하나를 값 하나용 함수로 만든다. 결과는 배치 커널의 셀 값과 같다.
+
+    Args:
+        rule (dict): src/brfss/spec.py 의 규칙
+
+    Returns:
+        function: value -> int / float / None
+    """
+    kind = rule['type']
+
+    if kind == 'raw':
+        return lambda value: value
+
+    if kind == 'code':
+        table = _code_table(rule)
+        keep = rule['other'] == 'keep'
+        other, null = rule['other'], rule['null']
+
+        def convert(value):
+            if null is not None and _is_null(value):
+                return null
+            if value in table:
+                return table[value]
+            return value if keep else other
+        return convert
+
+    if kind in ('units', 'hhmm'):
+        unknown, zero, bands = set(rule['unknown']), set(rule['zero']), rule.get('bands', [])
+
+        def convert(value):
+            if _is_null(value):
+                return np.nan
+            try:
+                value = int(value)
+            except (OverflowError, ValueError):
+                return np.nan
+            if value in unknown:
+                return -1
+            if value in zero:
+                return 0
+            if kind == 'hhmm':
+                return value // 100 * 60 + value % 100
+            for lo, hi, mul, div in bands:
+                if lo <= value <= hi:
+                    r = value % 100
+                    return r * mul if div == 1 else int(round(r * mul / div))
+            return np.nan
+        return convert
+
+    if kind == 'int':
+        unknown, zero = set(rule['unknown']), set(rule['zero'])
+        lo, hi = rule['range'] or (-math.inf, math.inf)
+
+        def convert(value):
+            if _is_null(value):
+                return np.nan
+            in_range = lo <= value <= hi
+            if rule['range_first'] and in_range:
+                return value if rule['keep'] else int(value)
+            if value in zero:
+                return 0
+            if value in unknown:
+                return -1
+            if in_range:
+                return value if rule['keep'] else int(value)
+            return None
+        return convert
+
+    raise ValueError(f"알 수 없는 규칙 종류입니다: {kind}")
+
+
+def compile_spec(spec):
+    """
+    컬럼별 규칙 전체를 배치 함수와 단건 함수로 컴파일한다.
+
+    Args:
+        spec (dict): {컬럼명: 규칙}
+
+    Returns:
+        tuple: (recode_frame, recode_record)
+            - recode_frame (function): df -> df. 규칙이 있는 컬럼을 제자리에서 재코딩
+            - recode_record (function): (dict, human_units=False) -> dict. 입력 한 건 재코딩
+    """
+    batch = {col: compile_batch(rule) for col, rule in spec.items() if rule['type'] != 'raw'}
+    scalar = {col: compile_scalar(rule) for col, rule in spec.items()}
+    # 고정소수점 컬럼: (배율, 배율을 곱하지 않는 특수 코드)
+    scales = {
+        col: (rule['scale'], set(rule.get('unknown', [])) | set(rule.get('zero', [])))
+        for col, rule in spec.items() if rule.get('scale')
+    }
+
+    def recode_frame(df):
+        for col, kernel in batch.items():
+            _apply(df, col, kernel)
+        return df
+
+    def recode_record(record, human_units=False):
+        """
+        입력 한 건을 학습 데이터와 같은 규칙으로 재코딩한다.
+
+        Args:
+            record (dict): {컬럼명: 설문 원본 코드}. 빈칸은 None 또는 NaN
+            human_units (bool): True 면 WTKG3(kg) 처럼 고정소수점 컬럼을
+                사람이 읽는 단위로 받아 scale 을 곱한 뒤 재코딩한다
+
+        Returns:
+            dict: {컬럼명: 재코딩 값}. 규칙이 없는 컬럼은 그대로, 빈칸은 NaN
+        """
+        out = {}
+        for col, value in record.items():
+            if human_units and col in scales and not _is_null(value):
+                scale, specials = scales[col]
+                if value not in specials:
+                    value = round(value * scale)
+            convert = scalar.get(col)
+            if convert is not None:
+                value = convert(value)
+            out[col] = np.nan if value is None else value
+        return out
+
+    return recode_frame, recode_record
+
+
+# 모듈을 불러올 때 한 번만 컴파일한다
+recode_frame, recode_record = compile_spec(RECODE_SPEC)
+
+
+# ---------- preprocessVer3.01.py 와 같은 이름의 규칙 함수 ----------
+
+def _family(name):
+    kernels = {col: compile_batch(rule) for col, rule in FAMILIES[name].items()}
+
+    def rule(df):
+        for col, kernel in kernels.items():
+            _apply(df, col, kernel)
+        return df
+
+    rule.__name__ = rule.__qualname__ = name
+    return rule
+
+
+target01 = _family('target01')
+target02 = _family('target02')
+
+yesno01 = _family('yesno01')
+yesno02 = _family('yesno02')
+yesno03 = _family('yesno03')
+yesno04 = _family('yesno04')
+yesno06 = _family('yesno06')
+yesno07 = _family('yesno07')
+
+Unit_integration01 = _family('Unit_integration01')
+Unit_integration02 = _family('Unit_integration02')
+Unit_integration03 = _family('Unit_integration03')
+Unit_integration04 = _family('Unit_integration04')
+Unit_integration05 = _family('Unit_integration05')
+Unit_integration06 = _family('Unit_integration06')
+
+Integer_conversion01 = _family('Integer_conversion01')
+Integer_conversion02 = _family('Integer_conversion02')
+Integer_conversion03 = _family('Integer_conversion03')
+Integer_conversion04 = _family('Integer_conversion04')
+Integer_conversion05 = _family('Integer_conversion05')
+Integer_conversion06 = _family('Integer_conversion06')
+Integer_conversion07 = _family('Integer_conversion07')
+Integer_conversion08 = _family('Integer_conversion08')
+Integer_conversion11 = _family('Integer_conversion11')
+Integer_conversion14 = _family('Integer_conversion14')
+Integer_conversion16 = _family('Integer_conversion16')
+Integer_conversion17 = _family('Integer_conversion17')
+
+categorical = _family('categorical')
+
+# 전처리 순서 (preprocessVer3.01.py 의 preprocess_data 와 동일)
+RULES = [
+    target01, target02,
+    yesno01, yesno02, yesno03, yesno04, yesno06, yesno07,
+    Unit_integration01, Unit_integration02, Unit_integration03,
+    Unit_integration04, Unit_integration05, Unit_integration06,
+    Integer_conversion01, Integer_conversion02, Integer_conversion03,
+    Integer_conversion04, Integer_conversion05, Integer_conversion06,
+    Integer_conversion07, Integer_conversion08, Integer_conversion11,
+    Integer_conversion14, Integer_conversion16, Integer_conversion17,
+    categorical,
+]
+
+
+def bound_variable(df):
+    other_cols = [col for col in df.columns if col not in TARGET_COLS]
+    return df[TARGET_COLS + other_cols]
+
+
+def preprocess_data(df):
+    """
+    preprocessVer3.01.py 의 preprocess_data 와 같은 결과를 컬럼 단위 연산으로 만든다.
+
+    Args:
+        df (pd.DataFrame): BRFSS_2015ver11.csv 를 읽은 데이터프레임
+
+    Returns:
+        pd.DataFrame: 재코딩 후 종속변수를 앞으로 옮긴 데이터프레임
+    """
+    df = recode_frame(df)
+    return bound_variable(df)
@@ -0,0 +1,83 @@
+# BRFSS 전처리 결과 컬럼 스키마 파일
+# src/brfss/schema.py
+#
+# src/brfss/spec.py 의 규칙에서 재코딩 결과 값의 범위를 계산해서
+# 컬럼별로 가장 작은 dtype 을 정한다. (예: 예/아니오 → int8, 월간 횟수 → int16)
+# 실제 줄이기는 src/common/schema.py 의 compact_frame 이 한다.
+
+import math
+
+import numpy as np
+
+from src.brfss.spec import RECODE_SPEC
+from src.common.schema import compact_frame, int_dtype
+
+# 범주형 원본 코드는 두 자리 이하 (코드북 기준)
+KEPT_CODE_MAX = 99
+# 범위가 없는 정수 규칙(EXRACT11, DROCDY3_ 등)의 값 상한
+OPEN_INT_MAX = 32767
+
+# 재코딩 없이 그대로 쓰는 컬럼의 dtype
+RAW_DTYPES = {
+    '_BMI5': np.int16,
+    'HTM4': np.int16,
+    'PADUR1_': np.int16,
+    'PADUR2_': np.int16,
+    '_FRUTSUM': np.int32,
+    '_VEGESUM': np.int32,
+    '_MINAC11': np.int32,
+    '_MINAC21': np.int32,
+    'PAMIN11_': np.int32,
+    'PAMIN21_': np.int32,
+    'PAVIG11_': np.int32,
+    'PAVIG21_': np.int32,
+}
+
+
+def _number(value):
+    return isinstance(value, (int, float)) and not math.isnan(value)
+
+
+def rule_dtype(rule):
+    """
+    규칙 결과 값이 들어가는 가장 작은 dtype.
+
+    Args:
+        rule (dict): spec.py 의 규칙
+
+    Returns:
+        np.dtype: int8 / int16 / int32 / float32
+    """
+    kind = rule['type']
+    values = [0]
+    if rule.get('unknown'):
+        values.append(rule.get('unknown_value', -1))
+
+    if kind == 'code':
+        values += list(rule['map'].values()) + [rule['null']]
+        if rule['other'] == 'keep':
+            values.append(KEPT_CODE_MAX)
+        else:
+            values.append(rule['other'])
+    elif kind == 'units':
+        values += [99 * mul / div for lo, hi, mul, div in rule['bands']]
+    elif kind == 'hhmm':
+        values.append(9 * 60 + 59)
+    elif kind == 'int':
+        if rule['keep']:
+            return np.dtype(np.float32)
+        values += list(rule['range']) if rule['range'] else [OPEN_INT_MAX]
+
+    values = [v for v in values if _number(v)]
+    return int_dtype(math.floor(min(values)), math.ceil(max(values)))
+
+
+BRFSS_SCHEMA = {
+    col: np.dtype(RAW_DTYPES[col]) if rule['type'] == 'raw' else rule_dtype(rule)
+    for col, rule in RECODE_SPEC.items()
+}
+
+
+def compact_brfss(df):
+    """전처리된 BRFSS 데이터프레임을 BRFSS_SCHEMA 로 줄인다."""
+    return compact_frame(df, BRFSS_SCHEMA)
@@ -0,0 +1,271 @@
+# BRFSS LightGBM 하이퍼파라미터 검색 파일
+# src/brfss/search.py
+#
+# train_lgbm_optuna(check).py / jjjj.py 의 learning_rate, num_leaves, max_depth 등은
+# 손으로 고치고 다시 실행해서 맞췄다. 여기서는 Optuna 로 타깃 5개를 같이 튜닝한다.
+#   - 작업자 프로세스 여러 개가 같은 스터디에서 동시에 시행(trial)을 돈다.
+#     학습 행렬은 메모리 맵 캐시(src/common/cache.py), binning 한 Dataset 은 .bin 캐시라
+#     작업자마다 다시 만들지 않고 OS 페이지 캐시의 한 벌을 같이 읽는다.
+#   - 스터디는 로컬 SQLite 파일(data/.cache/search.db)에 저장돼서 멈췄다가 이어서 돌리거나
+#     시행을 더 붙일 수 있다.
+#   - successive halving: 시행마다 학습 행의 1/9 → 1/3 → 전부 순서로 학습하고, 단계마다
+#     검증 AUC(타깃 5개 평균)를 보고해서 같은 단계의 다른 시행보다 나쁘면 바로 멈춘다(가지치기).
+#   - 트리 수는 찾지 않고 상한(MAX_TREES)까지 조기 종료로 정한다 (src/common/multitarget.py).
+# 검증 행은 학습 행에서 떼어낸 10% (validation_rows) 이고 평가 행은 건드리지 않는다.
+#
+# multi_objective=True 면 AUC 만 보지 않고 배포 비용도 같이 잰다 (OBJECTIVE_NAMES).
+#   AUC(타깃 5개 평균, 타깃별 값은 user_attrs['auc']) ↑, 한 행 예측 시간 ↓,
+#   1,000행 예측 시간 ↓, 직렬화한 모델 크기 ↓ → 스터디의 best_trials 가 파레토 프런트다.
+#   트리 수 상한도 찾는다. Optuna 는 다목적 스터디의 가지치기를 지원하지 않아서
+#   이때는 단계 없이 학습 행 전부로 한 번 학습한다.
+#   시간은 작업자끼리 CPU 를 나눠 쓰면 흔들리므로 --workers 1 로 재는 것이 정확하다.
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import optuna
+
+from src.brfss.handoff import load_training
+from src.common.config import DATA_DIR
+from src.common.multitarget import MultiTargetLGBM, validation_rows
+from src.common.sample import stratified_indices
+
+SEARCH_DB = os.path.join(DATA_DIR, ".cache", "search.db")
+
+# 단계별 학습 행 비율 = 단계 / RUNGS[-1] (1/9, 1/3, 1). 가지치기는 단계마다 상위 1/3 만 남긴다
+RUNGS = (1, 3, 9)
+REDUCTION_FACTOR = 3
+MAX_TREES = 1000
+
+# 다목적 검색의 목적 (이름, 방향)
+OBJECTIVE_NAMES = ['auc', 'latency_ms', 'batch_latency_ms', 'size_kb']
+OBJECTIVE_DIRECTIONS = ['maximize', 'minimize', 'minimize', 'minimize']
+LATENCY_REPEATS = 50
+BATCH_ROWS = 1000
+BATCH_REPEATS = 5
+# 예측 시간은 배포할 때처럼 스레드 수를 고정해서 잰다 (학습 스레드 수와 상관없이)
+SERVING_THREADS = 1
+
+# 시행마다 같은 값 (검색하지 않음)
+FIXED_PARAMS = dict(
+    objective='binary',
+    metric='auc',
+    n_estimators=MAX_TREES,
+    subsample_freq=1,
+    # min_child_samples 를 바꿔도 binning 한 Dataset 을 그대로 쓰도록
+    feature_pre_filter=False,
+    verbose=-1,
+)
+
+
+def suggest_params(trial):
+    """시행 하나의 LightGBM 파라미터 (jjjj.py 에서 손으로 고치던 것들)."""
+    return dict(
+        learning_rate=trial.suggest_float('learning_rate', 0.01, 0.3, log=True),
+        num_leaves=trial.suggest_int('num_leaves', 15, 255, log=True),
+        max_depth=trial.suggest_int('max_depth', 3, 12),
+        min_child_samples=trial.suggest_int('min_child_samples', 5, 300, log=True),
+        subsample=trial.suggest_float('subsample', 0.5, 1.0),
+        colsample_bytree=trial.suggest_float('colsample_bytree', 0.3, 1.0),
+        reg_alpha=trial.suggest_float('reg_alpha', 1e-3, 10.0, log=True),
+        reg_lambda=trial.suggest_float('reg_lambda', 1e-3, 10.0, log=True),
+    )
+
+
+def _storage(path):
+    # 작업자 여러 개가 같은 SQLite 파일에 쓰므로 잠금을 기다리는 시간을 넉넉히,
+    # heartbeat: 작업자가 죽어서 RUNNING 으로 남은 시행은 이어서 돌릴 때 FAIL 로 정리된다
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    return optuna.storages.RDBStorage(
+        f"sqlite:///{os.path.abspath(path)}",
+        engine_kwargs={'connect_args': {'timeout': 120}},
+        heartbeat_interval=60,
+    )
+
+
+def _pruner():
+    return optuna.pruners.SuccessiveHalvingPruner(min_resource=RUNGS[0], reduction_factor=REDUCTION_FACTOR)
+
+
+def rung_rows(y, fit_rows, rung, seed=42):
+    """
+    단계 rung 에서 학습할 행 위치 (fit_rows 중 rung / RUNGS[-1] 만큼, 타깃 y 로 층화).
+    같은 단계의 시행들은 같은 행을 쓴다.
+    """
+    if rung >= RUNGS[-1]:
+        return fit_rows
+    picked = stratified_indices(y.iloc[fit_rows], rung / RUNGS[-1], seed=seed + rung)
+    return np.sort(fit_rows[picked])
+
+
+def _objective(trial, X, y, categorical_feature, dataset_key, validation, fit_rows, threads, seed):
+    params = dict(FIXED_PARAMS, random_state=seed, n_jobs=threads, **suggest_params(trial))
+    score = None
+    for rung in RUNGS:
+        model = MultiTargetLGBM(**params).fit(
+            X, y, categorical_feature=categorical_feature, dataset_key=dataset_key,
+            validation=validation, train_rows=rung_rows(y, fit_rows, rung, seed))
+        # 조기 종료한 반복에서의 검증 AUC, 타깃 5개 평균
+        score = float(np.mean([clf.best_score_['valid_0']['auc'] for clf in model.estimators_]))
+        trial.report(score, rung)
+        if trial.should_prune():
+            raise optuna.TrialPruned()
+    trial.set_user_attr('trees', [int(clf.best_iteration_) for clf in model.estimators_])
+    return score
+
+
+def serving_cost(model, rows):
+    """
+    배포할 때 드는 비용: 한 행 / BATCH_ROWS 행 predict_proba 시간(중앙값, ms)과 모델 크기.
+    예측은 SERVING_THREADS 스레드로 한다 (model 의 n_jobs 를 바꾼다).
+
+    Args:
+        model (MultiTargetLGBM): 학습된 모델 (타깃 5개 전부 예측하는 시간을 잰다)
+        rows (np.ndarray): 잴 때 넣을 행 (BATCH_ROWS 행 이상이면 좋다)
+
+    Returns:
+        dict: {'latency_ms', 'batch_latency_ms', 'size_kb'}
+    """
+    rows = np.ascontiguousarray(rows, dtype=np.float32)
+    for clf in model.estimators_:
+        clf.set_params(n_jobs=SERVING_THREADS)
+    model.predict_proba(rows[:1])  # 처음 한 번은 준비 시간이 섞여서 버린다
+
+    def median_ms(batch, repeats):
+        times = []
+        for i in range(repeats):
+            start = time.perf_counter()
+            model.predict_proba(batch(i))
+            times.append(time.perf_counter() - start)
+        return float(np.median(times)) * 1000
+
+    return {
+        'latency_ms': median_ms(lambda i: rows[i % len(rows)][None, :], LATENCY_REPEATS),
+        'batch_latency_ms': median_ms(lambda i: rows[:BATCH_ROWS], BATCH_REPEATS),
+        'size_kb': sum(len(clf.booster_.model_to_string()) for clf in model.estimators_) / 1024,
+    }
+
+
+def _multi_objective(trial, X, y, categorical_feature, dataset_key, validation, fit_rows, threads, seed):
+    # 트리 수 상한도 찾고(예측 시간과 크기에 바로 걸림), 학습 행 전부로 한 번 학습
+    params = dict(FIXED_PARAMS, random_state=seed, n_jobs=threads, **suggest_params(trial))
+    params['n_estimators'] = trial.suggest_int('n_estimators', 20, MAX_TREES, log=True)
+    model = MultiTargetLGBM(**params).fit(
+        X, y, categorical_feature=categorical_feature, dataset_key=dataset_key,
+        validation=validation, train_rows=fit_rows)
+    auc = [float(clf.best_score_['valid_0']['auc']) for clf in model.estimators_]
+    cost = serving_cost(model, X[validation[:BATCH_ROWS]])
+    trial.set_user_attr('auc', dict(zip(y.columns, auc)))
+    trial.set_user_attr('trees', [int(clf.best_iteration_) for clf in model.estimators_])
+    return (float(np.mean(auc)), *(cost[name] for name in OBJECTIVE_NAMES[1:]))
+
+
+def _worker(study_name, storage, n_trials, threads, seed, sample, from_raw, multi_objective=False):
+    """작업자 프로세스: 학습 데이터를 (캐시에서) 열고 스터디에 시행 n_trials 개를 더한다."""
+    X_train, _, y_train, _, encoder, dataset_key = load_training(sample, from_raw)
+    validation = validation_rows(y_train, random_state=42)
+    fit_rows = np.setdiff1d(np.arange(len(y_train)), validation)
+    study = optuna.load_study(study_name=study_name, storage=_storage(storage),
+                              sampler=optuna.samplers.TPESampler(seed=seed), pruner=_pruner())
+    objective = _multi_objective if multi_objective else _objective
+    study.optimize(
+        lambda trial: objective(trial, X_train, y_train, encoder.categorical_feature, dataset_key,
+                                validation, fit_rows, threads, 42),
+        n_trials=n_trials)
+    return n_trials
+
+
+def run_search(study_name, n_trials, workers=None, sample=None, from_raw=None, storage=SEARCH_DB, seed=0,
+               multi_objective=False):
+    """
+    스터디를 만들거나(있으면 이어서) 시행 n_trials 개를 작업자 프로세스 여러 개로 돌린다.
+
+    Args:
+        study_name (str): 스터디 이름 (같은 이름으로 다시 부르면 이어서 돈다)
+        n_trials (int): 이번에 더할 시행 수 (작업자끼리 나눈다)
+        workers (int): 작업자 프로세스 수 (None 이면 CPU 수). LightGBM 스레드는 CPU 수 / 작업자 수.
+            multi_objective 면 1 로 고정 (다른 작업자의 학습과 CPU 를 나눠 쓰면 예측 시간이 틀어진다)
+        sample (float): 표본 비율 (%, load_training 과 같음)
+        from_raw (str): 원본 CSV 경로 (load_training 과 같음)
+        storage (str): SQLite 파일 경로
+        seed (int): 샘플러 시드 (작업자마다 seed + 번호)
+        multi_objective (bool): AUC 와 예측 시간/모델 크기를 같이 찾는 다목적 스터디 (OBJECTIVE_NAMES)
+
+    Returns:
+        optuna.Study: 스터디
+    """
+    workers = max(1, min(workers or os.cpu_count() or 1, n_trials))
+    if multi_objective:
+        # 예측 시간은 다른 학습이 돌지 않을 때 재야 하므로 시행을 하나씩 (학습은 CPU 전부로)
+        workers = 1
+    threads = max(1, (os.cpu_count() or 1) // workers)
+    # 작업자들이 캐시를 같이 쓰도록 학습 행렬과 binning 한 Dataset(.bin)을 먼저 한 번 만든다
+    # (작업자마다 첫 시행에서 같은 Dataset 을 동시에 binning 하지 않게. 시행 파라미터가 바뀌어도
+    # FIXED_PARAMS 의 feature_pre_filter=False 덕분에 같은 파일을 쓴다)
+    X_train, _, y_train, _, encoder, dataset_key = load_training(sample, from_raw)
+    MultiTargetLGBM(**FIXED_PARAMS, random_state=42).dataset(
+        X_train, y_train, categorical_feature=encoder.categorical_feature, dataset_key=dataset_key)
+    del X_train, y_train
+    if multi_objective:
+        study = optuna.create_study(study_name=study_name, storage=_storage(storage),
+                                    directions=OBJECTIVE_DIRECTIONS, load_if_exists=True)
+        study.set_metric_names(OBJECTIVE_NAMES)
+    else:
+        optuna.create_study(study_name=study_name, storage=_storage(storage), direction='maximize',
+                            pruner=_pruner(), load_if_exists=True)
+
+    counts = [n_trials // workers + (i < n_trials % workers) for i in range(workers)]
+    if workers == 1:
+        _worker(study_name, storage, n_trials, threads, seed, sample, from_raw, multi_objective)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_worker, study_name, storage, count, threads, seed + i, sample, from_raw,
+                                   multi_objective)
+                       for i, count in enumerate(counts)]
+            for future in futures:
+                future.result()
+    return optuna.load_study(study_name=study_name, storage=_storage(storage))
+
+
+def pareto_front(study):
+    """
+    다목적 스터디의 파레토 프런트 (한 행 예측 시간 순).
+
+    Args:
+        study (optuna.Study): multi_objective=True 로 돌린 스터디
+
+    Returns:
+        list: 시행마다 {'trial', OBJECTIVE_NAMES..., 'auc_by_target', 'trees', 'params'}
+    """
+    front = []
+    for trial in study.best_trials:
+        row = {'trial': trial.number, **dict(zip(OBJECTIVE_NAMES, trial.values))}
+        row.update(auc_by_target=trial.user_attrs.get('auc'), trees=trial.user_attrs.get('trees'),
+                   params=trial.params)
+        front.append(row)
+    return sorted(front, key=lambda row: row['latency_ms'])
+
+
+def pick_trial(study, latency_budget=None):
+    """
+    쓸 시행: 한 목적 스터디는 최고 시행, 다목적 스터디는 파레토 프런트 중
+    한 행 예측 시간이 latency_budget(ms) 안인 것 가운데 AUC 가 가장 높은 시행.
+    """
+    if len(study.directions) == 1:
+        return study.best_trial
+    front = [t for t in study.best_trials if latency_budget is None or t.values[1] <= latency_budget]
+    if not front:
+        raise ValueError(f"한 행 예측 시간이 {latency_budget}ms 안인 시행이 없습니다.")
+    return max(front, key=lambda t: t.values[0])
+
+
+def best_params(study_name, storage=SEARCH_DB, latency_budget=None):
+    """
+    스터디에서 고른 시행(pick_trial)의 파라미터 (MultiTargetLGBM(**params) 로 바로 쓴다).
+    트리 수는 상한(MAX_TREES 또는 다목적 검색에서 찾은 값)이고 학습할 때 검색과 같이
+    검증 AUC 로 조기 종료해서 정한다.
+    """
+    study = optuna.load_study(study_name=study_name, storage=_storage(storage))
+    return dict(FIXED_PARAMS, random_state=42, **pick_trial(study, latency_budget).params)
@@ -0,0 +1,211 @@
+# BRFSS 컬럼별 재코딩 규칙 정의 파일
+# src/brfss/spec.py
+#
+# preprocessVer3.01.py 의 convert 함수들과 학습 스크립트의 feature_desc 설명에
+# 흩어져 있던 코딩 규칙을 컬럼 하나당 규칙 하나(dict)로 모아둔 것.
+# 규칙 자체는 데이터일 뿐이고, src/brfss/recode.py 에서 한 번 컴파일해서
+#   - 데이터프레임용 배치 커널 (학습 데이터 생성)
+#   - dict 한 건용 단건 커널 (대화형/웹 예측 입력)
+# 두 가지로 같이 쓴다.
+#
+# 규칙 종류 ('type')
+#   code  : 작은 정수 코드 → 값 매핑 (종속변수, 예/아니오, 범주형)
+#   units : 101–199 / 201–299 / ... 처럼 백의 자리가 단위인 빈도 → 월간 횟수
+#   hhmm  : 시분(HMM) → 분
+#   int   : 범위 안 정수는 그대로, 0/모름 코드만 바꿈
+#   raw   : 재코딩 없음 (scale 정보만 가짐)
+#
+# 공통 키
+#   unknown : 모름/거부 코드 목록 (→ unknown_value, 기본 -1)
+#   zero    : '없음'을 뜻하는 코드 목록 (→ 0)
+#   scale   : 고정소수점 배율. 저장값 = 실제값 * scale (예: WTKG3 7000 = 70.00kg)
+
+import numpy as np
+
+UNKNOWN_7_9 = [7, 9]
+UNKNOWN_77_99 = [77, 99]
+UNKNOWN_777_999 = [777, 999]
+
+
+def codes(mapping, unknown=(), unknown_value=-1, null=None, other=None):
+    """
+    코드 매핑 규칙.
+
+    Args:
+        mapping (dict): {원본 코드: 결과값}
+        unknown (list): 모름/거부 코드 목록
+        unknown_value: 모름/거부 코드의 결과값 (기본 -1)
+        null: 빈칸일 때 결과값 (None 이면 매핑에 없는 값과 같이 처리)
+        other: 매핑에 없는 값의 결과값. 'keep' 이면 원래 값을 그대로 둔다
+
+    Returns:
+        dict: 규칙
+    """
+    return {'type': 'code', 'map': dict(mapping), 'unknown': list(unknown),
+            'unknown_value': unknown_value, 'null': null, 'other': other}
+
+
+def units(bands, unknown=UNKNOWN_777_999, zero=()):
+    """
+    단위 통합 규칙. bands 는 (하한, 상한, 곱, 나눔) 목록이며
+    범위 안 값은 (값 % 100) * 곱 / 나눔 (나눔이 1이 아니면 반올림) 으로 바꾼다.
+    """
+    return {'type': 'units', 'bands': [tuple(b) for b in bands],
+            'unknown': list(unknown), 'zero': list(zero)}
+
+
+def hhmm(unknown=UNKNOWN_777_999, zero=()):
+    """시분(HMM) → 분 규칙."""
+    return {'type': 'hhmm', 'unknown': list(unknown), 'zero': list(zero)}
+
+
+def integer(lo=None, hi=None, unknown=(), zero=(), keep=False, range_first=False, scale=None):
+    """
+    정수 변환 규칙.
+
+    Args:
+        lo, hi (int): 그대로 두는 범위. None 이면 빈칸이 아닌 모든 값
+        unknown (list): 모름/거부 코드 목록 (→ -1)
+        zero (list): '없음' 코드 목록 (→ 0)
+        keep (bool): True 면 범위 안 값을 int() 없이 그대로 둔다
+        range_first (bool): True 면 범위 검사를 특수 코드보다 먼저 한다
+        scale (int): 고정소수점 배율
+
+    Returns:
+        dict: 규칙
+    """
+    return {'type': 'int', 'range': None if lo is None else (lo, hi),
+            'unknown': list(unknown), 'zero': list(zero),
+            'keep': keep, 'range_first': range_first, 'scale': scale}
+
+
+def raw(scale=None):
+    """재코딩하지 않는 컬럼 (고정소수점 배율만 기록)."""
+    return {'type': 'raw', 'scale': scale}
+
+
+def _same(cols, rule):
+    return {col: rule for col in cols}
+
+
+# 월간 횟수 환산 단위 (백의 자리: 1=일, 2=주, 3=월, 4=년)
+PER_DAY_WEEK_MONTH = [(101, 199, 30, 1), (201, 299, 4, 1), (301, 399, 1, 1)]
+PER_WEEK_MONTH = [(101, 199, 4, 1), (201, 299, 1, 1)]
+PER_YEAR = (401, 499, 1, 12)
+
+
+# ---------- 규칙 묶음 ----------
+# 키는 preprocessVer3.01.py 의 함수 이름이고, 순서도 preprocess_data 실행 순서와 같다.
+
+FAMILIES = {
+    # ---종속변수--- 1,2,4 = 1(Yes), 3 = 0(No), 7,9 = NaN
+    'target01': _same(['BPHIGH4', 'DIABETE3'],
+                      codes({1: 1, 2: 1, 4: 1, 3: 0}, UNKNOWN_7_9, unknown_value=np.nan)),
+    # 1 = 1(Yes), 2 = 0(No), 7,9 = NaN
+    'target02': _same(['CVDCRHD4', 'CVDSTRK3', 'CHCKIDNY'],
+                      codes({1: 1, 2: 0}, UNKNOWN_7_9, unknown_value=np.nan)),
+
+    # ---예/아니오--- 1 = yes, 2 = no, 7,9 = -1, 빈칸 = null
+    'yesno01': _same([
+        'HLTHPLN1', 'MEDCOST', 'BPMEDS', 'BLOODCHO',
+        'TOLDHI2', 'CVDINFR4', 'ASTHMA3', 'ASTHNOW',
+        'CHCSCNCR', 'CHCOCNCR', 'CHCCOPD1',
+        'ADDEPEV2', 'VETERAN3', 'INTERNET', 'QLACTLM2',
+        'USEEQUIP', 'DECIDE', 'DIFFWALK', 'DIFFDRES',
+        'DIFFALON', 'SMOKE100', 'STOPSMK2', 'LMTJOIN3',
+        'ARTHDIS2', 'FLUSHOT6', 'PNEUVAC3', 'HIVTST6', 'PDIABTST',
+        'INSULIN', 'DIABEYE', 'CIMEMLOS',
+        '_RFHLTH', '_HCVU651', '_CHOLCHK',
+        '_DRDXAR1', '_HISPANC', '_RACEG21', '_PASTAE1',
+        '_FLSHOT6', '_PNEUMO2', '_AIDTST3',
+        '_FRTLT1', '_VEGLT1', 'PREGNANT',
+        'EXERANY2', '_MICHD', 'DRNKANY5', '_PAINDX1', '_PASTRNG'
+    ], codes({1: 1, 2: 2}, UNKNOWN_7_9)),
+    # 1 = Yes, 2 = No, 7,9,빈칸 = -1
+    'yesno02': _same(['HAVARTH3'], codes({1: 1, 2: 2}, UNKNOWN_7_9, null=-1)),
+    # 1,2 = 1(Yes), 3 = 2(No), 7,9 = -1
+    'yesno03': _same(['PREDIAB1'], codes({1: 1, 2: 1, 3: 2}, UNKNOWN_7_9)),
+    # 1,2,3 = 1(Yes), 4 = 2(No), 7,9 = -1
+    'yesno04': _same(['TRNSGNDR'], codes({1: 1, 2: 1, 3: 1, 4: 2}, UNKNOWN_7_9)),
+    # 1 = No, 2 = Yes 를 뒤집음, 7,9 = -1
+    'yesno06': _same(['_RFCHOL', '_LTASTH1', '_CASTHM1', '_RFBING5', '_FRUITEX', '_VEGETEX', '_RFDRHV5'],
+                     codes({1: 2, 2: 1}, UNKNOWN_7_9)),
+    # 1 = No, 2 = Yes 를 뒤집음
+    'yesno07': _same(['_RFHYPE5'], codes({1: 2, 2: 1})),
+
+    # ---단위 통합--- (월간 횟수)
+    'Unit_integration01': _same(['BLDSUGAR', 'FEETCHK2'],
+                                units(PER_DAY_WEEK_MONTH + [PER_YEAR], zero=[888])),
+    'Unit_integration02': _same(['EXEROFT1', 'EXEROFT2'], units(PER_WEEK_MONTH)),
+    'Unit_integration03': _same(['EXERHMM1', 'EXERHMM2'], hhmm(zero=[888])),
+    'Unit_integration04': _same(['ALCDAY5'], units(PER_WEEK_MONTH, zero=[888])),
+    'Unit_integration05': _same(['FRUITJU1', 'FRUIT1', 'FVBEANS', 'FVGREEN', 'FVORANG', 'VEGETAB1'],
+                                units(PER_DAY_WEEK_MONTH, zero=[300, 555])),
+    'Unit_integration06': _same(['STRENGTH'], units(PER_WEEK_MONTH, zero=[888])),
+
+    # ---정수 변환---
+    'Integer_conversion01': _same(['PHYSHLTH', 'MENTHLTH', 'POORHLTH'],
+                                  integer(1, 30, UNKNOWN_77_99, zero=[88])),
+    'Integer_conversion02': _same(['JOINPAIN'], integer(0, 10, UNKNOWN_77_99)),
+    'Integer_conversion03': _same(['HIVTSTD3'], integer(11985, 122016, [777777, 999999])),
+    'Integer_conversion04': _same(['DOCTDIAB', 'FEETCHK', 'DRNK3GE5', 'MAXDRNKS', 'AVEDRNK2'],
+                                  integer(1, 76, UNKNOWN_77_99, zero=[88])),
+    'Integer_conversion05': _same(['FC60_'], integer(0, 8590, [99900], keep=True, scale=100)),
+    'Integer_conversion06': _same(['EXRACT11', 'EXRACT21'], integer(unknown=[77, 98, 99], zero=[88])),
+    'Integer_conversion07': _same(['_DRNKWEK'], integer(0, 98999, [99900], scale=100)),
+    'Integer_conversion08': _same(['FTJUDA1_', 'FRUTDA1_', 'BEANDAY_', 'GRENDAY_', 'ORNGDAY_', 'VEGEDA1_'],
+                                  integer(0, 9999, scale=100)),
+    'Integer_conversion11': _same(['PAFREQ1_', 'PAFREQ2_', 'STRFREQ_'],
+                                  integer(0, 98999, [99000], scale=1000)),
+    'Integer_conversion14': _same(['WTKG3'], integer(2300, 29500, [99999], scale=100)),
+    'Integer_conversion16': _same(['DROCDY3_'], integer(unknown=[900], scale=100)),
+    'Integer_conversion17': _same(['CHKHEMO3'],
+                                  integer(1, 76, [77, 98, 99], zero=[88], range_first=True)),
+
+    # ---범주형--- 모름/거부 코드 = -1, 나머지 그대로
+    'categorical': {
+        col: codes({}, unknown, other='keep') for col, unknown in {
+            'GENHLTH': [7, 9],
+            'PERSDOC2': [7, 9],
+            'CHECKUP1': [7, 8, 9],
+            'CHOLCHK': [7, 8, 9],
+            'MARITAL': [9],
+            'EDUCA': [9],
+            'RENTHOM1': [7, 9],
+            'EMPLOY1': [9],
+            'INCOME2': [77, 99],
+            'LASTSMK2': [77, 99],
+            'USENOW3': [7, 9],
+            'ARTHSOCL': [7, 9],
+            'WHRTST10': [77, 99],
+            'SXORIENT': [7, 9],
+            'MSCODE': [],
+            '_ASTHMS1': [9],
+            '_MRACE1': [77, 99],
+            '_RACE': [9],
+            '_INCOMG': [9],
+            'ACTIN11_': [],
+            'ACTIN21_': [],
+            '_PA300R2': [9],
+            '_PAREC1': [9],
+            '_BMI5CAT': [],
+            '_PA150R2': [9],
+            'SEX': [],
+            'SMOKDAY2': [7, 9],
+            '_SMOKER3': [9],
+            '_PACAT1': [9],
+            '_AGEG5YR': []
+        }.items()
+    },
+}
+
+# 재코딩 없이 그대로 쓰는 컬럼
+UNCHANGED = {
+    '_FRUTSUM': raw(100), '_VEGESUM': raw(100), '_BMI5': raw(100), 'HTM4': raw(),
+    'PADUR1_': raw(), 'PADUR2_': raw(), '_MINAC11': raw(), '_MINAC21': raw(),
+    'PAMIN11_': raw(), 'PAMIN21_': raw(), 'PAVIG11_': raw(), 'PAVIG21_': raw(),
+}
+
+# 컬럼 하나당 규칙 하나 (FAMILIES 순서 = 전처리 순서)
+RECODE_SPEC = {col: rule for family in FAMILIES.values() for col, rule in family.items()}
+RECODE_SPEC.update(UNCHANGED)
@@ -0,0 +1,237 @@
+# 전처리 결과 컬럼 저장소 파일
+# src/brfss/store.py
+#
+# 학습 스크립트마다 BRFSS_2015ver18.csv 전체를 read_csv 로 읽은 뒤
+# 타깃이 0/1 이 아닌 행을 버리고 일부 컬럼만 쓰던 것을 Parquet 한 파일로 바꾼다.
+#   - 컬럼 단위로 저장되므로 필요한 컬럼만 읽는다 (columns=)
+#   - 행 그룹마다 컬럼별 최소/최대 통계가 있어서 조건에 안 맞는 행 그룹은
+#     읽지 않고 건너뛴다 (where=)
+#
+# 타깃 5개가 모두 0/1 인 행을 먼저, 나머지 행을 뒤에 (각각 원래 순서대로) 저장하고
+# 그 여부를 _STORE_TARGET_OK 컬럼에 둔다. 그래서 TARGET_FILTER 로 읽으면
+# 뒤쪽 행 그룹은 통계만 보고 통째로 건너뛴다.
+# 원래 행 번호(_STORE_ROW)를 같이 저장해서, 읽은 결과의 인덱스와 행 순서는
+# read_csv 후 같은 조건으로 거른 것과 똑같다.
+
+import hashlib
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pandas.api.types import is_integer_dtype
+
+from src.brfss.recode import TARGET_COLS
+from src.brfss.schema import BRFSS_SCHEMA, compact_brfss
+from src.common.config import BRFSS_STORE, DATA_DIR
+from src.common.profile import PROFILE_SUFFIX, ensure_profile, profile_frame, write_profile
+from src.common.sample import sample_frame, stratified_indices
+from src.common.schema import CompactMatrix, compact_column
+
+ROW_GROUP_SIZE = 50_000
+
+# 개발용 표본 캐시 (--sample)
+SAMPLE_CACHE = os.path.join(DATA_DIR, ".cache", "sample")
+
+# 저장소 내부용 컬럼 (load_brfss 결과에는 나오지 않음)
+ROW_COLUMN = '_STORE_ROW'
+TARGET_OK_COLUMN = '_STORE_TARGET_OK'
+_INTERNAL = [ROW_COLUMN, TARGET_OK_COLUMN]
+
+# 타깃 5개가 모두 0 또는 1 인 행만 (dropna + isin([0, 1]) 과 같음)
+TARGET_FILTER = [(TARGET_OK_COLUMN, '==', True)]
+
+
+def target_mask(df):
+    """타깃 5개가 모두 0 또는 1 인 행이면 True 인 마스크."""
+    cols = [col for col in TARGET_COLS if col in df.columns]
+    return df[cols].isin([0, 1]).all(axis=1).to_numpy()
+
+
+def write_store(df, path=BRFSS_STORE, row_group_size=ROW_GROUP_SIZE):
+    """
+    전처리된 데이터프레임을 Parquet 저장소로 쓰고, 옆에 컬럼 프로파일 사이드카도 쓴다.
+
+    Args:
+        df (pd.DataFrame): 전처리 결과 (예: BRFSS_2015ver18.csv 를 읽은 것)
+        path (str): 저장 경로
+        row_group_size (int): 행 그룹 크기. 작을수록 건너뛰기가 촘촘해진다
+
+    Returns:
+        str: 저장 경로
+    """
+    ok = target_mask(df)
+    order = np.concatenate([np.flatnonzero(ok), np.flatnonzero(~ok)])
+
+    # 원래 행 번호 = 정수 인덱스 (read_csv 결과면 위치와 같고, 표본이면 원본의 행 번호)
+    rows = df.index.to_numpy() if is_integer_dtype(df.index.dtype) else np.arange(len(df))
+    out = df.iloc[order].reset_index(drop=True)
+    out[ROW_COLUMN] = rows[order].astype(np.int64)
+    out[TARGET_OK_COLUMN] = ok[order]
+
+    table = pa.Table.from_pandas(out, preserve_index=False)
+    pq.write_table(table, path, row_group_size=row_group_size, write_statistics=True)
+    # 컬럼 통계 사이드카 (src/common/profile.py)
+    write_profile(profile_frame(df), path)
+    return path
+
+
+def store_columns(path=BRFSS_STORE):
+    """저장소의 데이터 컬럼 목록 (원래 순서). 스키마만 읽는다."""
+    names = pq.read_schema(path).names
+    return [name for name in names if name not in _INTERNAL]
+
+
+def store_profile(path=BRFSS_STORE):
+    """저장소의 컬럼 프로파일 (null 수, min/max/mean, 값별 개수 등). 사이드카가 없으면 만든다."""
+    return ensure_profile(path, exclude=_INTERNAL)
+
+
+def load_brfss(columns=None, where=None, path=BRFSS_STORE, compact=False):
+    """
+    저장소에서 필요한 컬럼/행만 읽는다.
+
+    Args:
+        columns (list): 읽을 컬럼 (None 이면 전체). 결과 컬럼 순서도 이 순서를 따른다
+        where (list): pyarrow 필터 [(컬럼, 연산자, 값), ...] (AND 조건).
+            예: TARGET_FILTER, [('SEX', '==', 1)]
+        path (str): 저장소 경로
+        compact (bool): True 면 컬럼마다 BRFSS_SCHEMA 의 작은 dtype 으로 바로 줄인다
+
+    Returns:
+        pd.DataFrame: read_csv 후 같은 조건으로 거른 것과 같은 인덱스/순서의 데이터프레임
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(
+            f"{path} 가 없습니다. python -m preprocess.build_store 로 먼저 만들어 주세요."
+        )
+    if columns is None:
+        columns = store_columns(path)
+
+    table = pq.read_table(path, columns=list(columns) + [ROW_COLUMN], filters=where)
+    if compact:
+        # float64 데이터프레임 전체를 만들지 않고 컬럼 하나씩 줄인다
+        data = {}
+        for name in columns:
+            series = table.column(name).to_pandas()
+            data[name] = compact_column(series, BRFSS_SCHEMA[name]) if name in BRFSS_SCHEMA else series
+            table = table.drop_columns([name])
+        df = pd.DataFrame(data)
+        df[ROW_COLUMN] = table.column(ROW_COLUMN).to_numpy()
+    else:
+        df = table.to_pandas()
+    del table
+
+    # read_csv 와 같게: 원래 행 번호를 인덱스로, 문자열 컬럼의 빈칸은 NaN
+    df.index = pd.Index(df.pop(ROW_COLUMN).to_numpy(), dtype=np.int64)
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index()
+    for col in df.columns[df.dtypes == object]:
+        df[col] = df[col].fillna(np.nan)
+    return df
+
+
+def load_brfss_matrix(columns=None, where=None, path=BRFSS_STORE):
+    """
+    load_brfss(compact=True) 와 같은 값을 CompactMatrix 로 읽는다 (데이터프레임을 만들지 않음).
+    Arrow 컬럼을 하나씩 꺼내 줄이므로 넓은 배열은 한 번에 한 컬럼뿐이고, 결과는
+    정수 컬럼 결측을 비트맵으로 들고 있어서 compact 데이터프레임보다 작다.
+
+    Args:
+        columns (list): 읽을 숫자 컬럼 (None 이면 전체)
+        where (list): pyarrow 필터 (load_brfss 와 같음)
+        path (str): 저장소 경로
+
+    Returns:
+        CompactMatrix: 원래 행 번호 인덱스, 행 순서는 load_brfss 와 같음
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(
+            f"{path} 가 없습니다. python -m preprocess.build_store 로 먼저 만들어 주세요."
+        )
+    if columns is None:
+        columns = store_columns(path)
+
+    table = pq.read_table(path, columns=list(columns) + [ROW_COLUMN], filters=where)
+    rows = table.column(ROW_COLUMN).to_numpy()
+    order = None if np.all(rows[:-1] <= rows[1:]) else np.argsort(rows, kind='stable')
+
+    def arrays():
+        nonlocal table
+        for name in columns:
+            raw = table.column(name).to_pandas().to_numpy(dtype=np.float64, na_value=np.nan)
+            table = table.drop_columns([name])
+            yield name, raw if order is None else raw[order]
+
+    index = pd.Index(rows if order is None else rows[order], dtype=np.int64)
+    return CompactMatrix.from_columns(arrays(), BRFSS_SCHEMA, index)
+
+
+def _sample_cache_path(path, percent, seed):
+    # 원본 파일이 바뀌면 (크기/수정 시각) 다른 이름이 되어 새로 만든다
+    stat = os.stat(path)
+    key = hashlib.sha1(f"{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime_ns}|{seed}".encode()).hexdigest()
+    name = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(SAMPLE_CACHE, f"{name}.{percent:g}pct.{key[:12]}.parquet")
+
+
+def sample_store(percent, path=BRFSS_STORE, seed=42):
+    """
+    저장소의 층화 표본(타깃 5개 조합마다 같은 비율)을 저장소 파일로 캐시하고 그 경로를 돌려준다.
+    load_brfss / store_columns 에 path= 로 그대로 넘기면 된다.
+    타깃 컬럼만 먼저 읽어서 뽑을 행을 정하고, 그 행만 읽어서 쓴다.
+
+    Args:
+        percent (float): 표본 비율 (%) (예: 1, 10)
+        path (str): 원래 저장소 경로
+        seed (int): 시드
+
+    Returns:
+        str: 표본 저장소 경로
+    """
+    out = _sample_cache_path(path, percent, seed)
+    if not os.path.exists(out):
+        targets = load_brfss(TARGET_COLS, path=path)
+        rows = targets.index[stratified_indices(targets, percent / 100, seed)]
+        df = load_brfss(path=path, where=[(ROW_COLUMN, 'in', rows.tolist())])
+        os.makedirs(SAMPLE_CACHE, exist_ok=True)
+        tmp = out + ".tmp"
+        write_store(df, tmp)
+        os.replace(tmp, out)
+        os.replace(tmp + PROFILE_SUFFIX, out + PROFILE_SUFFIX)
+    return out
+
+
+def read_brfss_csv(path, columns=None, chunksize=ROW_GROUP_SIZE, sample=None, seed=42):
+    """
+    전처리 결과 CSV 를 BRFSS_SCHEMA dtype 으로 읽는다 (저장소가 없는 옛 버전 파일용).
+    스키마 컬럼은 float64 로 고정해서 읽으므로 low_memory 의 dtype 추측이 없고,
+    청크마다 줄여서 붙이므로 float64 전체 데이터프레임을 만들지 않는다.
+
+    Args:
+        path (str): CSV 경로 (예: data/BRFSS_2015ver16.csv)
+        columns (list): 읽을 컬럼 (None 이면 전체)
+        chunksize (int): 한 번에 읽을 행 수
+        sample (float): 표본 비율 (%). 주면 타깃 5개로 층화한 표본을 캐시해 두고 읽는다
+        seed (int): 표본 시드
+
+    Returns:
+        pd.DataFrame: 작은 dtype 의 데이터프레임
+    """
+    if sample:
+        out = _sample_cache_path(path, sample, seed)
+        if not os.path.exists(out):
+            df = read_brfss_csv(path, chunksize=chunksize)
+            df = sample_frame(df, sample / 100, [col for col in TARGET_COLS if col in df.columns], seed)
+            os.makedirs(SAMPLE_CACHE, exist_ok=True)
+            df.to_parquet(out + ".tmp", engine="pyarrow")
+            os.replace(out + ".tmp", out)
+        return pd.read_parquet(out, columns=columns)
+
+    header = pd.read_csv(path, nrows=0).columns
+    dtype = {col: np.float64 for col in header if col in BRFSS_SCHEMA}
+    reader = pd.read_csv(path, usecols=columns, dtype=dtype, chunksize=chunksize)
+    chunks = [compact_brfss(chunk) for chunk in reader]
+    # 청크마다 넓혀진 dtype 이 다를 수 있어서 합친 뒤 한 번 더 맞춘다
+    return compact_brfss(pd.concat(chunks))
@@ -0,0 +1,126 @@
+# 원본 BRFSS CSV 청크 단위 전처리 파일
+# src/brfss/stream.py
+#
+# 원본 BRFSS_2015.csv (약 540MB, 330열) 를 통째로 올리지 않고
+# 행 청크 단위로 읽으면서 아래 단계를 한 번에 처리한다.
+#   preprocessVer2.00 (컬럼 선택) → preprocessVer2.01 (공백 → NaN)
+#   → preprocessVer3.01 (preprocess_data) → 컬럼 삭제
+# 메모리 최대 사용량은 파일 크기가 아니라 chunksize 로 정해진다.
+#
+# 청크마다 dtype 이 달라질 수 있어서 (어떤 청크엔 빈칸이 없어 int64 가 되는 등)
+# 바로 CSV 로 이어 쓰면 "1" 과 "1.0" 이 섞인다. 그래서 청크 결과를 임시 pickle 로
+# 내려두고 전체 dtype 을 정한 다음, 다시 청크 단위로 읽어 CSV 에 이어 쓴다.
+# 이렇게 하면 결과 파일은 전체를 한 번에 처리했을 때와 바이트 단위로 같다.
+
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from src.brfss.parallel import ParallelRecoder
+from src.brfss.recode import TARGET_COLS, preprocess_data
+from src.common.config import BRFSS_COLUMNS, BRFSS_DROP_COLUMNS
+from src.common.profile import ColumnProfiler, write_profile
+from src.common.sample import stratified_indices
+
+DEFAULT_CHUNKSIZE = 50_000
+
+
+def preprocess_chunk(chunk, columns=BRFSS_COLUMNS, drop=BRFSS_DROP_COLUMNS, preprocess=preprocess_data):
+    """
+    원본 청크 하나에 컬럼 선택부터 컬럼 삭제까지 전체 전처리를 적용한다.
+
+    Args:
+        chunk (pd.DataFrame): 원본 CSV 에서 읽은 청크
+        columns (list): 남길 컬럼 (순서 포함)
+        drop (list): 재코딩 후 삭제할 컬럼
+        preprocess (function): 재코딩 함수 (기본 recode.preprocess_data)
+
+    Returns:
+        pd.DataFrame: 전처리된 청크
+    """
+    chunk = chunk.reindex(columns=columns)
+
+    # 빈칸(공백 문자열)을 NaN 으로 바꾸고 숫자형으로 (preprocessVer2.01 + CSV 재로딩과 동일)
+    for col in chunk.select_dtypes(include='object').columns:
+        chunk[col] = pd.to_numeric(chunk[col].replace(r'^\s*$', np.nan, regex=True))
+
+    chunk = preprocess(chunk)
+    return chunk.drop(columns=drop)
+
+
+def _merge_dtype(kinds):
+    # 청크별 dtype 종류를 합친다. 전체를 한 번에 apply 했을 때와 같은 규칙
+    if kinds == {'i'}:
+        return np.int64
+    if kinds == {'O'}:
+        return object
+    return np.float64
+
+
+def preprocess_csv_chunked(src, dst, chunksize=DEFAULT_CHUNKSIZE,
+                           columns=BRFSS_COLUMNS, drop=BRFSS_DROP_COLUMNS,
+                           tmp_dir=None, workers=1, sample=None, seed=42, verbose=True):
+    """
+    원본 CSV 를 청크 단위로 전처리해서 dst 에 이어 쓴다.
+
+    Args:
+        src (str): 원본 CSV 경로 (예: data/BRFSS_2015.csv)
+        dst (str): 결과 CSV 경로 (예: data/BRFSS_2015ver18.csv)
+        chunksize (int): 한 번에 읽을 행 수. 메모리 사용량을 정한다
+        columns (list): 남길 컬럼
+        drop (list): 재코딩 후 삭제할 컬럼
+        tmp_dir (str): 임시 청크를 둘 폴더 (기본: 시스템 임시 폴더)
+        workers (int): 1 보다 크면 청크마다 컬럼을 나눠 여러 프로세스로 재코딩
+        sample (float): 개발용 표본 비율 (%). 청크마다 원본 타깃 코드로 층화해서 뽑는다
+        seed (int): 표본 시드 (청크 i 는 seed + i)
+        verbose (bool): 청크별 진행 상황 출력 여부
+
+    Returns:
+        int: 처리한 전체 행 수
+    """
+    total = 0
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as tmp:
+        parts = []
+        kinds = {}
+
+        # 1) 청크별 전처리 → 임시 pickle
+        # 중간에 실패해도 작업자 프로세스와 공유 메모리가 남지 않게 finally 에서 닫는다
+        recoder = ParallelRecoder(workers) if workers > 1 else None
+        preprocess = recoder.preprocess_data if recoder else preprocess_data
+        try:
+            for i, chunk in enumerate(pd.read_csv(src, usecols=columns, chunksize=chunksize)):
+                if sample:
+                    # 층은 빈칸을 NaN 으로 바꾼 숫자 타깃 코드로 (preprocess_chunk 와 같은 규칙)
+                    strata = [col for col in TARGET_COLS if col in chunk.columns]
+                    targets = chunk[strata].replace(r'^\s*$', np.nan, regex=True).apply(pd.to_numeric)
+                    chunk = chunk.iloc[stratified_indices(targets, sample / 100, seed + i)]
+                chunk = preprocess_chunk(chunk, columns, drop, preprocess)
+                path = os.path.join(tmp, f"part{i:05d}.pkl")
+                chunk.to_pickle(path)
+                parts.append(path)
+                for col, dtype in chunk.dtypes.items():
+                    kinds.setdefault(col, set()).add(dtype.kind)
+                total += len(chunk)
+                if verbose:
+                    print(f"청크 {i}: {len(chunk)}행 처리 (누적 {total}행)")
+        finally:
+            if recoder:
+                recoder.close()
+
+        if not parts:
+            pd.DataFrame(columns=[c for c in columns if c not in drop]).to_csv(dst, index=False)
+            return 0
+
+        # 2) 전체 dtype 을 맞춰서 CSV 에 이어 쓰기 (쓰는 김에 컬럼 프로파일도 누적)
+        dtypes = {col: _merge_dtype(k) for col, k in kinds.items()}
+        profiler = ColumnProfiler()
+        for i, path in enumerate(parts):
+            chunk = pd.read_pickle(path).astype(dtypes)
+            chunk.to_csv(dst, mode='w' if i == 0 else 'a', header=(i == 0), index=False)
+            profiler.update(chunk)
+            os.remove(path)
+        write_profile(profiler.result(), dst)
+
+    return total
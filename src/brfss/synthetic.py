@@ -0,0 +1,179 @@
+# BRFSS 합성 데이터 생성 파일
+# src/brfss/synthetic.py
+#
+# data/*.csv 는 Git LFS 포인터라서 원본(약 700MB)을 받지 않으면 벤치마크도,
+# preprocess_data 회귀 확인도 할 수 없다. 그래서 원본과 같은 모양의 데이터를 만든다.
+#   - BRFSS_COLUMNS 와 같은 컬럼, 원본 CSV 를 읽은 것과 같은 float64 + 빈칸(NaN)
+#   - 컬럼마다 spec.py 규칙에 맞는 코드 분포
+#     (정상 코드, 7/9/77/99/777/999 같은 모름/거부 코드, 88/888 같은 '없음' 코드,
+#      101–199/201–299 같은 단위 코드, 시분(HMM), 범위가 있는 정수)
+#   - 컬럼마다 빈칸 비율이 다르다 (일부 응답자만 받는 문항은 대부분 빈칸)
+# 컬럼별 분포(코드 비율, 빈칸 비율)는 고정 시드로 한 번만 정하고, seed 는 행 값만 바꾼다.
+# 그래서 seed 를 바꿔 가며 청크를 만들어 붙여도 같은 분포의 큰 데이터가 된다.
+
+import numpy as np
+import pandas as pd
+
+from src.brfss.recode import TARGET_COLS
+from src.brfss.spec import RECODE_SPEC
+from src.common.config import BRFSS_COLUMNS
+
+# 컬럼별 분포를 정하는 시드 (행 값 시드와 따로)
+PARAM_SEED = 2015
+
+# 범주형(other='keep') 컬럼의 정상 코드 (2015 코드북 기준)
+CATEGORY_LEVELS = {
+    'GENHLTH': range(1, 6), 'PERSDOC2': range(1, 4), 'CHECKUP1': [1, 2, 3, 4, 8],
+    'CHOLCHK': [1, 2, 3, 4], 'MARITAL': range(1, 7), 'EDUCA': range(1, 7),
+    'RENTHOM1': range(1, 4), 'EMPLOY1': range(1, 9), 'INCOME2': range(1, 9),
+    'LASTSMK2': range(1, 9), 'USENOW3': range(1, 4), 'ARTHSOCL': range(1, 4),
+    'WHRTST10': range(1, 9), 'SXORIENT': range(1, 5), 'MSCODE': [1, 2, 3, 5],
+    '_ASTHMS1': range(1, 4), '_MRACE1': range(1, 8), '_RACE': range(1, 9),
+    '_INCOMG': range(1, 6), 'ACTIN11_': range(0, 3), 'ACTIN21_': range(0, 3),
+    '_PA300R2': range(1, 4), '_PAREC1': range(1, 5), '_BMI5CAT': range(1, 5),
+    '_PA150R2': range(1, 4), 'SEX': [1, 2], 'SMOKDAY2': range(1, 4),
+    '_SMOKER3': range(1, 5), '_PACAT1': range(1, 5), '_AGEG5YR': range(1, 15),
+}
+
+# 재코딩 없는(raw) 컬럼 값: (평균, 표준편차, 최소, 최대)
+RAW_RANGES = {
+    '_FRUTSUM': (150, 120, 0, 20000), '_VEGESUM': (190, 130, 0, 20000),
+    '_BMI5': (2800, 600, 1200, 9999), 'HTM4': (170, 10, 91, 244),
+    'PADUR1_': (60, 50, 1, 599), 'PADUR2_': (50, 45, 1, 599),
+    '_MINAC11': (400, 500, 0, 30000), '_MINAC21': (300, 400, 0, 30000),
+    'PAMIN11_': (500, 600, 0, 30000), 'PAMIN21_': (350, 450, 0, 30000),
+    'PAVIG11_': (150, 300, 0, 30000), 'PAVIG21_': (100, 250, 0, 30000),
+}
+
+# 범위가 있는 정수 규칙 중 분포를 따로 정하는 컬럼: (평균, 표준편차)
+INT_NORMAL = {'WTKG3': (8100, 2000)}
+
+# 빈칸 비율 후보 (대부분 문항은 조금, 일부 문항은 거의 전부 빈칸)
+BLANK_RATES = [0.0, 0.01, 0.05, 0.2, 0.6, 0.95]
+BLANK_WEIGHTS = [0.25, 0.3, 0.15, 0.1, 0.1, 0.1]
+TARGET_BLANK_RATE = 0.005
+UNKNOWN_RATE = 0.03
+ZERO_RATE = 0.2
+
+
+def _column_params(col, rng):
+    rule = RECODE_SPEC.get(col, {'type': 'raw'})
+    blank = TARGET_BLANK_RATE if col in TARGET_COLS else rng.choice(BLANK_RATES, p=BLANK_WEIGHTS)
+    params = {'rule': rule, 'blank': float(blank), 'skew': float(rng.uniform(0.5, 3.0))}
+    if rule['type'] == 'code':
+        levels = list(CATEGORY_LEVELS.get(col, rule['map'].keys()))
+        params['levels'] = np.array(levels, dtype=np.float64)
+        params['weights'] = rng.dirichlet(np.full(len(levels), 2.0))
+    return params
+
+
+_PARAMS = {}
+
+
+def column_params(columns):
+    """컬럼별 분포 (고정 시드라서 몇 번을 불러도 같다)."""
+    missing = [col for col in columns if col not in _PARAMS]
+    if missing:
+        rng = np.random.default_rng(PARAM_SEED)
+        for col in BRFSS_COLUMNS + [col for col in missing if col not in BRFSS_COLUMNS]:
+            params = _column_params(col, rng)
+            _PARAMS.setdefault(col, params)
+    return {col: _PARAMS[col] for col in columns}
+
+
+def _skewed(rng, lo, hi, skew, size):
+    # lo 쪽에 몰린 정수 (응답 빈도/횟수는 작은 값이 많다)
+    return np.floor(lo + (hi - lo + 1) * rng.beta(1.0, 1.0 + skew, size)).clip(lo, hi)
+
+
+def _valid_values(rng, col, params, size):
+    rule = params['rule']
+    kind = rule['type']
+    if kind == 'code':
+        return rng.choice(params['levels'], size=size, p=params['weights'])
+    if kind == 'units':
+        bands = rule['bands']
+        band = rng.integers(0, len(bands), size)
+        lo = np.array([b[0] for b in bands], dtype=np.float64)[band]
+        hi = np.array([b[1] for b in bands], dtype=np.float64)[band]
+        return np.minimum(lo + _skewed(rng, 0, 29, params['skew'], size), hi)
+    if kind == 'hhmm':
+        return _skewed(rng, 0, 9, params['skew'], size) * 100 + rng.integers(0, 60, size)
+    if kind == 'int':
+        lo, hi = rule['range'] or (1, 100)
+        if col in INT_NORMAL:
+            mean, std = INT_NORMAL[col]
+            return np.round(rng.normal(mean, std, size)).clip(lo, hi)
+        if col == 'HIVTSTD3':
+            # 월+연도(MYYYY/MMYYYY)
+            return rng.integers(1, 13, size) * 10000 + rng.integers(1985, 2017, size)
+        return _skewed(rng, lo, hi, params['skew'], size)
+    if col in RAW_RANGES:
+        mean, std, lo, hi = RAW_RANGES[col]
+        return np.round(rng.normal(mean, std, size)).clip(lo, hi)
+    # 규칙이 없는 컬럼 (extra): 작은 코드
+    return rng.integers(1, 10, size).astype(np.float64)
+
+
+def synthetic_column(rng, col, params, rows):
+    """
+    컬럼 하나를 만든다 (float64, 빈칸 = NaN).
+
+    Args:
+        rng (np.random.Generator): 행 값용 난수 생성기
+        col (str): 컬럼명
+        params (dict): column_params 결과
+        rows (int): 행 수
+
+    Returns:
+        np.ndarray: 컬럼 값
+    """
+    rule = params['rule']
+    # + 0.0: 반올림으로 생긴 -0.0 을 0.0 으로 (CSV 에 "-0.0" 이 써지지 않게)
+    values = _valid_values(rng, col, params, rows).astype(np.float64) + 0.0
+
+    special = [(rule.get('unknown', []), UNKNOWN_RATE), (rule.get('zero', []), ZERO_RATE)]
+    draw = rng.random(rows)
+    start = 0.0
+    for sentinel, rate in special:
+        if not sentinel:
+            continue
+        hit = (draw >= start) & (draw < start + rate)
+        values[hit] = rng.choice(np.array(sentinel, dtype=np.float64), size=int(hit.sum()))
+        start += rate
+
+    if params['blank']:
+        values[rng.random(rows) < params['blank']] = np.nan
+    return values
+
+
+def synthetic_brfss(rows, seed=42, columns=BRFSS_COLUMNS, extra=0):
+    """
+    원본 BRFSS CSV 를 읽은 것과 같은 모양의 합성 데이터프레임.
+
+    Args:
+        rows (int): 행 수
+        seed (int): 행 값 시드 (컬럼 분포는 seed 와 무관하게 고정)
+        columns (list): 만들 컬럼 (기본: preprocessVer2.00 에서 남기는 컬럼)
+        extra (int): 뒤에 붙일 규칙 없는 컬럼 수 (원본 330열을 흉내낼 때 183)
+
+    Returns:
+        pd.DataFrame: float64 데이터프레임 (빈칸 = NaN)
+    """
+    columns = list(columns) + [f"X{i:03d}" for i in range(extra)]
+    params = column_params(columns)
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({col: synthetic_column(rng, col, params[col], rows) for col in columns})
+
+
+def iter_synthetic_brfss(rows, chunksize=500_000, seed=42, columns=BRFSS_COLUMNS, extra=0):
+    """
+    큰 합성 데이터를 청크로 나눠 만든다 (청크 i 의 시드 = seed + i).
+
+    Yields:
+        pd.DataFrame: 청크 (인덱스는 전체 행 번호)
+    """
+    for i, start in enumerate(range(0, rows, chunksize)):
+        chunk = synthetic_brfss(min(chunksize, rows - start), seed + i, columns, extra)
+        chunk.index += start
+        yield chunk
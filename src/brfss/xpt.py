@@ -0,0 +1,269 @@
+# SAS XPORT(XPT) 파일 직접 읽기 파일
+# src/brfss/xpt.py
+#
+# CDC 는 BRFSS 원본을 SAS transport 파일(LLCP2015.XPT 등)로 배포한다.
+# CSV 로 바꿔서 읽는 대신 XPT 레코드를 청크 단위로 읽으면서
+# 필요한 컬럼의 바이트만 골라 float64 배열로 바로 바꾼다.
+# (pd.read_sas 는 청크마다 330개 컬럼을 전부 변환한다)
+#
+# XPT v5 형식
+#   - 80바이트 헤더 레코드들 → 변수 정의(namestr, 변수당 140바이트) → 관측값
+#   - 관측값 한 행 = 변수 길이의 합 (고정 길이), 파일 끝은 공백으로 80바이트 정렬
+#   - 숫자는 IBM 16진 부동소수점 (2–8바이트, 빅엔디언)
+#   - 결측: 첫 바이트가 '.', '_', 'A'–'Z' 이고 나머지가 0
+# 숫자 변환은 pandas 의 XPT 리더와 비트 단위로 같게 했다.
+# 단, IBM 0 은 pandas 처럼 5.4e-79 가 아니라 0.0 으로 읽는다.
+
+import struct
+
+import numpy as np
+import pandas as pd
+
+_LIBRARY_HEADER = ("HEADER RECORD*******LIBRARY HEADER RECORD!!!!!!!"
+                   "000000000000000000000000000000  ")
+_MEMBER_HEADER = "HEADER RECORD*******MEMBER  HEADER RECORD!!!!!!!000000000000000001600000000"
+_DSCRPTR_HEADER = ("HEADER RECORD*******DSCRPTR HEADER RECORD!!!!!!!"
+                   "000000000000000000000000000000  ")
+_NAMESTR_HEADER = "HEADER RECORD*******NAMESTR HEADER RECORD!!!!!!!000000{:04d}00000000000000000000  "
+_OBS_HEADER = ("HEADER RECORD*******OBS     HEADER RECORD!!!!!!!"
+               "000000000000000000000000000000  ")
+_NAMESTR = struct.Struct(">hhhh8s40s8shhh2s8shhl52s")
+
+DEFAULT_CHUNKSIZE = 50_000
+
+
+def read_header(path):
+    """
+    XPT 헤더만 읽는다.
+
+    Args:
+        path (str): XPT 파일 경로
+
+    Returns:
+        dict: {'fields': [{'name', 'type'('num'/'char'), 'length', 'offset'}, ...],
+               'record_length', 'data_start', 'nobs'}
+    """
+    with open(path, "rb") as f:
+        def row():
+            return f.read(80).decode("latin-1")
+
+        if row() != _LIBRARY_HEADER:
+            raise ValueError(f"{path} 는 SAS XPORT 파일이 아닙니다.")
+        row(), row()
+        member = row()
+        if not member.startswith(_MEMBER_HEADER) or row() != _DSCRPTR_HEADER:
+            raise ValueError("XPT 멤버 헤더를 찾을 수 없습니다.")
+        namestr_length = int(member[-5:-2])     # 보통 140 (VAX 는 136)
+        row(), row()
+        count = int(row()[54:58])
+
+        size = namestr_length * count
+        raw = f.read(size + (-size) % 80)
+        fields = []
+        for i in range(count):
+            chunk = raw[i * namestr_length:(i + 1) * namestr_length].ljust(140)
+            ntype, _, length, _, name, *_, offset, _ = _NAMESTR.unpack(chunk)
+            fields.append({
+                'name': name.decode("latin-1").strip(),
+                'type': 'num' if ntype == 1 else 'char',
+                'length': length,
+                'offset': offset,
+            })
+
+        if row() != _OBS_HEADER:
+            raise ValueError("XPT 관측값 헤더를 찾을 수 없습니다.")
+        data_start = f.tell()
+        f.seek(0, 2)
+        total = f.tell() - data_start
+
+    record_length = sum(field['length'] for field in fields)
+    nobs = total // record_length if record_length else 0
+    if 0 < record_length < 80:
+        # 짧은 레코드는 끝의 공백 정렬이 레코드처럼 보일 수 있어서 공백 레코드를 뺀다
+        with open(path, "rb") as f:
+            f.seek(data_start + (nobs - 1) * record_length)
+            while nobs and f.read(record_length) == b" " * record_length:
+                nobs -= 1
+                f.seek(data_start + (nobs - 1) * record_length)
+    return {'fields': fields, 'record_length': record_length,
+            'data_start': data_start, 'nobs': nobs}
+
+
+def ibm_to_float(block):
+    """
+    IBM 부동소수점 바이트 블록을 float64 로 바꾼다.
+
+    Args:
+        block (np.ndarray): (행 수, 길이) uint8. 길이는 2–8
+
+    Returns:
+        np.ndarray: float64 배열 (결측은 NaN)
+    """
+    n, length = block.shape
+    if length < 8:
+        block = np.concatenate([block, np.zeros((n, 8 - length), dtype=np.uint8)], axis=1)
+    block = np.ascontiguousarray(block)
+    words = block.view(">u4").reshape(n, 2)
+    hi, lo = words[:, 0].astype(np.uint32), words[:, 1].astype(np.uint32)
+
+    # 16진 지수 → 2진 지수로 바꾸면서 가수를 0–3비트 옮긴다
+    shift = np.zeros(n, dtype=np.uint32)
+    shift[(hi & 0x00200000) != 0] = 1
+    shift[(hi & 0x00400000) != 0] = 2
+    shift[(hi & 0x00800000) != 0] = 3
+    ieee_hi = (hi & 0x00FFFFFF) >> shift
+    ieee_lo = (lo >> shift) | ((hi & 0x7) << (29 + (3 - shift)))
+    ieee_hi &= 0xFFEFFFFF
+    exponent = ((((hi >> 24) & 0x7F).astype(np.int64) - 65) << 2) + shift + 1023
+    ieee_hi |= (exponent.astype(np.uint32) << 20) | (hi & 0x80000000)
+
+    out = np.empty(n, dtype=">u4,>u4")
+    out["f0"], out["f1"] = ieee_hi, ieee_lo
+    values = out.view(">f8").astype(np.float64)
+
+    # 가수가 0 이면 0 (pandas 는 여기서 5.4e-79 를 돌려준다)
+    values[((hi & 0x00FFFFFF) == 0) & (lo == 0)] = 0.0
+    first = block[:, 0]
+    rest_zero = ~block[:, 1:].any(axis=1)
+    values[rest_zero & (((first >= 0x41) & (first <= 0x5A)) | (first == 0x5F) | (first == 0x2E))] = np.nan
+    return values
+
+
+def _decode(block, field):
+    if field['type'] == 'num':
+        return ibm_to_float(block)
+    # 문자 컬럼: 뒤 공백 제거, 빈 값은 NaN (CSV 의 빈칸과 같게)
+    text = pd.Series(block.view(f"S{field['length']}").ravel()).str.decode("latin-1").str.rstrip()
+    return text.where(text != "", np.nan).to_numpy(dtype=object)
+
+
+def iter_xpt(path, columns=None, chunksize=DEFAULT_CHUNKSIZE, header=None):
+    """
+    XPT 를 청크 단위로 읽으면서 필요한 컬럼만 변환한다.
+
+    Args:
+        path (str): XPT 파일 경로
+        columns (list): 읽을 컬럼 (None 이면 전체). 결과 컬럼 순서도 이 순서
+        chunksize (int): 한 번에 읽을 행 수
+        header (dict): read_header 결과 (없으면 새로 읽음)
+
+    Yields:
+        pd.DataFrame: 청크 (숫자 컬럼은 float64, 문자 컬럼은 object)
+    """
+    header = header or read_header(path)
+    by_name = {field['name']: field for field in header['fields']}
+    columns = list(by_name) if columns is None else list(columns)
+    unknown = [col for col in columns if col not in by_name]
+    if unknown:
+        raise KeyError(f"XPT 에 없는 컬럼: {unknown}")
+
+    reclen = header['record_length']
+    with open(path, "rb") as f:
+        f.seek(header['data_start'])
+        start = 0
+        while start < header['nobs']:
+            n = min(chunksize, header['nobs'] - start)
+            raw = np.frombuffer(f.read(n * reclen), dtype=np.uint8).reshape(n, reclen)
+            data = {}
+            for col in columns:
+                field = by_name[col]
+                lo = field['offset']
+                data[col] = _decode(raw[:, lo:lo + field['length']], field)
+            yield pd.DataFrame(data, index=pd.RangeIndex(start, start + n))
+            start += n
+
+
+def read_xpt(path, columns=None, chunksize=DEFAULT_CHUNKSIZE):
+    """
+    XPT 에서 필요한 컬럼만 읽는다. 330개 컬럼 전체 표는 만들지 않고
+    청크마다 고른 컬럼 값을 미리 잡아둔 배열에 채운다.
+
+    Args:
+        path (str): XPT 파일 경로
+        columns (list): 읽을 컬럼 (None 이면 전체)
+        chunksize (int): 한 번에 읽을 행 수
+
+    Returns:
+        pd.DataFrame: 선택한 컬럼의 데이터프레임
+    """
+    header = read_header(path)
+    by_name = {field['name']: field for field in header['fields']}
+    columns = list(by_name) if columns is None else list(columns)
+    nobs = header['nobs']
+    arrays = {
+        col: np.empty(nobs, dtype=np.float64 if by_name[col]['type'] == 'num' else object)
+        for col in columns if col in by_name
+    }
+    for chunk in iter_xpt(path, list(arrays), chunksize, header):
+        for col, array in arrays.items():
+            array[chunk.index[0]:chunk.index[-1] + 1] = chunk[col].to_numpy()
+    return pd.DataFrame({col: arrays[col] for col in columns if col in arrays})
+
+
+def xpt_columns(path):
+    """XPT 변수 이름 목록 (헤더만 읽음)."""
+    return [field['name'] for field in read_header(path)['fields']]
+
+
+def float_to_ibm(values):
+    """float64 배열을 8바이트 IBM 부동소수점 (n, 8) uint8 로 바꾼다 (write_xpt 용)."""
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    out = np.zeros((n, 8), dtype=np.uint8)
+    nonzero = np.isfinite(values) & (values != 0)
+    frac, exp2 = np.frexp(np.abs(values[nonzero]))
+    exp16 = -np.floor_divide(-exp2, 4)             # ceil(exp2 / 4)
+    mantissa = np.ldexp(frac, exp2 - 4 * exp16 + 56).astype(np.uint64)
+    sign = (values[nonzero] < 0).astype(np.uint64) << 63
+    word = sign | ((exp16 + 64).astype(np.uint64) << 56) | mantissa
+    out[nonzero] = word.astype(">u8").view(np.uint8).reshape(-1, 8)
+    out[np.isnan(values), 0] = 0x2E                # '.' = 결측
+    return out
+
+
+def write_xpt(df, path, name="DATA"):
+    """
+    데이터프레임을 XPT v5 파일로 쓴다 (숫자 컬럼은 8바이트, 문자 컬럼은 최대 길이).
+    벤치마크/테스트용 작은 파일을 만들 때 쓴다.
+
+    Args:
+        df (pd.DataFrame): 저장할 데이터프레임 (컬럼 이름 8자 이하)
+        path (str): 저장 경로
+        name (str): 데이터셋 이름
+    """
+    stamp = "01JAN15:00:00:00"
+    blocks, namestrs, offset = [], [], 0
+    for col in df.columns:
+        series = df[col]
+        if pd.api.types.is_numeric_dtype(series.dtype):
+            block, ntype = float_to_ibm(series.to_numpy(dtype=np.float64, na_value=np.nan)), 1
+        else:
+            text = [value.encode("latin-1") for value in series.fillna("").astype(str)]
+            length = max([len(value) for value in text] + [1])
+            raw = b"".join(value.ljust(length) for value in text)
+            block, ntype = np.frombuffer(raw, dtype=np.uint8).reshape(-1, length), 2
+        namestrs.append(_NAMESTR.pack(ntype, 0, block.shape[1], len(namestrs) + 1,
+                                      col.encode().ljust(8), b" " * 40, b" " * 8, 0, 0, 0,
+                                      b"  ", b" " * 8, 0, 0, offset, b"\0" * 52))
+        blocks.append(block)
+        offset += block.shape[1]
+
+    def pad(data, fill=b" "):
+        return data + fill * ((-len(data)) % 80)
+
+    head = (
+        _LIBRARY_HEADER
+        + "SAS     SAS     SASLIB  9.4     X64_7PRO" + " " * 24 + stamp
+        + stamp + " " * 64
+        + _MEMBER_HEADER + "140  "
+        + _DSCRPTR_HEADER
+        + "SAS     " + name[:8].ljust(8) + "SASDATA 9.4     X64_7PRO" + " " * 24 + stamp
+        + stamp + " " * 16 + " " * 40 + "DATA    "
+        + _NAMESTR_HEADER.format(len(namestrs))
+    ).encode("latin-1")
+    rows = np.concatenate(blocks, axis=1) if blocks else np.zeros((len(df), 0), dtype=np.uint8)
+    with open(path, "wb") as f:
+        f.write(head)
+        f.write(pad(b"".join(namestrs)))
+        f.write(_OBS_HEADER.encode("latin-1"))
+        f.write(pad(np.ascontiguousarray(rows).tobytes()))
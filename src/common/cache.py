@@ -0,0 +1,103 @@
+# 학습/평가 분할과 피처 행렬 캐시 공통 파일
+# src/common/cache.py
+#
+# jjjj.py / train.py 는 실행할 때마다 데이터를 다시 읽고 인코딩한 다음 train_test_split 을 했다.
+#   - 분할: 데이터 지문(경로/크기/수정 시각) + 시드 + 평가 비율 + 층화 컬럼 으로 이름을 붙인
+#     int32 행 위치 배열 두 개(.npz)로 저장한다. 피처가 달라도 같은 데이터/시드면 같은 분할을 쓴다.
+#   - 피처 행렬: .npy 파일로 저장하고 np.load(mmap_mode='r') 로 연다.
+#     다시 실행할 때 읽기/전처리/인코딩 없이 바로 학습을 시작하고, 같은 캐시를 여는
+#     실험(프로세스)들은 OS 페이지 캐시에 있는 한 벌을 같이 쓴다.
+# 데이터 파일이 바뀌면 지문이 바뀌므로 예전 캐시는 쓰이지 않는다 (지우는 것은 손으로).
+
+import hashlib
+import json
+import os
+import shutil
+
+import joblib
+import numpy as np
+
+from src.common.config import DATA_DIR
+
+MATRIX_CACHE = os.path.join(DATA_DIR, ".cache", "matrix")
+
+
+def file_fingerprint(path):
+    """데이터 파일 지문 (절대 경로 + 크기 + 수정 시각)."""
+    stat = os.stat(path)
+    raw = f"{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime_ns}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def cache_key(*parts):
+    """캐시 이름 (parts 를 JSON 으로 이어 붙인 sha1)."""
+    raw = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def cached_split(fingerprint, n_rows, make, seed, test_size, stratify=None, cache_dir=MATRIX_CACHE):
+    """
+    학습/평가 행 위치를 저장해두고 다시 쓴다.
+
+    Args:
+        fingerprint (str): 데이터 지문 (file_fingerprint 등)
+        n_rows (int): 행 수 (저장된 분할과 맞는지 확인용)
+        make (callable): 캐시가 없을 때 (학습 위치, 평가 위치) 를 만드는 함수
+        seed (int): 분할 시드
+        test_size (float): 평가 비율
+        stratify (str): 층화 컬럼 (이름에만 쓰임)
+        cache_dir (str): 캐시 폴더
+
+    Returns:
+        tuple: (학습 행 위치, 평가 행 위치) — np.ndarray
+    """
+    path = os.path.join(cache_dir, "splits", f"{fingerprint}-{seed}-{test_size}-{stratify}.npz")
+    if os.path.exists(path):
+        with np.load(path) as saved:
+            train_idx, test_idx = saved['train'], saved['test']
+        if len(train_idx) + len(test_idx) == n_rows:
+            return train_idx, test_idx
+
+    train_idx, test_idx = make()
+    dtype = np.int32 if n_rows < 2**31 else np.int64
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp.npz"
+    np.savez(tmp, train=np.asarray(train_idx, dtype=dtype), test=np.asarray(test_idx, dtype=dtype))
+    os.replace(tmp, path)
+    return train_idx, test_idx
+
+
+def save_arrays(path, arrays, extra=None):
+    """
+    배열들을 폴더 하나에 .npy 로 저장한다 (다 쓴 다음 폴더 이름을 바꿔서, 중간에 끊겨도 반쪽 캐시가 남지 않음).
+
+    Args:
+        path (str): 캐시 폴더
+        arrays (dict): {이름: np.ndarray}
+        extra (object): 같이 저장할 파이썬 객체 (인코더 등, joblib)
+    """
+    tmp = path + ".tmp"
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+    for name, array in arrays.items():
+        np.save(os.path.join(tmp, name + ".npy"), np.ascontiguousarray(array))
+    joblib.dump(extra, os.path.join(tmp, "extra.pkl"))
+    shutil.rmtree(path, ignore_errors=True)
+    os.replace(tmp, path)
+
+
+def load_arrays(path):
+    """
+    save_arrays 로 저장한 배열을 메모리 맵으로 연다.
+
+    Args:
+        path (str): 캐시 폴더
+
+    Returns:
+        tuple: ({이름: np.memmap (읽기 전용)}, extra). 캐시가 없으면 None
+    """
+    if not os.path.isdir(path):
+        return None
+    arrays = {name[:-4]: np.load(os.path.join(path, name), mmap_mode='r')
+              for name in os.listdir(path) if name.endswith(".npy")}
+    return arrays, joblib.load(os.path.join(path, "extra.pkl"))
@@ -0,0 +1,135 @@
+# 전처리 중간 결과 컬럼 파일(Parquet) 공통 파일
+# src/common/columnar.py
+#
+# preprocess01.py / preprocess02.py 는 BRFSS_2015ver6.xlsx → ver7.xlsx → ver8.xlsx 로
+# 표 전체를 read_excel / to_excel 했다. openpyxl 은 셀 하나하나를 파이썬 객체로 만들기 때문에
+# 수십만 행이면 몇 분, 몇 GB 가 걸린다. 중간 결과는 Parquet 로 주고받고
+# (dtype 도 그대로 남는다), Excel 은 사람이 보는 작은 요약에만 쓴다 (src/common/excel.py).
+#
+# 예전 .xlsx 만 있으면 read_table 이 처음 한 번 read-only 모드로 행을 흘려 읽으면서
+# 옆에 .parquet 를 만들고, 그 다음부터는 .parquet 를 읽는다.
+# 컬럼 타입(숫자/문자)은 모든 청크를 본 다음 정한다 (청크는 임시 pickle 로 내려둠).
+
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.common.profile import profile_frame, write_profile
+
+COLUMNAR_SUFFIX = ".parquet"
+EXCEL_CHUNKSIZE = 50_000
+
+
+def columnar_path(path):
+    """같은 이름의 Parquet 경로 (BRFSS_2015ver6.xlsx → BRFSS_2015ver6.parquet)."""
+    return os.path.splitext(path)[0] + COLUMNAR_SUFFIX
+
+
+def write_table(df, path):
+    """
+    중간 결과를 Parquet 로 쓰고, 옆에 컬럼 프로파일 사이드카도 쓴다.
+
+    Args:
+        df (pd.DataFrame): 저장할 데이터프레임
+        path (str): 저장 경로 (.parquet)
+
+    Returns:
+        str: 저장 경로
+    """
+    df.to_parquet(path, index=False)
+    write_profile(profile_frame(df), path)
+    return path
+
+
+def _excel_chunk(chunk, text_cols):
+    # 숫자 컬럼은 float64, 어느 청크에서든 문자가 나온 컬럼은 문자열
+    for col in chunk.columns:
+        if col in text_cols:
+            chunk[col] = chunk[col].map(lambda v: v if v is None else str(v)).astype(object)
+        else:
+            chunk[col] = pd.to_numeric(chunk[col], errors='coerce').astype(np.float64)
+    return chunk
+
+
+def _text_columns(chunk):
+    # 숫자(int/float)가 아닌 값이 하나라도 있는 컬럼
+    return {col for col in chunk.columns
+            if not all(isinstance(v, (int, float)) for v in chunk[col].dropna())}
+
+
+def excel_to_table(src, dst=None, chunksize=EXCEL_CHUNKSIZE):
+    """
+    .xlsx 첫 시트를 행 단위로 흘려 읽으면서 Parquet 로 옮긴다 (최대 메모리 ≈ 청크 1개).
+
+    Args:
+        src (str): .xlsx 경로 (첫 행 = 컬럼명)
+        dst (str): 저장 경로 (None 이면 columnar_path(src))
+        chunksize (int): 한 번에 옮길 행 수
+
+    Returns:
+        str: 저장 경로
+    """
+    # openpyxl 은 xlsx 를 읽을 때만 필요하다
+    from openpyxl import load_workbook
+
+    dst = dst or columnar_path(src)
+    tmp = dst + ".tmp"
+    # 컬럼 타입은 모든 청크를 본 다음 정한다 (첫 청크가 비어 있거나 숫자뿐이어도 뒤에 문자가 나올 수 있음).
+    # 청크는 임시 pickle 로 내려두고 (xlsx 를 두 번 읽지 않게), 타입이 정해지면 다시 읽어 Parquet 에 쓴다
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(dst))) as spill:
+        workbook = load_workbook(src, read_only=True, data_only=True)
+        try:
+            rows = workbook.worksheets[0].iter_rows(values_only=True)
+            header = [str(name) for name in next(rows)]
+            parts, text_cols, buffer = [], set(), []
+
+            def spill_chunk():
+                chunk = pd.DataFrame.from_records(buffer, columns=header)
+                text_cols.update(_text_columns(chunk))
+                path = os.path.join(spill, f"part{len(parts):05d}.pkl")
+                chunk.to_pickle(path)
+                parts.append(path)
+                buffer.clear()
+
+            for row in rows:
+                buffer.append(row[:len(header)])
+                if len(buffer) == chunksize:
+                    spill_chunk()
+            if buffer or not parts:
+                spill_chunk()
+        finally:
+            workbook.close()
+
+        schema = pa.schema([(col, pa.string() if col in text_cols else pa.float64()) for col in header])
+        with pq.ParquetWriter(tmp, schema) as writer:
+            for path in parts:
+                chunk = _excel_chunk(pd.read_pickle(path), text_cols)
+                writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+                os.remove(path)
+    os.replace(tmp, dst)
+    return dst
+
+
+def read_table(path, columns=None):
+    """
+    중간 결과를 읽는다. .xlsx 경로를 주면 옆의 .parquet 를 읽고,
+    .parquet 가 없으면 excel_to_table 로 한 번 만든다.
+
+    Args:
+        path (str): .parquet 또는 예전 .xlsx 경로
+        columns (list): 읽을 컬럼 (None 이면 전체)
+
+    Returns:
+        pd.DataFrame: 데이터프레임
+    """
+    table = columnar_path(path)
+    if not os.path.exists(table):
+        excel = os.path.splitext(path)[0] + ".xlsx"
+        if not os.path.exists(excel):
+            raise FileNotFoundError(f"{table} 도 {excel} 도 없습니다.")
+        excel_to_table(excel, table)
+    return pd.read_parquet(table, columns=columns)
@@ -0,0 +1,95 @@
+# 여러 타깃 LightGBM 교차 검증 공통 파일
+# src/common/crossval.py
+#
+# 성능 숫자는 train_test_split 한 번(60/40)으로만 쟀다. CVDSTRK3, CHCKIDNY 처럼 양성이 드문
+# 타깃은 어느 행이 평가로 가느냐에 따라 숫자가 크게 흔들린다.
+# 여기서는 타깃 값 조합으로 층화한 k-fold 로 타깃별 점수를 폴드마다 재서 평균 ± 표준편차로 모은다.
+#   - binning 한 Dataset 은 한 번만 만들고(.bin 캐시도 씀) 폴드는 그 subset (행 위치만) 이다.
+#     데이터프레임/행렬을 폴드마다 자르거나 다시 binning 하지 않는다.
+#   - 평가 폴드 점수도 subset 으로 LightGBM 이 잰다 (원본 행을 꺼내 예측하지 않음).
+#     점수는 트리마다 더해두기만 하고 지표는 마지막에 한 번 계산한다.
+#   - 폴드는 스레드로 동시에 돈다. 전체 스레드 수(threads)를 동시 폴드 수(parallel)로 나눠서
+#     폴드마다 LightGBM num_threads 로 준다. LightGBM 은 학습 중 GIL 을 놓기 때문에 프로세스를
+#     띄우지 않아도 되고, 읽기 전용 Dataset 하나를 모든 폴드가 같이 쓴다.
+# 트리 수는 params 의 n_estimators 그대로다 (조기 종료 없음).
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import StratifiedKFold
+
+from src.common.multitarget import LGBM_CACHE, MultiTargetLGBM
+from src.common.sample import label_strata
+
+CV_FOLDS = 5
+CV_METRICS = ['auc', 'average_precision', 'binary_logloss']
+
+
+def multilabel_folds(Y, k=CV_FOLDS, seed=42):
+    """
+    타깃 값 조합(층)으로 층화한 k-fold 행 위치 (src/common/sample.py 의 층과 같은 방식).
+    행이 k 개보다 적은 조합은 한 층으로 모은다.
+
+    Args:
+        Y (pd.DataFrame | np.ndarray): (행 수, 타깃 수) 라벨
+        k (int): 폴드 수
+        seed (int): 시드
+
+    Returns:
+        list: 폴드마다 (학습 행 위치, 평가 행 위치) — 정렬된 np.ndarray
+    """
+    Y = np.asarray(Y)
+    strata = label_strata(Y, min_count=k)
+    splitter = StratifiedKFold(n_splits=k, shuffle=True, random_state=seed)
+    return [(np.sort(train), np.sort(valid)) for train, valid in splitter.split(np.zeros(len(Y)), strata)]
+
+
+def cross_validate(params, X, Y, folds=CV_FOLDS, seed=42, threads=None, parallel=None,
+                   categorical_feature='auto', feature_name='auto', sample_weight=None,
+                   dataset_key=None, cache_dir=LGBM_CACHE):
+    """
+    MultiTargetLGBM(**params) 를 k-fold 교차 검증한다.
+
+    Args:
+        params (dict): MultiTargetLGBM 파라미터 (n_jobs, metric 은 여기서 정한다)
+        X (np.ndarray | list): 피처 행렬 (같은 열의 행렬 리스트면 이어 붙인 것처럼, 복사 없이)
+        Y (pd.DataFrame | np.ndarray): (행 수, 타깃 수) 이진 라벨
+        folds (int): 폴드 수
+        seed (int): 폴드 나누기 시드
+        threads (int): 전체 스레드 예산 (None 이면 CPU 수)
+        parallel (int): 동시에 돌릴 폴드 수 (None 이면 min(folds, threads))
+        categorical_feature, feature_name, sample_weight, dataset_key, cache_dir: MultiTargetLGBM.fit 과 같음
+
+    Returns:
+        tuple: (summary, scores)
+            summary (pd.DataFrame): 타깃마다 CV_METRICS 의 폴드 평균/표준편차(_std)
+            scores (pd.DataFrame): 폴드 x 타깃 마다 점수
+    """
+    targets = list(Y.columns) if isinstance(Y, pd.DataFrame) else list(range(np.shape(Y)[1]))
+    Y = np.asarray(Y)
+    threads = threads or os.cpu_count() or 1
+    parallel = max(1, min(parallel or threads, folds, threads))
+    params = dict(params, metric=CV_METRICS, n_jobs=max(1, threads // parallel))
+
+    # binning 은 전체 행으로 한 번만 (모든 폴드가 읽기만 한다)
+    shared = MultiTargetLGBM(**params).dataset(X, Y, sample_weight, categorical_feature, feature_name,
+                                               dataset_key, cache_dir)
+
+    def run_fold(fold):
+        train, valid = fold
+        model = MultiTargetLGBM(**params).fit_dataset(shared, Y, validation=valid, train_rows=train,
+                                                      early_stopping_rounds=None)
+        return [clf.evals_result_['valid_0'] for clf in model.estimators_]
+
+    with ThreadPoolExecutor(max_workers=parallel) as pool:
+        results = list(pool.map(run_fold, multilabel_folds(Y, folds, seed)))
+
+    scores = pd.DataFrame([
+        dict(fold=f, target=target, **{m: results[f][t][m][-1] for m in CV_METRICS})
+        for f in range(len(results)) for t, target in enumerate(targets)
+    ])
+    summary = scores.groupby('target', sort=False)[CV_METRICS].agg(['mean', 'std'])
+    summary.columns = [m if stat == 'mean' else f"{m}_std" for m, stat in summary.columns]
+    return summary, scores
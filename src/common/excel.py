@@ -0,0 +1,102 @@
+# 사람이 보는 Excel 내보내기 공통 파일
+# src/common/excel.py
+#
+# Excel 은 preprocess/ 의 "0526 데이터 컬럼 정리", "0527 데이터 전처리 정리" 같은
+# 작은 요약표를 사람이 볼 때만 쓴다 (중간 결과는 src/common/columnar.py 의 Parquet).
+# openpyxl write-only 모드로 한 행씩 바로 파일에 쓰고, 입력도 Parquet 행 그룹 단위로
+# 읽기 때문에 행 수가 늘어도 최대 메모리는 그대로다.
+
+import math
+
+import pyarrow.parquet as pq
+
+# Excel 시트 한 장의 최대 행 수 (헤더 포함)
+EXCEL_MAX_ROWS = 1_048_576
+EXPORT_BATCH_SIZE = 10_000
+
+
+def _cell(value):
+    # NaN/NA 는 빈 셀로, numpy 숫자는 파이썬 숫자로
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return None
+    if hasattr(value, 'item'):
+        value = value.item()
+    return value
+
+
+def write_excel(rows, path, header=None, sheet_name="Sheet1"):
+    """
+    행을 하나씩 받아 .xlsx 로 흘려 쓴다 (write-only, 메모리 일정).
+
+    Args:
+        rows (iterable): 행(값 목록)들
+        path (str): 저장 경로 (.xlsx)
+        header (list): 첫 행에 쓸 컬럼명 (None 이면 쓰지 않음)
+        sheet_name (str): 시트 이름
+
+    Returns:
+        int: 쓴 데이터 행 수 (헤더 제외)
+    """
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(sheet_name)
+    limit = EXCEL_MAX_ROWS - (header is not None)
+    if header is not None:
+        sheet.append(list(header))
+    count = 0
+    for row in rows:
+        if count == limit:
+            raise ValueError(f"Excel 시트 한 장에는 {limit:,}행까지만 쓸 수 있습니다.")
+        sheet.append([_cell(value) for value in row])
+        count += 1
+    workbook.save(path)
+    return count
+
+
+def iter_table_rows(path, columns=None, batch_size=EXPORT_BATCH_SIZE):
+    """Parquet 파일의 행을 행 그룹 단위로 읽어 하나씩 돌려준다."""
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=batch_size, columns=columns):
+        yield from zip(*(column.to_pylist() for column in batch.columns))
+
+
+def export_table(path, dst, columns=None, sheet_name="Sheet1"):
+    """
+    Parquet 중간 결과(또는 그 일부 컬럼)를 .xlsx 로 내보낸다.
+
+    Args:
+        path (str): Parquet 경로
+        dst (str): 저장 경로 (.xlsx)
+        columns (list): 내보낼 컬럼 (None 이면 전체)
+        sheet_name (str): 시트 이름
+
+    Returns:
+        int: 쓴 데이터 행 수
+    """
+    header = columns or pq.ParquetFile(path).schema_arrow.names
+    return write_excel(iter_table_rows(path, header), dst, header, sheet_name)
+
+
+def _codes_text(top, rows):
+    # "값 = 개수 (비율)" 를 줄바꿈으로 (0526 시트의 '빈도', '비율' 칸과 같은 모양)
+    return "\n".join(f"{value} = {count} ({count / rows:.2%})" for value, count in top or [])
+
+
+def profile_rows(profile):
+    """
+    컬럼 프로파일(src/common/profile.py)을 컬럼 요약표 행으로 바꾼다.
+
+    Args:
+        profile (dict): 프로파일
+
+    Returns:
+        tuple: (헤더, 행 목록) — 컬럼마다 한 행
+    """
+    header = ['컬럼명', '종류', '빈칸', '빈칸 비율', '최솟값', '최댓값', '평균', '서로 다른 값 수', '빈도']
+    rows = max(profile['rows'], 1)
+    out = []
+    for col, stats in profile['columns'].items():
+        out.append([col, stats['kind'], stats['nulls'], round(stats['nulls'] / rows, 4),
+                    stats['min'], stats['max'], stats['mean'], stats['cardinality'],
+                    _codes_text(stats['top'], rows)])
+    return header, out
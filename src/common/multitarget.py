@@ -0,0 +1,389 @@
+# 여러 타깃 LightGBM 학습 공통 파일
+# src/common/multitarget.py
+#
+# MultiOutputClassifier(LGBMClassifier(...)) 는 타깃 5개마다 LGBMClassifier.fit 을 따로 불러서
+# 같은 피처 행렬을 다섯 번 히스토그램으로 나누고(binning), n_jobs=-1 이면 행렬 전체를
+# 작업 프로세스마다 pickle 로 복사한다.
+# 여기서는 lightgbm.Dataset 을 한 번만 만들고(binning 1번), 타깃마다 라벨만 set_label 로
+# 바꿔서 lightgbm.train 을 부른다. 병렬화는 LightGBM 자체 스레드(n_jobs)로 한다.
+# 학습된 부스터는 LGBMClassifier 에 넣어서 estimators_ 로 돌려주므로
+# predict / predict_proba / estimators_[i] (SHAP 등) 는 MultiOutputClassifier 와 똑같이 쓴다.
+# (LGBMClassifier.fit 이 설정하는 속성을 그대로 채운다 — requirements 의 lightgbm 4.6.0 기준)
+#
+# fit(dataset_key=...) 를 주면 binning 한 Dataset 을 LightGBM 바이너리(.bin)로
+# data/.cache/lgbm 에 저장해두고, 다음 실행부터는 읽기만 한다 (binning 을 아예 하지 않음).
+# 파일 이름 = 데이터 키 + binning 에 쓰이는 파라미터(BIN_PARAMS) + 범주형 컬럼.
+# 학습률/트리 수처럼 binning 과 상관없는 파라미터만 바꾸는 탐색/재학습은 같은 파일을 쓴다.
+#
+# fit(validation=..., early_stopping_rounds=...) 를 주면 학습 행 일부(validation_rows)를
+# 검증용으로 떼어 타깃마다 따로 조기 종료하고, 부스터를 가장 좋았던 반복 수까지 잘라서 둔다.
+# 검증/학습 부분은 binning 한 Dataset 의 subset 이라 다시 binning 하지 않는다.
+#
+# update() 는 데이터가 새로 들어올 때 처음부터 다시 학습하지 않고 타깃마다 지금 부스터를 고친다.
+#   - 'continue': 지금 부스터의 예측(raw 점수)을 시작점으로 새 행에 트리를 몇 개 더 학습
+#   - 'refit': 트리 구조(분기)는 그대로 두고 리프 값만 새 행으로 다시 맞춤
+# 새 행도 binning 은 한 번만 하고(refit 은 그 Dataset 을 reference 로) 타깃마다 라벨만 바꾼다.
+
+import json
+import os
+
+import lightgbm as lgb
+import numpy as np
+from lightgbm import LGBMClassifier
+from lightgbm.basic import _ConfigAliases
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import LabelEncoder
+
+from src.common.cache import cache_key
+from src.common.config import DATA_DIR
+from src.common.sample import label_strata
+
+LGBM_CACHE = os.path.join(DATA_DIR, ".cache", "lgbm")
+VALIDATION_SIZE = 0.1
+EARLY_STOPPING_ROUNDS = 50
+UPDATE_MODES = ['continue', 'refit']
+UPDATE_ROUNDS = 50
+REFIT_DECAY_RATE = 0.9
+
+# Dataset 을 만들 때(binning, 피처 사전 필터, 번들링) 쓰이는 파라미터
+BIN_PARAMS = [
+    'max_bin', 'max_bin_by_feature', 'min_data_in_bin', 'bin_construct_sample_cnt',
+    'data_random_seed', 'seed', 'feature_pre_filter', 'min_data_in_leaf', 'use_missing',
+    'zero_as_missing', 'enable_bundle', 'max_conflict_rate', 'is_enable_sparse',
+    'linear_tree', 'forcedbins_filename',
+]
+
+
+def binning_params(params):
+    """
+    파라미터 중 binning 결과를 바꾸는 것만 (별칭은 원래 이름으로).
+
+    Args:
+        params (dict): lightgbm.train 파라미터
+
+    Returns:
+        dict: {파라미터 이름: 값}
+    """
+    out = {}
+    for name in BIN_PARAMS:
+        for alias in _ConfigAliases.get(name):
+            if alias in params:
+                out[name] = params[alias]
+    if out.get('feature_pre_filter') is False:
+        # 피처 사전 필터를 끄면 min_data_in_leaf 는 학습할 때만 쓰여서 같은 Dataset 을 쓸 수 있다
+        out.pop('min_data_in_leaf', None)
+    return out
+
+
+def dataset_cache_path(dataset_key, params, categorical_feature, feature_name, n_rows, cache_dir=LGBM_CACHE):
+    """binning 한 Dataset 바이너리 파일 경로."""
+    key = cache_key(dataset_key, binning_params(params), categorical_feature, feature_name, n_rows, lgb.__version__)
+    return os.path.join(cache_dir, key + ".bin")
+
+
+def _shared_dataset(X, label, weight, categorical_feature, feature_name, params, path):
+    # path 가 있으면 바이너리를 읽고, 없으면 만들어서 저장
+    meta_path = path + ".json" if path else None
+    if path and os.path.exists(path) and os.path.exists(meta_path):
+        train_set = lgb.Dataset(path, params=params, free_raw_data=False)
+        train_set.construct()
+        with open(meta_path, encoding="utf-8") as f:
+            # DataFrame 의 category 컬럼 값 목록 (바이너리에는 없어서 따로 저장)
+            train_set.pandas_categorical = json.load(f)['pandas_categorical']
+        train_set.set_label(label)
+        if weight is not None:
+            train_set.set_weight(weight)
+        return train_set
+
+    train_set = lgb.Dataset(X, label=label, weight=weight, categorical_feature=categorical_feature,
+                            feature_name=feature_name, params=params, free_raw_data=False)
+    train_set.construct()
+    if path:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # 여러 프로세스(검색 작업자 등)가 동시에 만들어도 서로 덮어쓰지 않게 임시 파일은 프로세스마다
+        # .json 도 임시 파일에 다 쓴 다음 바꾼다 (다른 프로세스가 쓰다 만 파일을 읽지 않게)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        train_set.save_binary(tmp)
+        with open(tmp + ".json", "w", encoding="utf-8") as f:
+            json.dump({'pandas_categorical': train_set.pandas_categorical}, f, default=str)
+        os.replace(tmp + ".json", meta_path)
+        os.replace(tmp, path)
+    return train_set
+
+
+def validation_rows(Y, size=VALIDATION_SIZE, random_state=42):
+    """
+    학습 행 중 조기 종료 검증에 쓸 행 위치.
+    모든 타깃이 이 행으로 조기 종료하므로 타깃 값 조합으로 층화한다 (CVDSTRK3, CHCKIDNY 처럼
+    드문 양성의 비율도 검증 행에서 그대로 유지, src/common/sample.py 의 label_strata).
+    검증 행이 2개도 안 나올 만큼 작은 조합은 한 층으로 모은다.
+
+    Args:
+        Y (pd.DataFrame | np.ndarray): (행 수, 타깃 수) 라벨
+        size (float): 검증 비율
+        random_state (int): 시드
+
+    Returns:
+        np.ndarray: 정렬된 검증 행 위치
+    """
+    Y = np.asarray(Y)
+    _, valid = train_test_split(np.arange(len(Y)), test_size=size, random_state=random_state,
+                                stratify=label_strata(Y, min_count=int(np.ceil(2 / size))))
+    return np.sort(valid)
+
+
+def _subset(train_set, rows):
+    # binning 결과를 같이 쓰는 부분 Dataset (free_raw_data: 원본 행렬을 잘라 복사하지 않게)
+    subset = train_set.subset(rows)
+    subset.free_raw_data = True
+    return subset.construct()
+
+
+def _truncated(booster):
+    # 가장 좋았던 반복 수까지만 남긴 부스터 (예측/저장/SHAP 모두 그 트리만 쓴다)
+    best = booster.best_iteration
+    if best <= 0 or best >= booster.current_iteration():
+        return booster
+    truncated = lgb.Booster(model_str=booster.model_to_string(num_iteration=best))
+    truncated.best_iteration = best
+    truncated.best_score = booster.best_score
+    return truncated
+
+
+def _train_then_score(params, train_set, valid_set, num_boost_round):
+    # 조기 종료 없이 검증 점수만 필요할 때: 검증 점수는 트리마다 더해두기만 하고
+    # 지표(AUC 등, 정렬이 필요해서 비쌈)는 마지막에 한 번 잰다 (lightgbm.train 은 반복마다 잰다)
+    booster = lgb.Booster(params, train_set)
+    booster.add_valid(valid_set, 'valid_0')
+    for _ in range(num_boost_round):
+        if booster.update():
+            break
+    scores = {name: value for _, name, value, _ in booster.eval_valid()}
+    booster.best_score = {'valid_0': scores}
+    return booster, {'valid_0': {name: [value] for name, value in scores.items()}}
+
+
+def _fitted_classifier(params, booster, label_encoder, n_features, evals_result=None):
+    # LGBMClassifier.fit 이 끝났을 때와 같은 상태의 분류기
+    clf = LGBMClassifier(**params)
+    clf._le = label_encoder
+    clf._classes = label_encoder.classes_
+    clf._n_classes = len(label_encoder.classes_)
+    clf._class_map = dict(zip(label_encoder.classes_, label_encoder.transform(label_encoder.classes_)))
+    clf._objective = clf.objective or 'binary'
+    clf._Booster = booster
+    clf._n_features = booster.num_feature()
+    clf.n_features_in_ = n_features
+    clf._evals_result = evals_result or {}
+    clf._best_iteration = booster.best_iteration
+    clf._best_score = booster.best_score
+    clf.fitted_ = True
+    return clf
+
+
+def _positive_proba(clf, X):
+    # LGBMClassifier.predict_proba(X)[:, 1] 과 같은 값을 부스터로 바로 구한다.
+    # 분류기의 sklearn 입력 검사를 거치면 부스터의 기본 피처 이름(Column_0 ...) 때문에
+    # numpy 입력마다 "X does not have valid feature names" 경고가 타깃 수만큼 나온다
+    params = {} if clf.n_jobs is None else {'num_threads': clf.n_jobs}
+    return clf.booster_.predict(X, **params)
+
+
+class MultiTargetLGBM:
+    """
+    binning 한 Dataset 하나를 타깃 여러 개가 같이 쓰는 이진 분류기 묶음.
+    MultiOutputClassifier(LGBMClassifier(**params)) 자리에 그대로 쓴다.
+
+    사용 예:
+        model = MultiTargetLGBM(objective='binary', learning_rate=0.05, n_estimators=300)
+        model.fit(X_train, y_train, categorical_feature=encoder.categorical_feature)
+        y_pred = model.predict(X_test)
+
+    Attributes:
+        params (dict): LGBMClassifier 파라미터
+        estimators_ (list): 타깃마다 학습된 LGBMClassifier
+    """
+
+    def __init__(self, **params):
+        if params.get('class_weight') is not None:
+            raise ValueError("MultiTargetLGBM 은 class_weight 를 지원하지 않습니다 (sample_weight 사용).")
+        self.params = params
+        self.estimators_ = []
+
+    def _train_params(self):
+        # LGBMClassifier.fit 이 lightgbm.train 에 넘기는 것과 같은 파라미터
+        clf = LGBMClassifier(**self.params)
+        clf._n_classes = 2
+        params = clf._process_params(stage="fit")
+        metric = params.get('metric')
+        params['metric'] = [m for m in (metric if isinstance(metric, list) else [metric]) if m is not None]
+        return params
+
+    def _encoders(self, Y):
+        encoders = [LabelEncoder().fit(Y[:, i]) for i in range(Y.shape[1])]
+        for le in encoders:
+            if len(le.classes_) != 2:
+                raise ValueError(f"이진 라벨만 지원합니다 (클래스: {le.classes_}).")
+        return encoders
+
+    def fit(self, X, Y, sample_weight=None, categorical_feature='auto', feature_name='auto',
+            dataset_key=None, cache_dir=LGBM_CACHE, validation=None, early_stopping_rounds=EARLY_STOPPING_ROUNDS,
+            train_rows=None):
+        """
+        타깃마다 부스터를 학습한다 (Dataset 은 한 번만 만든다).
+
+        Args:
+            X (np.ndarray | pd.DataFrame): 피처 행렬
+            Y (pd.DataFrame | np.ndarray): (행 수, 타깃 수) 이진 라벨
+            sample_weight (np.ndarray): 행 가중치 (모든 타깃에 같이 적용)
+            categorical_feature: LGBMClassifier.fit 과 같음
+            feature_name: LGBMClassifier.fit 과 같음
+            dataset_key (str): X 를 가리키는 키 (데이터 지문 등). 주면 binning 한 Dataset 을
+                바이너리로 저장해두고 다시 쓴다. X 가 바뀌면 키도 바뀌어야 한다
+            cache_dir (str): 바이너리 저장 폴더
+            validation (np.ndarray): 조기 종료 검증에 쓸 X 의 행 위치 (validation_rows).
+                주면 나머지 행으로 학습하고 타깃마다 가장 좋았던 반복 수까지 자른다
+            early_stopping_rounds (int): 검증 손실이 이 반복 수 동안 나아지지 않으면 멈춤
+                (None 이면 멈추지 않고 마지막 반복의 검증 점수만 evals_result_ 에 기록)
+            train_rows (np.ndarray): 학습에 쓸 X 의 행 위치 (None 이면 검증 행을 뺀 전부).
+                binning 은 X 전체로 한 것을 그대로 쓴다 (검색의 작은 표본 단계 등)
+
+        Returns:
+            MultiTargetLGBM: self
+        """
+        train_set = self.dataset(X, Y, sample_weight, categorical_feature, feature_name, dataset_key, cache_dir)
+        return self.fit_dataset(train_set, Y, validation, early_stopping_rounds, train_rows)
+
+    def dataset(self, X, Y, sample_weight=None, categorical_feature='auto', feature_name='auto',
+                dataset_key=None, cache_dir=LGBM_CACHE):
+        """
+        fit 이 쓰는 binning 한 Dataset 을 만든다 (인자는 fit 과 같음).
+        교차 검증처럼 같은 X 로 여러 번 학습할 때 한 번만 만들어서 fit_dataset 에 넘긴다.
+        X 는 같은 열의 np.ndarray 리스트여도 된다 (행 방향으로 이어 붙인 것처럼, 복사 없이).
+
+        Returns:
+            lightgbm.Dataset: 만든(construct) Dataset
+        """
+        Y = np.asarray(Y)
+        params = self._train_params()
+        path = None
+        if dataset_key is not None:
+            path = dataset_cache_path(dataset_key, params, categorical_feature, feature_name, len(Y), cache_dir)
+        return _shared_dataset(X, self._encoders(Y)[0].transform(Y[:, 0]), sample_weight,
+                               categorical_feature, feature_name, params, path)
+
+    def fit_dataset(self, train_set, Y, validation=None, early_stopping_rounds=EARLY_STOPPING_ROUNDS,
+                    train_rows=None):
+        """
+        dataset() 으로 만든 Dataset 으로 타깃마다 부스터를 학습한다 (validation / train_rows 는 fit 과 같음).
+        train_rows 나 validation 을 주면 train_set 의 subset 만 바꾸므로, train_set 하나를
+        여러 스레드의 fit_dataset 이 같이 써도 된다 (src/common/crossval.py).
+
+        Returns:
+            MultiTargetLGBM: self
+        """
+        Y = np.asarray(Y)
+        params = self._train_params()
+        encoders = self._encoders(Y)
+        n_features = train_set.num_feature()
+
+        # subset 은 행 위치를 정렬해서 쓰므로 라벨도 정렬한 순서로 넣는다
+        fit_rows = None if train_rows is None else np.sort(train_rows)
+        valid_set = None
+        if validation is not None:
+            validation = np.sort(validation)
+            valid_set = _subset(train_set, validation)
+            if fit_rows is None:
+                fit_rows = np.setdiff1d(np.arange(len(Y)), validation)
+        if fit_rows is not None:
+            train_set = _subset(train_set, fit_rows)
+
+        self.estimators_ = []
+        for i, le in enumerate(encoders):
+            # binning 결과는 그대로 두고 라벨만 바꾼다
+            label = le.transform(Y[:, i])
+            if valid_set is None:
+                train_set.set_label(label if fit_rows is None else label[fit_rows])
+                booster = lgb.train(params, train_set, num_boost_round=self.params.get('n_estimators', 100))
+                evals_result = None
+            else:
+                train_set.set_label(label[fit_rows])
+                valid_set.set_label(label[validation])
+                if early_stopping_rounds:
+                    evals_result = {}
+                    booster = lgb.train(params, train_set, num_boost_round=self.params.get('n_estimators', 100),
+                                        valid_sets=[valid_set], valid_names=['valid_0'],
+                                        callbacks=[lgb.early_stopping(early_stopping_rounds, verbose=False),
+                                                   lgb.record_evaluation(evals_result)])
+                else:
+                    booster, evals_result = _train_then_score(params, train_set, valid_set,
+                                                              self.params.get('n_estimators', 100))
+            booster.free_dataset()
+            self.estimators_.append(_fitted_classifier(self.params, _truncated(booster), le, n_features,
+                                                       evals_result))
+        del train_set, valid_set
+        return self
+
+    def update(self, X, Y, mode='continue', num_boost_round=UPDATE_ROUNDS, decay_rate=REFIT_DECAY_RATE,
+               sample_weight=None, categorical_feature='auto', feature_name='auto'):
+        """
+        학습된 타깃별 부스터를 새 행으로 고친다 (처음부터 다시 학습하지 않음).
+        X 는 fit 때와 같은 컬럼/코드여야 한다 (같은 encoder 로 변환).
+
+        Args:
+            X (np.ndarray): 새 피처 행렬
+            Y (pd.DataFrame | np.ndarray): (행 수, 타깃 수) 새 이진 라벨 (타깃 순서는 fit 과 같음)
+            mode (str): 'continue' = 지금 부스터에서 이어서 트리 num_boost_round 개를 더 학습,
+                'refit' = 트리 구조는 두고 리프 값만 다시 맞춤
+            num_boost_round (int): 'continue' 에서 더할 트리 수
+            decay_rate (float): 'refit' 에서 리프 값 = decay_rate * 예전 값 + (1 - decay_rate) * 새 값
+            sample_weight (np.ndarray): 행 가중치
+            categorical_feature, feature_name: fit 과 같음
+
+        Returns:
+            MultiTargetLGBM: self
+        """
+        if not self.estimators_:
+            raise ValueError("학습된 모델이 없습니다 (fit 먼저).")
+        if mode not in UPDATE_MODES:
+            raise ValueError(f"mode 는 {UPDATE_MODES} 중 하나여야 합니다: {mode}")
+        Y = np.asarray(Y)
+        params = self._train_params()
+        # 라벨 인코더는 처음 학습한 것을 그대로 쓴다 (클래스 순서가 바뀌지 않게)
+        encoders = [clf._le for clf in self.estimators_]
+        n_features = self.estimators_[0].n_features_in_
+
+        # 새 행 binning 은 한 번만. 'continue' 는 raw 점수 시작점(init_score)을 만들 때 원본 행이 필요해서
+        # 캐시(.bin) 없이 원본을 들고 있는 Dataset 을 쓴다
+        train_set = _shared_dataset(X, encoders[0].transform(Y[:, 0]), sample_weight, categorical_feature,
+                                    feature_name, params, None)
+        estimators = []
+        for i, (clf, le) in enumerate(zip(self.estimators_, encoders)):
+            label = le.transform(Y[:, i])
+            if mode == 'continue':
+                # init_model: 타깃마다 Dataset 의 시작 점수를 그 타깃 부스터의 예측으로 바꾸고 이어서 학습
+                train_set.set_label(label)
+                booster = lgb.train(params, train_set, num_boost_round=num_boost_round, init_model=clf.booster_)
+                booster.free_dataset()
+            else:
+                # reference: 새 행을 위 Dataset 의 bin 경계로 넣는다 (타깃마다 다시 binning 하지 않음)
+                booster = clf.booster_.refit(X, label, decay_rate=decay_rate, reference=train_set,
+                                             weight=sample_weight, categorical_feature=categorical_feature,
+                                             feature_name=feature_name)
+            estimators.append(_fitted_classifier(self.params, booster, le, n_features))
+        self.estimators_ = estimators
+        del train_set
+        return self
+
+    def predict(self, X):
+        """타깃별 예측 라벨, (행 수, 타깃 수) 배열."""
+        return np.asarray([clf._le.inverse_transform((_positive_proba(clf, X) > 0.5).astype(int))
+                           for clf in self.estimators_]).T
+
+    def predict_proba(self, X):
+        """타깃별 (행 수, 2) 확률 배열의 리스트 (MultiOutputClassifier 와 같은 모양)."""
+        out = []
+        for clf in self.estimators_:
+            p = _positive_proba(clf, X)
+            out.append(np.vstack((1 - p, p)).T)
+        return out
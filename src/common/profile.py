@@ -0,0 +1,249 @@
+# 컬럼 프로파일(메타데이터 사이드카) 공통 파일
+# src/common/profile.py
+#
+# 스크립트마다 따로 하던 전체 스캔을 한 번으로 모은다.
+#   - preprocessVer2.04.py 주석에 손으로 적어둔 컬럼별 null 수
+#   - test.py 의 smoking_history value_counts
+#   - jjjj.py / train_lgbm_optuna(check).py 의 numeric_info (pd.to_numeric 후 min/max/mean)
+# 청크를 한 번씩만 보면서 컬럼마다 null 수, min/max/mean, 서로 다른 값 수(cardinality),
+# 많이 나온 코드(top), 히스토그램을 계산하고, 데이터 파일 옆에
+# "<데이터 파일>.profile.json" 으로 저장한다.
+#   data/BRFSS_2015ver18.parquet → data/BRFSS_2015ver18.parquet.profile.json
+# 사이드카에는 데이터 파일의 크기/수정 시각이 같이 들어 있어서
+# 데이터가 바뀌면 load_profile 은 None 을 돌려주고 ensure_profile 은 다시 만든다.
+#
+# min/max/mean 은 jjjj.py 와 같이 숫자로 바꿀 수 있는 값만으로 계산한다.
+# 값별 개수는 정확하게 세고(히스토그램도 여기서 만든다), 서로 다른 값이
+# MAX_DISTINCT 를 넘는 컬럼만 개수 세기를 멈춘다 (cardinality/top/histogram = None).
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+
+PROFILE_SUFFIX = ".profile.json"
+PROFILE_CHUNKSIZE = 50_000
+TOP_CODES = 10
+HIST_BINS = 20
+MAX_DISTINCT = 100_000
+
+
+def profile_path(path):
+    """데이터 파일의 프로파일 사이드카 경로."""
+    return path + PROFILE_SUFFIX
+
+
+def _source_stat(path):
+    stat = os.stat(path)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+class ColumnProfiler:
+    """
+    청크를 차례로 받아서 컬럼별 통계를 누적한다 (청크는 한 번씩만 본다).
+
+    사용 예:
+        profiler = ColumnProfiler()
+        for chunk in pd.read_csv(path, chunksize=50_000):
+            profiler.update(chunk)
+        profile = profiler.result()
+    """
+
+    def __init__(self):
+        self.rows = 0
+        self.columns = {}
+
+    def _state(self, col):
+        if col not in self.columns:
+            # 앞 청크에 없던 컬럼이면 그 행들은 빈칸으로 센다
+            self.columns[col] = {
+                'nulls': self.rows, 'numeric': 0, 'text': 0,
+                'sum': 0.0, 'min': np.inf, 'max': -np.inf,
+                'counts': pd.Series(dtype=np.int64),
+            }
+        return self.columns[col]
+
+    def update(self, chunk):
+        """
+        청크 하나를 누적한다.
+
+        Args:
+            chunk (pd.DataFrame): 데이터 청크 (청크마다 dtype 이 달라도 된다)
+        """
+        for col in chunk.columns:
+            state = self._state(col)
+            series = chunk[col]
+            missing = series.isna().to_numpy()
+            state['nulls'] += int(missing.sum())
+
+            if is_numeric_dtype(series.dtype) and not is_bool_dtype(series.dtype):
+                numbers = series.to_numpy(dtype=np.float64, na_value=np.nan)
+                keys = series[~missing].astype(np.float64)
+            else:
+                numbers = pd.to_numeric(series, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+                # 숫자로 읽히는 값은 숫자로, 아니면 문자열로 센다 ("1" 과 1.0 은 같은 값)
+                is_number = ~np.isnan(numbers)
+                keys = pd.Series(np.where(is_number, numbers, series.astype(str)), dtype=object)[~missing]
+                state['text'] += int((~missing & ~is_number).sum())
+
+            valid = numbers[~np.isnan(numbers)]
+            if valid.size:
+                state['numeric'] += int(valid.size)
+                state['sum'] += float(valid.sum())
+                state['min'] = min(state['min'], float(valid.min()))
+                state['max'] = max(state['max'], float(valid.max()))
+
+            if state['counts'] is not None:
+                counts = state['counts'].add(keys.value_counts(), fill_value=0)
+                state['counts'] = counts if len(counts) <= MAX_DISTINCT else None
+        for col in self.columns.keys() - set(chunk.columns):
+            self.columns[col]['nulls'] += len(chunk)
+        self.rows += len(chunk)
+
+    def result(self):
+        """
+        누적한 통계를 JSON 으로 저장할 수 있는 딕셔너리로 만든다.
+
+        Returns:
+            dict: {'rows': 행 수, 'columns': {컬럼명: 컬럼 통계}}
+        """
+        return {
+            'rows': self.rows,
+            'columns': {col: _summarize(state) for col, state in self.columns.items()},
+        }
+
+
+def _plain(value):
+    # JSON 용: 정수인 실수는 int 로
+    if isinstance(value, (float, np.floating)):
+        value = float(value)
+        return int(value) if value.is_integer() else value
+    return str(value)
+
+
+def _summarize(state):
+    numeric = state['numeric']
+    out = {
+        'kind': 'text' if state['text'] else 'numeric',
+        'nulls': state['nulls'],
+        'min': _plain(state['min']) if numeric else None,
+        'max': _plain(state['max']) if numeric else None,
+        'mean': state['sum'] / numeric if numeric else None,
+        'cardinality': None,
+        'top': None,
+        'histogram': None,
+    }
+    counts = state['counts']
+    if counts is None:
+        return out
+
+    counts = counts.astype(np.int64)
+    out['cardinality'] = len(counts)
+    order = sorted(counts.items(), key=lambda item: (-item[1], str(item[0])))
+    out['top'] = [[_plain(value), int(count)] for value, count in order[:TOP_CODES]]
+
+    # 히스토그램은 값별 개수로 만들어서 정확하다 (숫자 값만)
+    numbers = counts[[not isinstance(value, str) for value in counts.index]]
+    if len(numbers):
+        values = numbers.index.to_numpy(dtype=np.float64)
+        hist, edges = np.histogram(values, bins=min(len(numbers), HIST_BINS), weights=numbers.to_numpy())
+        out['histogram'] = {'edges': [_plain(e) for e in edges], 'counts': [int(c) for c in hist]}
+    return out
+
+
+def profile_frame(df):
+    """데이터프레임 하나의 프로파일 (ColumnProfiler.result 와 같은 형식)."""
+    profiler = ColumnProfiler()
+    profiler.update(df)
+    return profiler.result()
+
+
+def profile_file(path, chunksize=PROFILE_CHUNKSIZE):
+    """
+    CSV / Parquet 파일을 청크 단위로 한 번 읽으면서 프로파일을 만든다.
+
+    Args:
+        path (str): 데이터 파일 경로 (.csv 또는 .parquet)
+        chunksize (int): 한 번에 읽을 행 수
+
+    Returns:
+        dict: 프로파일
+    """
+    profiler = ColumnProfiler()
+    if path.endswith(".parquet"):
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+            profiler.update(batch.to_pandas())
+    else:
+        for chunk in pd.read_csv(path, chunksize=chunksize, low_memory=False):
+            profiler.update(chunk)
+    return profiler.result()
+
+
+def write_profile(profile, path, exclude=()):
+    """
+    프로파일을 데이터 파일 옆 사이드카로 저장한다. 데이터 파일을 다 쓴 다음에 부른다.
+
+    Args:
+        profile (dict): 프로파일
+        path (str): 데이터 파일 경로
+        exclude (list): 사이드카에서 뺄 컬럼 (저장소 내부용 컬럼 등)
+
+    Returns:
+        dict: 저장한 프로파일
+    """
+    profile = dict(profile)
+    profile['columns'] = {col: stats for col, stats in profile['columns'].items() if col not in exclude}
+    profile['source'] = _source_stat(path)
+    tmp = profile_path(path) + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(profile, f, ensure_ascii=False, indent=1)
+    os.replace(tmp, profile_path(path))
+    return profile
+
+
+def load_profile(path):
+    """
+    저장된 프로파일을 읽는다.
+
+    Args:
+        path (str): 데이터 파일 경로
+
+    Returns:
+        dict: 프로파일. 사이드카가 없거나 데이터 파일이 그 뒤에 바뀌었으면 None
+    """
+    sidecar = profile_path(path)
+    if not os.path.exists(sidecar) or not os.path.exists(path):
+        return None
+    with open(sidecar, encoding="utf-8") as f:
+        profile = json.load(f)
+    return profile if profile.get('source') == _source_stat(path) else None
+
+
+def ensure_profile(path, exclude=(), chunksize=PROFILE_CHUNKSIZE):
+    """저장된 프로파일을 읽고, 없거나 오래됐으면 파일을 한 번 훑어서 만들고 저장한다."""
+    profile = load_profile(path)
+    if profile is None:
+        profile = write_profile(profile_file(path, chunksize), path, exclude)
+    return profile
+
+
+def numeric_ranges(profile, columns):
+    """
+    사용자 입력 예시용 (최솟값, 최댓값, 평균) — jjjj.py 의 numeric_info 와 같은 형식.
+
+    Args:
+        profile (dict): 프로파일
+        columns (list): 컬럼 목록 (숫자 값이 없는 컬럼은 빠진다)
+
+    Returns:
+        dict: {컬럼명: (int 최솟값, int 최댓값, int 평균)}
+    """
+    info = {}
+    for col in columns:
+        stats = profile['columns'].get(col)
+        if stats and stats['min'] is not None:
+            info[col] = (int(stats['min']), int(stats['max']), int(stats['mean']))
+    return info
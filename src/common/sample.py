@@ -0,0 +1,78 @@
+# 개발용 층화 표본 공통 파일
+# src/common/sample.py
+#
+# 학습/전처리 스크립트를 고칠 때마다 전체(약 44만 행)를 읽고 학습하지 않도록
+# 1% / 10% 표본으로 돌리는 --sample 옵션에서 쓴다.
+# 타깃 값 조합(층)마다 같은 비율로 뽑으므로 드문 양성 비율이 그대로 유지된다.
+# 층마다 뽑는 수 = 행 수 * 비율 의 정수 부분 + 소수 부분 확률로 1개
+# (청크마다 따로 뽑아도 치우침이 없다).
+
+import numpy as np
+
+# --sample 로 고를 수 있는 비율 (%)
+SAMPLE_PERCENTS = [1, 10]
+
+
+def stratified_indices(targets, fraction, seed=42):
+    """
+    타깃 값 조합(층)마다 같은 비율로 행을 뽑는다.
+
+    Args:
+        targets (pd.DataFrame): 층을 나눌 타깃 컬럼 (빈칸도 하나의 값으로 본다)
+        fraction (float): 뽑을 비율 (예: 0.01)
+        seed (int): 시드
+
+    Returns:
+        np.ndarray: 뽑힌 행 위치 (오름차순)
+    """
+    rng = np.random.default_rng(seed)
+    values = targets.to_numpy(dtype=np.float64, na_value=np.nan)
+    _, strata = np.unique(np.nan_to_num(values, nan=np.inf), axis=0, return_inverse=True)
+    strata = strata.ravel()
+
+    counts = np.bincount(strata)
+    quota = counts * fraction
+    quota = np.floor(quota).astype(np.int64) + (rng.random(len(counts)) < quota % 1)
+
+    # 층 안에서는 임의 순서로 앞에서부터 quota 개
+    order = np.lexsort((rng.random(len(strata)), strata))
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    rank = np.arange(len(order)) - starts[strata[order]]
+    return np.sort(order[rank < quota[strata[order]]])
+
+
+def sample_frame(df, fraction, target_cols, seed=42):
+    """
+    데이터프레임의 층화 표본.
+
+    Args:
+        df (pd.DataFrame): 데이터프레임
+        fraction (float): 뽑을 비율
+        target_cols (list): 층을 나눌 타깃 컬럼
+        seed (int): 시드
+
+    Returns:
+        pd.DataFrame: 뽑힌 행 (원래 순서, 원래 인덱스)
+    """
+    return df.iloc[stratified_indices(df[target_cols], fraction, seed)]
+
+
+def label_strata(Y, min_count=2):
+    """
+    타깃 값 조합(층) 번호. 행이 min_count 개보다 적은 조합은 한 층(-1)으로 모은다.
+    train_test_split / StratifiedKFold 의 stratify 로 넘기면 드문 타깃의 양성 비율도 유지된다.
+
+    Args:
+        Y (pd.DataFrame | np.ndarray): (행 수, 타깃 수) 라벨
+        min_count (int): 따로 둘 층의 최소 행 수 (k-fold 면 k)
+
+    Returns:
+        np.ndarray: 행마다 층 번호
+    """
+    _, strata = np.unique(np.asarray(Y), axis=0, return_inverse=True)
+    strata = strata.ravel()
+    strata = np.where(np.bincount(strata)[strata] < min_count, -1, strata)
+    if 0 < np.count_nonzero(strata == -1) < min_count:
+        # 모은 층도 너무 작으면 가장 큰 층에 넣는다
+        strata[strata == -1] = np.bincount(strata[strata >= 0]).argmax()
+    return strata
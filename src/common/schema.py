@@ -0,0 +1,248 @@
+# 컬럼 dtype 스키마 공통 파일
+# src/common/schema.py
+#
+# 전처리 결과 컬럼은 대부분 작은 정수 코드(-1, 1, 2, ...)나 범위가 정해진 횟수인데
+# read_csv 는 이를 int64/float64(셀당 8바이트)로 올린다.
+# 스키마에 컬럼별 최소 dtype(int8/int16/int32/float32)을 정해두고 읽을 때 바로 줄인다.
+#   - 정수 컬럼에 빈칸이 없으면 numpy 정수 (셀당 1~4바이트)
+#   - 빈칸이 있으면 pandas 의 nullable 정수(Int8 등) = 정수 배열 + 결측 마스크
+#   - 실수 컬럼은 float32 (빈칸은 NaN)
+# 정수 컬럼 값이 스키마 dtype 에 들어가지 않으면(범위 초과, 소수 등) 손실 없이
+# 들어가는 가장 작은 dtype 으로 자동으로 넓혀서 값이 바뀌는 일은 없다.
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+
+INT_DTYPES = [np.dtype(np.int8), np.dtype(np.int16), np.dtype(np.int32), np.dtype(np.int64)]
+
+# diabetes_prediction_dataset.csv 스키마 (문자열 컬럼은 그대로 object)
+DIABETES_SCHEMA = {
+    'age': np.float32,
+    'hypertension': np.int8,
+    'heart_disease': np.int8,
+    'bmi': np.float32,
+    'HbA1c_level': np.float32,
+    'blood_glucose_level': np.int16,
+    'diabetes': np.int8,
+}
+
+
+def int_dtype(lo, hi):
+    """[lo, hi] 범위가 들어가는 가장 작은 정수 dtype."""
+    for dtype in INT_DTYPES:
+        info = np.iinfo(dtype)
+        if info.min <= lo and hi <= info.max:
+            return dtype
+    return np.dtype(np.float64)
+
+
+def _fit_dtype(values, dtype):
+    """
+    값(float64, NaN=빈칸)을 담을 dtype 을 고른다.
+    정수 스키마는 값이 들어가면 그대로, 아니면 손실 없이 들어가는 가장 작은 dtype.
+    실수 스키마는 그대로 float32 (트리 모델은 어차피 float32 로 학습한다).
+    """
+    valid = values[~np.isnan(values)]
+    if valid.size == 0 or dtype.kind == 'f':
+        return dtype
+    if np.all(valid == np.round(valid)):
+        fit = int_dtype(valid.min(), valid.max())
+        return dtype if fit.itemsize <= dtype.itemsize else fit
+    if np.all(valid.astype(np.float32) == valid):
+        return np.dtype(np.float32)
+    return np.dtype(np.float64)
+
+
+def compact_column(series, dtype):
+    """
+    컬럼 하나를 스키마 dtype 으로 줄인다 (값은 그대로).
+
+    Args:
+        series (pd.Series): 숫자 컬럼
+        dtype: 스키마 dtype (np.int8, np.float32 ...)
+
+    Returns:
+        pd.Series: 줄인 컬럼. 빈칸이 있는 정수 컬럼은 nullable 정수(Int8 등)
+    """
+    if not is_numeric_dtype(series.dtype) or is_bool_dtype(series.dtype):
+        return series
+    values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    dtype = _fit_dtype(values, np.dtype(dtype))
+    if dtype.kind == 'f':
+        return pd.Series(values.astype(dtype), index=series.index, name=series.name)
+
+    mask = np.isnan(values)
+    data = np.where(mask, 0, values).astype(dtype)
+    if mask.any():
+        data = pd.arrays.IntegerArray(data, mask)
+    return pd.Series(data, index=series.index, name=series.name)
+
+
+def compact_frame(df, schema):
+    """
+    데이터프레임의 스키마에 있는 컬럼을 전부 줄인다 (스키마에 없는 컬럼은 그대로).
+
+    Args:
+        df (pd.DataFrame): 데이터프레임
+        schema (dict): {컬럼명: dtype}
+
+    Returns:
+        pd.DataFrame: 같은 값, 작은 dtype 의 데이터프레임
+    """
+    columns = {
+        col: compact_column(df[col], schema[col]) if col in schema else df[col]
+        for col in df.columns
+    }
+    return pd.DataFrame(columns, index=df.index)
+
+
+class CompactMatrix:
+    """
+    컬럼별 작은 dtype 배열 + 결측 비트맵(셀당 1비트)으로 들고 있는 설문 행렬.
+    pandas nullable 정수는 결측 마스크가 셀당 1바이트라 int8 컬럼도 2바이트를 쓰지만,
+    여기서는 int8 컬럼이 셀당 약 1.1바이트다.
+
+    LightGBM 에는 to_float32() 결과(또는 np.asarray(matrix))를 바로 넘기고,
+    pandas 가 필요하면 to_frame() 으로 꺼낸다. matrix[col] / matrix[[col, ...]] 은 데이터프레임처럼
+    컬럼을 꺼내므로 src/brfss/handoff.py 의 prepare_training 에 데이터프레임 대신 넘길 수 있다
+    (load_training 은 저장소를 load_brfss_matrix 로 읽어서 이렇게 학습 행렬을 만든다).
+
+    사용 예:
+        matrix = CompactMatrix.from_frame(X, BRFSS_SCHEMA)
+        model.fit(matrix.to_float32(), y)
+    """
+
+    def __init__(self, columns, values, nulls, n_rows, index=None):
+        self.feature_names = list(columns)
+        self.values = values    # {컬럼명: np.ndarray}
+        self.nulls = nulls      # {컬럼명: np.packbits 결과} (결측 없는 컬럼은 없음)
+        self.n_rows = n_rows
+        self.index = index
+
+    @classmethod
+    def from_frame(cls, df, schema):
+        """
+        데이터프레임을 스키마 dtype 으로 줄여서 만든다.
+
+        Args:
+            df (pd.DataFrame): 숫자 컬럼만 있는 데이터프레임
+            schema (dict): {컬럼명: dtype} (없는 컬럼은 float32)
+
+        Returns:
+            CompactMatrix: 압축 행렬
+        """
+        columns = ((col, df[col].to_numpy(dtype=np.float64, na_value=np.nan)) for col in df.columns)
+        return cls.from_columns(columns, schema, df.index)
+
+    @classmethod
+    def from_columns(cls, columns, schema, index):
+        """
+        (컬럼명, float64 배열) 을 하나씩 받아서 줄인다 (생성기로 주면 넓은 배열은 한 번에 하나만 있다).
+
+        Args:
+            columns (iterable): (컬럼명, 빈칸이 NaN 인 float64 배열) 들
+            schema (dict): {컬럼명: dtype} (없는 컬럼은 float32)
+            index (pd.Index): 행 인덱스 (행 수도 여기서 정한다)
+
+        Returns:
+            CompactMatrix: 압축 행렬
+        """
+        names, values, nulls = [], {}, {}
+        for col, raw in columns:
+            names.append(col)
+            dtype = _fit_dtype(raw, np.dtype(schema.get(col, np.float32)))
+            if dtype.kind == 'f':
+                values[col] = raw.astype(dtype)
+                continue
+            mask = np.isnan(raw)
+            values[col] = np.where(mask, 0, raw).astype(dtype)
+            if mask.any():
+                nulls[col] = np.packbits(mask)
+        return cls(names, values, nulls, len(index), index)
+
+    @property
+    def shape(self):
+        return self.n_rows, len(self.feature_names)
+
+    @property
+    def nbytes(self):
+        return sum(v.nbytes for v in self.values.values()) + sum(m.nbytes for m in self.nulls.values())
+
+    def null_mask(self, col):
+        """컬럼의 결측 여부 (bool 배열)."""
+        if col in self.nulls:
+            return np.unpackbits(self.nulls[col], count=self.n_rows).astype(bool)
+        if self.values[col].dtype.kind == 'f':
+            return np.isnan(self.values[col])
+        return np.zeros(self.n_rows, dtype=bool)
+
+    def column(self, col):
+        """컬럼 하나를 pandas Series 로 (결측이 있는 정수 컬럼은 Int8 등)."""
+        data = self.values[col]
+        if col in self.nulls:
+            data = pd.arrays.IntegerArray(data, self.null_mask(col))
+        return pd.Series(data, index=self.index, name=col)
+
+    def to_frame(self, columns=None):
+        """compact_frame 과 같은 dtype 의 데이터프레임으로 꺼낸다."""
+        columns = self.feature_names if columns is None else columns
+        return pd.DataFrame({col: self.column(col) for col in columns}, index=self.index)
+
+    def to_float32(self, columns=None):
+        """
+        LightGBM 에 넘길 float32 행렬. 결측은 NaN.
+
+        Args:
+            columns (list): 꺼낼 컬럼 (None 이면 전체)
+
+        Returns:
+            np.ndarray: (행 수, 컬럼 수) float32 행렬
+        """
+        columns = self.feature_names if columns is None else columns
+        out = np.empty((self.n_rows, len(columns)), dtype=np.float32)
+        for i, col in enumerate(columns):
+            out[:, i] = self.values[col]
+            if col in self.nulls:
+                out[self.null_mask(col), i] = np.nan
+        return out
+
+    def __array__(self, dtype=None, copy=None):
+        out = self.to_float32()
+        return out if dtype is None else out.astype(dtype, copy=False)
+
+    def __len__(self):
+        return self.n_rows
+
+    def __getitem__(self, key):
+        # 데이터프레임처럼 matrix['SEX'] (Series) / matrix[['SEX', 'EDUCA']] (DataFrame)
+        if isinstance(key, str):
+            return self.column(key)
+        return self.to_frame(list(key))
+
+
+def to_matrix(df):
+    """
+    LightGBM 에 바로 넘길 float32 행렬(C 순서)로 바꾼다. 빈칸은 NaN.
+    category 컬럼은 LightGBM 이 pandas 입력에서 하는 것과 같이 코드 번호로 넣는다.
+
+    Args:
+        df (pd.DataFrame): compact_frame 결과
+
+    Returns:
+        np.ndarray: (행 수, 컬럼 수) float32 행렬
+    """
+    out = np.empty((len(df), df.shape[1]), dtype=np.float32)
+    for i, col in enumerate(df.columns):
+        series = df[col]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            codes = series.cat.codes.to_numpy()
+            out[:, i] = np.where(codes < 0, np.nan, codes)
+        else:
+            out[:, i] = series.to_numpy(dtype=np.float32, na_value=np.nan)
+    return out
+
+
+def frame_nbytes(df):
+    """데이터프레임이 실제로 차지하는 메모리(바이트, 인덱스 제외)."""
+    return int(df.memory_usage(index=False, deep=True).sum())
@@ -0,0 +1,67 @@
+# 트리 수별 성능 곡선 공통 파일
+# src/common/staged.py
+#
+# n_estimators 를 정하려고 트리 수를 바꿔가며 다시 학습했다 (100, 200, 300 ... 마다 학습 + 예측).
+# 부스팅 모델의 앞 k 개 트리 예측은 트리별 raw 점수의 누적합이므로, 최대 트리 수로 한 번만
+# 학습하고 step 개 트리씩 predict(start_iteration=..., num_iteration=step, raw_score=True) 로
+# 새 트리의 점수만 더하면 모든 트리 수의 예측이 나온다 (트리마다 한 번씩만 지나감).
+# 이 누적 점수로 타깃마다 트리 수 - 지표(AUC, logloss, 정확도) 곡선을 만든다.
+
+import numpy as np
+import pandas as pd
+from sklearn.metrics import log_loss, roc_auc_score
+
+STAGED_METRICS = ['auc', 'logloss', 'accuracy']
+
+
+def staged_raw_scores(booster, X, step=1):
+    """
+    앞에서부터 step 개 트리씩 늘려가며 누적 raw 점수를 돌려준다.
+
+    Args:
+        booster (lightgbm.Booster): 이진 분류 부스터
+        X (np.ndarray): 피처 행렬
+        step (int): 한 번에 더할 트리 수
+
+    Yields:
+        tuple: (트리 수, 누적 raw 점수 np.ndarray) — 배열은 다음 단계에서 덮어쓰므로 필요하면 복사
+    """
+    n_trees = booster.current_iteration()
+    raw = np.zeros(len(X))
+    for start in range(0, n_trees, step):
+        count = min(step, n_trees - start)
+        raw += booster.predict(X, start_iteration=start, num_iteration=count, raw_score=True)
+        yield start + count, raw
+
+
+def staged_curve(model, X, Y, step=1):
+    """
+    학습된 MultiTargetLGBM 의 타깃별 트리 수 - 지표 곡선.
+
+    Args:
+        model (MultiTargetLGBM): 최대 트리 수로 학습한 모델
+        X (np.ndarray): 평가 피처 행렬
+        Y (pd.DataFrame | np.ndarray): (행 수, 타깃 수) 평가 라벨
+        step (int): 몇 개 트리마다 잴지
+
+    Returns:
+        pd.DataFrame: target, trees, STAGED_METRICS 컬럼 (타깃 x 트리 수 마다 한 행)
+    """
+    targets = list(Y.columns) if isinstance(Y, pd.DataFrame) else list(range(np.shape(Y)[1]))
+    Y = np.asarray(Y)
+    rows = []
+    for i, (target, clf) in enumerate(zip(targets, model.estimators_)):
+        y = clf._le.transform(Y[:, i])
+        for trees, raw in staged_raw_scores(clf.booster_, X, step):
+            # binary 목적함수의 확률 = sigmoid(raw)
+            rows.append(dict(target=target, trees=trees, auc=roc_auc_score(y, raw),
+                             logloss=log_loss(y, 1 / (1 + np.exp(-raw)), labels=[0, 1]),
+                             accuracy=float(np.mean((raw > 0) == y))))
+    return pd.DataFrame(rows)
+
+
+def best_tree_counts(curve, metric='auc'):
+    """곡선에서 타깃마다 metric 이 가장 좋은 트리 수와 그 값 (logloss 는 작을수록 좋음)."""
+    pick = 'idxmin' if metric == 'logloss' else 'idxmax'
+    best = curve.loc[getattr(curve.groupby('target', sort=False)[metric], pick)()]
+    return best.set_index('target')[['trees', metric]]
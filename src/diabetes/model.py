@@ -3,23 +3,43 @@
 
 import os
 import joblib
+import numpy as np
+import scipy.sparse as sp
 from sklearn.ensemble import RandomForestClassifier
 
 MODEL_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "diabetes_model.pkl"))
+N_ESTIMATORS = 100
 
-def train_model(X, y):
+def train_model(X, y, sample_weight=None):
     """
     주어진 데이터를 사용해 랜덤 포레스트 모델을 학습한다.
 
     Args:
-        X (pd.DataFrame): 입력 특성 데이터
+        X (pd.DataFrame | csr_matrix): 입력 특성 데이터 (sparse 면 dense 로 바꾸지 않고 학습)
         y (pd.Series): 라벨 데이터 (0 또는 1)
+        sample_weight (np.ndarray): 행 가중치 (collapse_duplicates 로 합친 행 수). None 이면 모두 1
 
     Returns:
         model (RandomForestClassifier): 학습된 모델 객체
     """
-    model = RandomForestClassifier(random_state=42)
-    model.fit(X, y)
+    if sample_weight is None:
+        model = RandomForestClassifier(n_estimators=N_ESTIMATORS, random_state=42)
+        model.fit(X, y)
+        return model
+
+    # 합친 행을 그대로 bootstrap 하면 같은 행 w 개가 트리마다 통째로 들어가거나 빠져서
+    # 원래 데이터로 학습한 숲과 분포가 달라진다. 그래서 bootstrap 을 직접 한다:
+    # 트리마다 원래 행 수만큼 다항분포로 뽑은 횟수 = 원래 행을 복원추출한 횟수를 합친 것
+    if sp.issparse(X):
+        # 트리마다 fit 을 부르므로 RandomForest 가 쓰는 CSC 로 한 번만 바꿔 둔다
+        X = X.tocsc()
+    rng = np.random.default_rng(42)
+    n_rows = int(sample_weight.sum())
+    p = sample_weight / n_rows
+    model = RandomForestClassifier(n_estimators=0, bootstrap=False, warm_start=True, random_state=42)
+    for i in range(N_ESTIMATORS):
+        model.n_estimators = i + 1
+        model.fit(X, y, sample_weight=rng.multinomial(n_rows, p))
     return model
 
 def save_model(model, path=MODEL_PATH):
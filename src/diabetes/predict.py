@@ -3,6 +3,7 @@
 
 import pandas as pd
 from src.diabetes.model import load_model
+from src.diabetes.preprocess import encode_features
 
 def predict_diabetes(user_input: dict) -> float:
     import pandas as pd
@@ -30,14 +31,10 @@ def predict_diabetes(user_input: dict) -> float:
     df = pd.DataFrame([user_input])
     cat_cols = ['gender', 'smoking_history']
 
-    encoded = encoder.transform(df[cat_cols])
-    encoded_df = pd.DataFrame(encoded, columns=encoder.get_feature_names_out(cat_cols))
-    encoded_df.reset_index(drop=True, inplace=True)
-
-    numeric_df = df.drop(columns=cat_cols).reset_index(drop=True)
-    input_df = pd.concat([numeric_df, encoded_df], axis=1)
-    input_df = input_df.reindex(columns=feature_names, fill_value=0)
-
+    # 학습 때와 같은 컬럼 순서 (수치형 → 원핫). sparse 인코더로 학습한 모델이면 CSR 한 행 그대로 예측
+    numeric_cols = feature_names[:len(feature_names) - len(encoder.get_feature_names_out(cat_cols))]
+    df = df.reindex(columns=numeric_cols + cat_cols, fill_value=0)
+    input_df, _ = encode_features(df, encoder, cat_cols)
 
     probability = model.predict_proba(input_df)[0][1]
     return probability
@@ -3,24 +3,87 @@
 
 import pandas as pd
 import numpy as np
+import scipy.sparse as sp
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import OneHotEncoder
 
-def preprocess_diabetes_dataset(csv_path: str):
+from src.common.cache import cache_key, cached_split, file_fingerprint
+from src.common.sample import sample_frame
+from src.common.schema import DIABETES_SCHEMA, compact_frame
+
+def _take(X, rows):
+    return X[rows] if sp.issparse(X) else X.iloc[rows]
+
+
+def make_encoder(sparse=False):
+    """
+    범주형 컬럼용 OneHotEncoder.
+
+    Args:
+        sparse (bool): True 면 CSR 행렬을 내는 인코더 (범주가 많아도 0 이 아닌 칸만 메모리를 쓴다)
+
+    Returns:
+        OneHotEncoder: 학습 전 인코더
+    """
+    # sparse 는 float32 (RandomForest 가 내부에서 쓰는 dtype 이라 학습 때 다시 복사하지 않음)
+    dtype = np.float32 if sparse else np.uint8
+    try:
+        return OneHotEncoder(sparse_output=sparse, handle_unknown='ignore', dtype=dtype)
+    except TypeError:
+        return OneHotEncoder(sparse=sparse, handle_unknown='ignore', dtype=dtype)
+
+
+def encode_features(X, encoder, cat_cols, fit=False):
+    """
+    수치형 컬럼 + 원핫 컬럼으로 된 입력 행렬을 만든다 (학습/예측 공통).
+
+    Args:
+        X (pd.DataFrame): 원래 컬럼의 입력 데이터
+        encoder (OneHotEncoder): make_encoder 결과 (fit=False 면 학습된 것)
+        cat_cols (list): 원핫 인코딩할 컬럼
+        fit (bool): True 면 encoder 를 X 로 학습
+
+    Returns:
+        tuple: (행렬, 컬럼명 목록)
+            - sparse 인코더면 scipy CSR 행렬 (끝까지 dense 로 바꾸지 않음), 아니면 DataFrame
+    """
+    encoded = encoder.fit_transform(X[cat_cols]) if fit else encoder.transform(X[cat_cols])
+    numeric_X = X.drop(columns=cat_cols).reset_index(drop=True)
+    feature_names = numeric_X.columns.tolist() + encoder.get_feature_names_out(cat_cols).tolist()
+
+    if sp.issparse(encoded):
+        numeric = sp.csr_matrix(numeric_X.to_numpy(dtype=np.float32))
+        return sp.hstack([numeric, encoded], format='csr', dtype=np.float32), feature_names
+
+    encoded_df = pd.DataFrame(encoded, columns=encoder.get_feature_names_out(cat_cols))
+    encoded_df.reset_index(drop=True, inplace=True)
+
+    # 수치형 피처만 남기기
+    return pd.concat([numeric_X, encoded_df], axis=1), feature_names
+
+
+def preprocess_diabetes_dataset(csv_path: str, sample: float = None, sparse: bool = False,
+                                cache_split: bool = False):
     """
     당뇨병 데이터셋을 전처리하여 훈련 및 테스트용 데이터셋으로 분할한다.
 
     Args:
         csv_path (str): 데이터셋 CSV 파일 경로
+        sample (float): 개발용 표본 비율 (%). 주면 diabetes 비율을 유지한 표본만 사용
+        sparse (bool): True 면 X_train / X_test 가 CSR 행렬 (원핫 결과를 dense 로 만들지 않음)
+        cache_split (bool): True 면 분할 위치를 CSV 지문 + 시드로 저장해두고 다시 씀 (src/common/cache.py)
 
     Returns:
         tuple: (X_train, X_test, y_train, y_test)
-            - X_train (DataFrame): 훈련 입력 데이터
-            - X_test (DataFrame): 테스트 입력 데이터
+            - X_train (DataFrame | csr_matrix): 훈련 입력 데이터
+            - X_test (DataFrame | csr_matrix): 테스트 입력 데이터
             - y_train (Series): 훈련 라벨
             - y_test (Series): 테스트 라벨
     """
-    df = pd.read_csv(csv_path)
+    # 컬럼별 작은 dtype (int8/int16/float32) 으로 줄여서 사용
+    df = compact_frame(pd.read_csv(csv_path), DIABETES_SCHEMA)
+    if sample:
+        df = sample_frame(df, sample / 100, ['diabetes']).reset_index(drop=True)
 
     # 흡연 이력 인코딩
     mapping = {
@@ -40,24 +103,57 @@ def preprocess_diabetes_dataset(csv_path: str):
 
     # One-hot 인코딩
     # 🔄 모든 object형 (문자열) 열을 자동 탐지해서 인코딩
-    cat_cols = X.select_dtypes(include='object').columns
+    cat_cols = X.select_dtypes(include='object').columns.tolist()
+    encoder = make_encoder(sparse)
+    X_processed, feature_names = encode_features(X, encoder, cat_cols, fit=True)
 
-    # One-hot 인코딩 수행
-    try:
-        encoder = OneHotEncoder(sparse_output=False, handle_unknown='ignore')
-    except TypeError:
-        encoder = OneHotEncoder(sparse=False, handle_unknown='ignore')
+    def split():
+        return train_test_split(np.arange(len(y)), test_size=0.2, random_state=42)
+
+    if cache_split:
+        fingerprint = cache_key(file_fingerprint(csv_path), sample)
+        train_idx, test_idx = cached_split(fingerprint, len(y), split, seed=42, test_size=0.2)
+    else:
+        train_idx, test_idx = split()
+    # 행 위치로 나누기 (train_test_split(X_processed, y) 와 같은 결과)
+    X_train, X_test = _take(X_processed, train_idx), _take(X_processed, test_idx)
+    y_train, y_test = y.iloc[train_idx], y.iloc[test_idx]
+
+    return X_train, X_test, y_train, y_test, encoder, feature_names
 
-    encoded = encoder.fit_transform(X[cat_cols])
-    encoded_df = pd.DataFrame(encoded, columns=encoder.get_feature_names_out(cat_cols))
-    encoded_df.reset_index(drop=True, inplace=True)
 
-    # 수치형 피처만 남기기
-    numeric_X = X.drop(columns=cat_cols).reset_index(drop=True)
-    X_processed = pd.concat([numeric_X, encoded_df], axis=1)
 
-    X_train, X_test, y_train, y_test = train_test_split(
-    X_processed, y, test_size=0.2, random_state=42)
+def collapse_duplicates(X, y):
+    """
+    피처와 라벨이 모두 같은 행을 한 행으로 합치고, 합친 행 수를 sample_weight 로 돌려준다.
+    (피처 8개가 모두 낮은 카디널리티라 같은 행이 많다. 가중치 w 인 한 행은
+    같은 행 w 개와 같은 분할 통계를 만든다)
+
+    Args:
+        X (pd.DataFrame | csr_matrix): 입력 데이터 (preprocess_diabetes_dataset 의 X_train 등)
+        y (pd.Series): 라벨
 
-    return X_train, X_test, y_train, y_test, encoder, X_processed.columns.tolist()
+    Returns:
+        tuple: (X_unique, y_unique, sample_weight)
+            - X_unique (DataFrame | csr_matrix): 처음 나온 행만 남긴 입력 데이터 (DataFrame 은 원래 인덱스)
+            - y_unique (Series): 라벨
+            - sample_weight (np.ndarray): 행마다 합친 행 수 (int64)
+    """
+    if sp.issparse(X):
+        # CSR 은 행마다 (0 이 아닌 칸 위치, 값) 바이트 + 라벨을 키로 (dense 로 바꾸지 않음)
+        X = X.tocsr()
+        labels = y.to_numpy()
+        keys = [X.indices[s:e].tobytes() + X.data[s:e].tobytes() + labels[i].tobytes()
+                for i, (s, e) in enumerate(zip(X.indptr[:-1], X.indptr[1:]))]
+        # factorize 번호 = 처음 나온 순서
+        groups = pd.factorize(pd.Series(keys))[0]
+        first = np.zeros(len(keys), dtype=bool)
+        first[np.unique(groups, return_index=True)[1]] = True
+        return X[first], y[first], np.bincount(groups).astype(np.int64)
 
+    keys = pd.concat([X, y], axis=1)
+    # sort=False: 그룹 번호 = 처음 나온 순서 = drop_duplicates 가 남기는 순서
+    groups = keys.groupby(list(keys.columns), sort=False, dropna=False).ngroup().to_numpy()
+    first = ~keys.duplicated().to_numpy()
+    weight = np.bincount(groups).astype(np.int64)
+    return X[first], y[first], weight
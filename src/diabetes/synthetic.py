@@ -0,0 +1,59 @@
+# 당뇨병 합성 데이터 생성 파일
+# src/diabetes/synthetic.py
+#
+# diabetes_prediction_dataset.csv 와 같은 컬럼/값 분포의 합성 데이터.
+# (원본 CSV 는 Git LFS 포인터라 벤치마크용으로 쓸 수 없다)
+
+import numpy as np
+import pandas as pd
+
+DIABETES_COLUMNS = [
+    'gender', 'age', 'hypertension', 'heart_disease', 'smoking_history',
+    'bmi', 'HbA1c_level', 'blood_glucose_level', 'diabetes',
+]
+
+GENDERS = {'Female': 0.5855, 'Male': 0.4143, 'Other': 0.0002}
+SMOKING = {'No Info': 0.358, 'never': 0.351, 'former': 0.093, 'current': 0.093,
+           'not current': 0.064, 'ever': 0.041}
+# 원본에 나오는 값 목록 (HbA1c / 혈당은 정해진 값만 있다)
+HBA1C_NORMAL = [3.5, 4.0, 4.5, 4.8, 5.0, 5.7, 5.8, 6.0, 6.1, 6.2]
+HBA1C_DIABETIC = [5.7, 5.8, 6.0, 6.1, 6.2, 6.5, 6.6, 6.8, 7.0, 7.5, 8.0, 8.2, 8.8, 9.0]
+GLUCOSE_NORMAL = [80, 85, 90, 100, 126, 130, 140, 145, 155, 158, 159, 160]
+GLUCOSE_DIABETIC = [126, 130, 140, 145, 155, 159, 160, 200, 220, 240, 260, 280, 300]
+
+
+def synthetic_diabetes(rows, seed=42):
+    """
+    diabetes_prediction_dataset.csv 모양의 합성 데이터프레임.
+
+    Args:
+        rows (int): 행 수
+        seed (int): 시드
+
+    Returns:
+        pd.DataFrame: 원본 CSV 를 read_csv 로 읽은 것과 같은 컬럼/dtype
+    """
+    rng = np.random.default_rng(seed)
+    # 나이: 0.08–80 (어린이는 소수 나이), 나이가 많을수록 질환 비율이 높다
+    age = np.where(rng.random(rows) < 0.05, np.round(rng.uniform(0.08, 2, rows), 2),
+                   np.round(rng.uniform(2, 80, rows)))
+    risk = age / 80
+    hypertension = (rng.random(rows) < 0.15 * risk).astype(np.int64)
+    heart_disease = (rng.random(rows) < 0.08 * risk).astype(np.int64)
+    bmi = np.round(rng.normal(27.3, 6.6, rows).clip(10.01, 95.69), 2)
+    diabetes = (rng.random(rows) < 0.02 + 0.12 * risk + 0.1 * hypertension).astype(np.int64)
+
+    def pick(normal, diabetic):
+        return np.where(diabetes == 1, rng.choice(diabetic, rows), rng.choice(normal, rows))
+
+    return pd.DataFrame({
+        'gender': rng.choice(list(GENDERS), rows, p=list(GENDERS.values())),
+        'age': age,
+        'hypertension': hypertension,
+        'heart_disease': heart_disease,
+        'smoking_history': rng.choice(list(SMOKING), rows, p=list(SMOKING.values())),
+        'bmi': bmi,
+        'HbA1c_level': pick(HBA1C_NORMAL, HBA1C_DIABETIC),
+        'blood_glucose_level': pick(GLUCOSE_NORMAL, GLUCOSE_DIABETIC).astype(np.int64),
+        'diabetes': diabetes,
+    }, columns=DIABETES_COLUMNS)
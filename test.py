@@ -1,5 +1,7 @@
 import pandas as pd
 
+from src.common.profile import ensure_profile
+
 df = pd.read_csv("data/diabetes/diabetes_prediction_dataset.csv")
 
 # 값 확인
@@ -17,8 +19,10 @@ mapping = {
 }
 df['smoking_history'] = df['smoking_history'].map(mapping)
 
-# 재계산
-count_per_label = df['smoking_history'].value_counts().sort_index()
+# 값별 개수는 데이터 옆 프로파일 사이드카에서 읽는다 (src/common/profile.py)
+profile = ensure_profile("data/diabetes/diabetes_prediction_dataset.csv")
+top = profile['columns']['smoking_history']['top']
+count_per_label = pd.Series({mapping[value]: count for value, count in top}, name='count').sort_index()
 missing_count = count_per_label.get(5, 0)
 total = len(df)
 missing_rate = missing_count / total * 100
@@ -1,6 +1,8 @@
-from src.diabetes.preprocess import preprocess_diabetes_dataset
+from src.diabetes.preprocess import collapse_duplicates, preprocess_diabetes_dataset
 from src.diabetes.model import train_model, save_model
+from src.common.sample import SAMPLE_PERCENTS
 from sklearn.metrics import classification_report
+import argparse
 import joblib
 
 def evaluate_model(model, X_test, y_test):
@@ -9,29 +11,45 @@ def evaluate_model(model, X_test, y_test):
     print("\n📊 모델 성능 평가 (Test set):\n")
     print(report)
 
-def main():
+def main(sample=None, collapse=False, sparse=False):
     # 1. 데이터 로드 및 전처리
     data_path = "data/diabetes/diabetes_prediction_dataset.csv"
     
-    # ✅ 6개 리턴값 받기
-    X_train, X_test, y_train, y_test, encoder, feature_names = preprocess_diabetes_dataset(data_path)
+    # ✅ 6개 리턴값 받기 (--sample: diabetes 로 층화한 표본, --sparse: 원핫 결과를 CSR 로 끝까지)
+    # 분할 위치는 data/.cache/matrix 에 저장해두고 다시 실행할 때 그대로 씀
+    X_train, X_test, y_train, y_test, encoder, feature_names = preprocess_diabetes_dataset(
+        data_path, sample=sample, sparse=sparse, cache_split=True)
     print(f"✅ 데이터 로드 완료: {X_train.shape[0] + X_test.shape[0]}개 샘플, {X_train.shape[1]}개 특성")
 
-    # 2. 모델 학습
-    model = train_model(X_train, y_train)
+    # 2. 모델 학습 (--collapse: 같은 행을 합쳐서 가중치로 학습, 평가 데이터는 그대로)
+    weight = None
+    if collapse:
+        n_rows = X_train.shape[0]
+        X_train, y_train, weight = collapse_duplicates(X_train, y_train)
+        print(f"🧮 중복 행 합치기: {n_rows}행 → {X_train.shape[0]}행")
+    model = train_model(X_train, y_train, sample_weight=weight)
     print("🎯 모델 학습 완료")
 
-    # 3. 모델 저장
-    save_model(model)
-    print("💾 모델 저장 완료 (diabetes_model.pkl)")
+    # 3. 모델 저장 (표본으로 학습한 모델은 배포 모델을 덮어쓰지 않음)
+    if sample:
+        print("⚠️ 표본 학습이라 모델/전처리 정보는 저장하지 않음")
+    else:
+        save_model(model)
+        print("💾 모델 저장 완료 (diabetes_model.pkl)")
 
-    # ✅ 4. 전처리 도구 저장
-    joblib.dump(encoder, "encoder.pkl")
-    joblib.dump(feature_names, "feature_names.pkl")
-    print("📦 전처리 정보 저장 완료 (encoder.pkl, feature_names.pkl)")
+        # ✅ 4. 전처리 도구 저장
+        joblib.dump(encoder, "encoder.pkl")
+        joblib.dump(feature_names, "feature_names.pkl")
+        print("📦 전처리 정보 저장 완료 (encoder.pkl, feature_names.pkl)")
 
     # 5. 평가
     evaluate_model(model, X_test, y_test)
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sample", type=float, choices=SAMPLE_PERCENTS, default=None,
+                        help="개발용 층화 표본 비율 (%%)")
+    parser.add_argument("--collapse", action="store_true", help="같은 학습 행을 합쳐 sample_weight 로 학습")
+    parser.add_argument("--sparse", action="store_true", help="원핫 인코딩 결과를 CSR 행렬로 학습/예측")
+    args = parser.parse_args()
+    main(args.sample, args.collapse, args.sparse)
@@ -1,14 +1,22 @@
+import argparse
+
 import pandas as pd
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import OrdinalEncoder
-from sklearn.multioutput import MultiOutputClassifier
-from lightgbm import LGBMClassifier
 from sklearn.metrics import accuracy_score, classification_report
+from src.brfss.store import read_brfss_csv
+from src.common.cache import cache_key, file_fingerprint
+from src.common.multitarget import MultiTargetLGBM, validation_rows
+from src.common.profile import ensure_profile
+from src.common.sample import SAMPLE_PERCENTS
 
 
-def main():
+def main(sample=None, study=None, latency_budget=None):
     # 1) CSV 로드 & NaN/비이진(0,1) 제거
-    df = pd.read_csv('data/BRFSS_2015ver16.csv', low_memory=False)
+    # 컬럼별 작은 dtype 으로 읽기 (src/brfss/schema.py)
+    # --sample 1 / 10: 타깃 5개로 층화한 표본 (처음 한 번만 만들고 캐시)
+    csv_path = 'data/BRFSS_2015ver16.csv'
+    df = read_brfss_csv(csv_path, sample=sample)
     target_cols = ['BPHIGH4', 'CVDCRHD4', 'CVDSTRK3', 'CHCKIDNY', 'DIABETE3']
     df = df.dropna(subset=target_cols)
     for col in target_cols:
@@ -34,9 +42,19 @@ def main():
     # 5) 학습 및 평가
     print(f"훈련 데이터셋 크기: {X_train.shape}")
     print(f"테스트 데이터셋 크기: {X_test.shape}\n")
-    base = LGBMClassifier(objective='binary', random_state=42)
-    model = MultiOutputClassifier(base, n_jobs=-1)
-    model.fit(X_train, y_train)
+    # 타깃 5개가 binning 한 Dataset 하나를 같이 쓴다 (src/common/multitarget.py)
+    params = dict(objective='binary', random_state=42)
+    if study:
+        # --study: 하이퍼파라미터 검색(search_lgbm.py)에서 가장 좋았던 시행의 파라미터
+        from src.brfss.search import best_params
+        params = best_params(study, latency_budget=latency_budget)
+    model = MultiTargetLGBM(**params)
+    # binning 한 Dataset 은 데이터 지문 + 표본 비율로 캐시 (data/.cache/lgbm)
+    # 학습 행의 10% 로 타깃마다 조기 종료하고, 가장 좋았던 반복 수까지 자른다
+    model.fit(X_train, y_train, dataset_key=cache_key(file_fingerprint(csv_path), sample, 'ver16-ordinal'),
+              validation=validation_rows(y_train, random_state=42))
+    for col, clf in zip(target_cols, model.estimators_):
+        print(f"[{col}] 트리 수: {clf.best_iteration_}")
     y_pred = model.predict(X_test)
     print("=== 최종 테스트 성능 ===")
     for idx, col in enumerate(target_cols):
@@ -369,12 +387,14 @@ def main():
             categorical_info[col] = list(encoder.categories_[idx])
 
     # 숫자형 범위/예시 정보
+    # CSV 옆 프로파일 사이드카에서 읽는다 (없으면 한 번 훑어서 만들어 둔다, src/common/profile.py)
+    profile = ensure_profile('data/BRFSS_2015ver16.csv')
     numeric_info = {}
     for col in feature_cols:
         if col not in obj_cols:
-            col_num = pd.to_numeric(df[col], errors='coerce')
-            if col_num.notna().any():
-                numeric_info[col] = (int(col_num.min()), int(col_num.max()), int((col_num.min()+col_num.max())/2))
+            stats = profile['columns'][col]
+            if stats['min'] is not None:
+                numeric_info[col] = (int(stats['min']), int(stats['max']), int((stats['min']+stats['max'])/2))
             else:
                 numeric_info[col] = (None,None,None)
 
@@ -421,4 +441,12 @@ def main():
         print(f"[{col}] 양성 확률: {p:.2f}%")
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sample", type=float, choices=SAMPLE_PERCENTS, default=None,
+                        help="개발용 층화 표본 비율 (%%)")
+    parser.add_argument("--study", default=None,
+                        help="하이퍼파라미터 검색 스터디 이름 (가장 좋았던 파라미터로 학습, search_lgbm.py)")
+    parser.add_argument("--latency-budget", type=float, default=None,
+                        help="다목적 스터디에서 한 행 예측 시간 예산 (ms) 안의 가장 좋은 시행을 고름")
+    args = parser.parse_args()
+    main(args.sample, args.study, args.latency_budget)
\ No newline at end of file
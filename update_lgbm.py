@@ -0,0 +1,67 @@
+import argparse
+import time
+
+import numpy as np
+from sklearn.metrics import roc_auc_score
+
+from src.brfss.handoff import load_rows
+from src.brfss.model import MODEL_PATH, load_model, save_model
+from src.common.multitarget import REFIT_DECAY_RATE, UPDATE_MODES, UPDATE_ROUNDS, validation_rows
+
+#------------------------------------------------
+# 저장된 BRFSS LightGBM 모델(jjjj.py 가 저장)을 새 데이터로 고친다 (처음부터 다시 학습하지 않음)
+#   - --mode continue: 타깃마다 지금 모델의 예측에서 이어서 트리 --rounds 개를 더 학습
+#   - --mode refit: 트리 구조는 그대로 두고 리프 값만 새 데이터로 다시 맞춤
+#     (리프 값 = --decay * 예전 값 + (1 - --decay) * 새 값)
+# 새 원본 CSV 는 저장된 인코더로 학습 때와 같은 코드로 바꾼다.
+# 새 행의 --holdout 비율은 떼어서 고치기 전/후 타깃별 AUC 를 비교한다 (0 이면 전부 학습에 사용).
+# 결과는 --out (기본: 원래 모델 파일을 덮어씀)
+#
+# 실행 (프로젝트 루트에서)
+#   python update_lgbm.py --data data/BRFSS_2016.csv --mode continue --rounds 50
+#   python update_lgbm.py --data data/BRFSS_2016.csv --mode refit --decay 0.9
+#------------------------------------------------
+
+
+def target_aucs(model, X, y):
+    """{타깃 컬럼: AUC}."""
+    return {col: roc_auc_score(y[col], proba[:, 1]) for col, proba in zip(y.columns, model.predict_proba(X))}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--data", required=True, help="새 원본 BRFSS CSV")
+    parser.add_argument("--mode", choices=UPDATE_MODES, default='continue', help="이어서 학습 / 리프 값만 재조정")
+    parser.add_argument("--rounds", type=int, default=UPDATE_ROUNDS, help="continue: 더할 트리 수")
+    parser.add_argument("--decay", type=float, default=REFIT_DECAY_RATE, help="refit: 예전 리프 값을 남길 비율")
+    parser.add_argument("--model", default=MODEL_PATH, help="고칠 모델 파일")
+    parser.add_argument("--out", default=None, help="저장 경로 (기본: --model 덮어쓰기)")
+    parser.add_argument("--holdout", type=float, default=0.2, help="전/후 비교용으로 뗄 새 행 비율 (0 = 없음)")
+    args = parser.parse_args()
+
+    model, encoder = load_model(args.model)
+    X, y = load_rows(args.data, encoder)
+    print(f"새 데이터: {len(y)}행")
+
+    fit_rows = np.arange(len(y))
+    if args.holdout:
+        valid = validation_rows(y, size=args.holdout)
+        fit_rows = np.setdiff1d(fit_rows, valid)
+        before = target_aucs(model, X[valid], y.iloc[valid])
+
+    start = time.time()
+    model.update(X[fit_rows], y.iloc[fit_rows], mode=args.mode, num_boost_round=args.rounds,
+                 decay_rate=args.decay, categorical_feature=encoder.categorical_feature)
+    print(f"{args.mode} 완료: {time.time() - start:.1f}초 ({len(fit_rows)}행)")
+    for col, clf in zip(y.columns, model.estimators_):
+        print(f"  [{col}] 트리 수: {clf.booster_.current_iteration()}")
+
+    if args.holdout:
+        after = target_aucs(model, X[valid], y.iloc[valid])
+        print(f"\n=== 떼어둔 새 행 {len(valid)}개 AUC (전 → 후) ===")
+        for col in y.columns:
+            print(f"  [{col}] {before[col]:.4f} → {after[col]:.4f}")
+
+    out = args.out or args.model
+    save_model(model, encoder, out)
+    print(f"모델 저장 완료 → {out}")